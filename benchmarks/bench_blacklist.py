@@ -0,0 +1,106 @@
+"""
+Benchmark for the compiled `Blacklist` used by `EasyApplyBot.select_jobs` and `apply_to_job`.
+
+Filters synthetic job cards (title, company and full text, as `harvest_job_cards` returns them) through
+both the original filter (every lower-cased blacklist word checked with `in` against the card text) and
+the compiled `Blacklist`, and reports the time each needs and how many cards each rejects.
+
+The counts differ on purpose: the original filter matched inside words ("Intern" in "International")
+and checked company names against the whole card. Before the cards were harvested in one script call,
+the original filter also cost one WebDriver `.text` call per word and card, which is not measured here.
+
+Usage:
+    python benchmarks/bench_blacklist.py --cards 10000 --entries 1000
+"""
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import Blacklist  # noqa: E402
+
+TITLE_WORDS = ["Software", "Engineer", "Senior", "Junior", "Python", "Developer", "Data", "Scientist", "Intern",
+               "International", "Backend", "Frontend", "Lead", "Staff", "Principal", "Manager", "Analyst", "Cloud"]
+COMPANY_SUFFIXES = ["Inc", "LLC", "Corp", "Group", "Labs", "Systems", "Staffing", "Solutions", "Technologies"]
+LOCATIONS = ["Remote", "New York, NY", "Austin, TX", "Berlin, Germany", "London, England, United Kingdom"]
+
+
+def company_name(rng):
+    word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10))).capitalize()
+    return f"{word} {rng.choice(COMPANY_SUFFIXES)}"
+
+
+def make_entries(count, rng):
+    """`count` company and `count` title entries, with a few regex and exact entries among the companies."""
+    companies = [company_name(rng) for _ in range(count)]
+    for index in range(0, count, 50):
+        companies[index] = "=" + companies[index]
+    companies[1::100] = ["re:staff(ing)?\\b"] * len(companies[1::100])
+    # Mostly words that never occur in a title, plus two that do ("Intern" must not match "International")
+    titles = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12))) for _ in range(count - 2)]
+    titles += ["Intern", "Principal"]
+    return companies, titles
+
+
+def make_cards(count, companies, rng):
+    """Job cards; about one in five is from a blacklisted company."""
+    plain = [entry for entry in companies if entry[0] not in "=r"]
+    cards = []
+    for index in range(count):
+        title = " ".join(rng.sample(TITLE_WORDS, rng.randint(2, 4)))
+        company = rng.choice(plain) if rng.random() < 0.2 else company_name(rng)
+        location = rng.choice(LOCATIONS)
+        text = f"{title}\n{title}\n{company}\n{location}\nEasy Apply\n{rng.randint(1, 30)} days ago"
+        cards.append({"id": str(4000000000 + index), "title": title, "company": company, "text": text})
+    return cards
+
+
+def linear_filter(companies, titles):
+    """The card filter exactly as `select_jobs` did it before the blacklists were compiled."""
+    banned_words = [word.lower() for word in companies + titles if word]
+
+    def banned(card):
+        text = card["text"].lower()
+        return next((word for word in banned_words if word in text), None)
+    return banned
+
+
+def timed(function, cards):
+    start = time.perf_counter()
+    results = [function(card) for card in cards]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=10000)
+    parser.add_argument("--entries", type=int, default=1000, help="entries in each of the two lists")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    companies, titles = make_entries(args.entries, rng)
+    cards = make_cards(args.cards, companies, rng)
+
+    compile_start = time.perf_counter()
+    blacklist = Blacklist(companies, titles)
+    compile_time = time.perf_counter() - compile_start
+
+    linear_time, expected = timed(linear_filter(companies, titles), cards)
+    compiled_time, actual = timed(blacklist.card, cards)
+
+    print(f"entries:   {len(companies)} companies, {len(titles)} titles")
+    print(f"cards:     {len(cards)}")
+    print(f"compile:   {compile_time * 1000:.2f} ms")
+    print(f"linear:    {linear_time * 1000:.2f} ms ({linear_time / len(cards) * 1e6:.1f} us/card), "
+          f"{sum(map(bool, expected))} cards rejected")
+    print(f"compiled:  {compiled_time * 1000:.2f} ms ({compiled_time / len(cards) * 1e6:.1f} us/card), "
+          f"{sum(map(bool, actual))} cards rejected")
+    print(f"speedup:   {linear_time / compiled_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
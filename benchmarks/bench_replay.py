@@ -0,0 +1,140 @@
+"""
+End-to-end replay benchmark for `EasyApplyBot` against the offline fixture site (`fixture_server.py`).
+
+Starts the fixture server, runs the real bot (headless Chrome, `pacing: replay`, so no human-like
+delays) against it for a fixed time in a scratch directory, and reports:
+- jobs processed and applications submitted per hour,
+- WebDriver commands per job, and the most frequent commands,
+- seconds and WebDriver commands spent in each stage (search pages, job cards, job pages, forms, ...).
+
+The numbers come from the bot's own instrumentation: the spans of `bot.metrics` and the WebDriver command
+counts of `profile_webdriver` (`bot.profiler`).
+
+Every run sees the same jobs for the same `--seed`, so two commits can be compared number for number.
+
+Usage:
+    python benchmarks/bench_replay.py --seconds 120 --jobs 200 [--rules rules.json] [--pane] [--fast-fill] [--show-browser]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+from fixture_server import FixtureSite, start_server  # noqa: E402
+
+POSITIONS = ["Software Engineer", "Python Developer"]
+LOCATIONS = ["Remote", "New York"]
+# Answers for the questions of the fixture site, used when no rules.json is given
+DEFAULT_RULES = {
+    "rules": [
+        {"conditions": [{"type": "AND", "keywords": ["english"]}], "response": "Native or bilingual"},
+        {"conditions": [{"type": "AND", "keywords": ["sponsorship"]}], "response": "No"},
+        {"conditions": [{"type": "OR", "keywords": ["authorized", "legally"]}], "response": "Yes"},
+        {"conditions": [{"type": "AND", "keywords": ["how did you hear"]}], "response": "LinkedIn"},
+        {"conditions": [{"type": "OR", "keywords": ["how many", "years"]}], "response": "random_choice"},
+        {"conditions": [{"type": "AND", "keywords": ["salary"]}], "response": "dynamic_salary"},
+        {"conditions": [{"type": "AND", "keywords": ["city"]}], "response": "dynamic_city"},
+        {"conditions": [{"type": "AND", "keywords": ["why"]}], "response": "The team and the product."},
+        {"conditions": [{"type": "AND", "keywords": ["do you"]}], "response": "Yes"},
+    ],
+    "default": "Yes",
+}
+PERSON = {
+    "name": {"first_name": "Fixture", "last_name": "User"},
+    "address": {"street": "1 Main St", "city": "New York", "state": "NY", "zip": "10001", "country": "United States"},
+    "social_media": {"github": "", "linkedin": "", "portfolio": "", "phone_number": "5555550100"},
+    "demographic": {"race": "", "gender": "", "disability": "", "veteran": "", "lgbtq": ""},
+    "account": {"username": "fixture@example.com", "password": "fixture"},
+}
+# Spans of `bot.metrics` reported as stages, and the name they are reported under
+STAGES = {
+    "next_jobs_page": "search page", "load_page": "page load", "harvest_job_cards": "job cards",
+    "get_job_page": "job page", "open_job_pane": "job pane", "probe_job_page": "job page state",
+    "send_resume": "application form", "process_questions": "questions", "fill_text_fields": "fast fill",
+    "apply_to_job": "job",
+}
+
+
+def command_count(totals, group="command", name=None):
+    """WebDriver commands in a `CommandProfiler` totals group, all of them or those of one bot method."""
+    return sum(count for key, (count, _) in totals[group].items() if name is None or key.split("/")[0] == name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=int, default=120, help="search time per position/location combo")
+    parser.add_argument("--jobs", type=int, default=200, help="jobs on the fixture site")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rules", help="rules.json to answer with (default: answers for the fixture questions)")
+    parser.add_argument("--pane", action="store_true", help="open jobs in the detail pane (pane_navigation)")
+    parser.add_argument("--fast-fill", action="store_true", help="fill text fields in one call (fast_fill)")
+    parser.add_argument("--show-browser", action="store_true", help="run Chrome with a window")
+    args = parser.parse_args()
+
+    site = FixtureSite(jobs=args.jobs, seed=args.seed)
+    server, base_url = start_server(site)
+
+    rules = DEFAULT_RULES
+    if args.rules:
+        with open(args.rules, 'r', encoding='utf-8') as file:
+            rules = json.load(file)
+    # The bot reads and writes qa.csv, rules.json, output.csv, applications.csv and logs/ in the current directory
+    os.chdir(tempfile.mkdtemp(prefix="bench_replay_"))
+    with open("rules.json", 'w', encoding='utf-8') as file:
+        json.dump(rules, file)
+
+    from main import EasyApplyBot
+
+    EasyApplyBot.MAX_SEARCH_TIME = args.seconds
+
+    start = time.perf_counter()
+    bot = EasyApplyBot(salary=100000, rate=50, person=PERSON, profile_path="", time_filter="",
+                       headless=not args.show_browser, pacing="replay", session_file=None,
+                       job_index="visited_jobs.bin", base_url=base_url, pane_navigation=args.pane,
+                       fast_fill=args.fast_fill, profile_webdriver=True)
+    startup = time.perf_counter() - start
+    login_commands = command_count(bot.profiler.run)
+    try:
+        start = time.perf_counter()
+        bot.start_apply(POSITIONS, LOCATIONS)
+        elapsed = time.perf_counter() - start
+    finally:
+        bot.answer_store.close()
+        bot.browser.quit()
+        server.shutdown()
+
+    spans = bot.metrics.summary()
+    run = bot.profiler.run
+    jobs = spans.get("apply_to_job", {}).get("count", 0)
+    submitted = len(site.stats["submitted"])
+    commands = command_count(run) - login_commands
+    print(f"start-up:              {startup:.1f}s ({login_commands} WebDriver commands to log in)")
+    print(f"run:                   {elapsed:.1f}s, {site.stats['search']} search pages, {site.stats['job']} job pages, "
+          f"{site.stats['pane']} jobs opened in the pane")
+    print(f"jobs processed:        {jobs} ({jobs / elapsed * 3600:.0f}/hour)")
+    print(f"applications sent:     {submitted} ({submitted / elapsed * 3600:.0f}/hour)")
+    print(f"WebDriver commands:    {commands} ({commands / max(jobs, 1):.1f} per job)")
+    print()
+    # Spans nest (a job contains its forms), and commands count for the bot method that sent them
+    print(f"{'stage':<20} {'calls':>6} {'seconds':>9} {'s/call':>8} {'commands':>9}")
+    for span, stage in STAGES.items():
+        if span in spans:
+            calls, seconds = spans[span]["count"], spans[span]["total"]
+            print(f"{stage:<20} {calls:>6} {seconds:>9.2f} {seconds / max(calls, 1):>8.3f} "
+                  f"{command_count(run, 'method', span):>9}")
+    print()
+    print("most frequent WebDriver commands:")
+    for command, (count, _) in sorted(run["command"].items(), key=lambda item: -item[1][0])[:8]:
+        print(f"  {command:<30} {count:>7}")
+    print("bot methods sending the most WebDriver commands:")
+    for method, (count, seconds) in sorted(run["method"].items(), key=lambda item: -item[1][0])[:8]:
+        print(f"  {method:<30} {count:>7} {seconds:>8.2f}s")
+
+if __name__ == '__main__':
+    main()
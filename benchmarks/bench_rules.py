@@ -0,0 +1,98 @@
+"""
+Benchmark for the compiled rule engine used by `EasyApplyBot.ans_question`.
+
+Replays recorded questions (the `Question` column of `qa.csv`) through both the original linear scan
+(`evaluate_conditions` over every rule) and the compiled `RuleEngine`, checks that both return the
+same response for every question, and reports the time each engine needs.
+
+If there are fewer recorded questions than requested, the rest are synthesized from the keywords
+of `rules.json` mixed with filler words, so both matching and non-matching questions are covered.
+
+Usage:
+    python benchmarks/bench_rules.py --rules rules.json --questions qa.csv -n 10000
+"""
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from main import EasyApplyBot, RuleEngine  # noqa: E402
+
+FILLER = ["please", "describe", "the", "years", "of", "with", "team", "position", "company",
+          "current", "remote", "office", "python", "java", "sql", "customer", "manage", "skills"]
+
+
+def linear_response(rules, question):
+    """The rule lookup exactly as `ans_question` did it before the rules were compiled."""
+    answer = None
+    for rule in rules["rules"]:
+        if EasyApplyBot.evaluate_conditions(None, question, rule["conditions"]):
+            return rule["response"]
+        answer = rules["default"]
+    return answer
+
+
+def load_questions(path, count, rules, seed):
+    questions = []
+    if path and Path(path).is_file():
+        with open(path, newline='', encoding='utf-8') as file:
+            for row in csv.DictReader(file):
+                if row.get("Question"):
+                    questions.append(row["Question"].lower().strip())
+
+    rng = random.Random(seed)
+    keywords = [k for rule in rules["rules"] for c in rule["conditions"] for k in c["keywords"]]
+    while len(questions) < count:
+        words = rng.sample(FILLER, rng.randint(3, 8))
+        for _ in range(rng.randint(0, 3)):
+            if keywords:
+                words.insert(rng.randint(0, len(words)), rng.choice(keywords).lower())
+        questions.append(" ".join(words) + "?")
+    return questions[:count]
+
+
+def timed(function, questions):
+    start = time.perf_counter()
+    results = [function(question) for question in questions]
+    return time.perf_counter() - start, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rules", default="rules.json")
+    parser.add_argument("--questions", default="qa.csv")
+    parser.add_argument("-n", "--count", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with open(args.rules, 'r', encoding='utf-8') as file:
+        rules = json.load(file)
+    questions = load_questions(args.questions, args.count, rules, args.seed)
+
+    compile_start = time.perf_counter()
+    engine = RuleEngine(rules)
+    compile_time = time.perf_counter() - compile_start
+
+    linear_time, expected = timed(lambda q: linear_response(rules, q), questions)
+    compiled_time, actual = timed(engine.response, questions)
+
+    mismatches = [(q, e, a) for q, e, a in zip(questions, expected, actual) if e != a]
+    for question, want, got in mismatches[:10]:
+        print(f"MISMATCH {question!r}: linear={want!r} compiled={got!r}")
+
+    print(f"rules:     {len(rules['rules'])}")
+    print(f"questions: {len(questions)}")
+    print(f"compile:   {compile_time * 1000:.2f} ms")
+    print(f"linear:    {linear_time * 1000:.2f} ms ({linear_time / len(questions) * 1e6:.1f} us/question)")
+    print(f"compiled:  {compiled_time * 1000:.2f} ms ({compiled_time / len(questions) * 1e6:.1f} us/question)")
+    print(f"speedup:   {linear_time / compiled_time:.2f}x")
+    print(f"identical: {not mismatches} ({len(mismatches)} mismatches)")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Start-up benchmark for `EasyApplyBot`, without logging into LinkedIn.
+
+Reports the time of every start-up phase:
+- importing `main.py` (BeautifulSoup is no longer imported at start-up),
+- resolving chromedriver, both cold (`webdriver-manager` lookup) and from the pinned cache,
+- launching headless Chrome, loading the job index, `qa.csv` and `rules.json`,
+- and the whole set of phases run one after another versus overlapped on threads, as `__init__` does.
+
+Usage:
+    python benchmarks/bench_startup.py --rules rules.json [--no-browser]
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def import_seconds(statement, cwd):
+    """Time of a fresh interpreter running `statement` in `cwd`, minus the time of an empty interpreter."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])))
+
+    def run(code):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env, check=True, capture_output=True)
+        return time.perf_counter() - start
+    baseline = min(run("pass") for _ in range(3))
+    return min(run(statement) for _ in range(3)) - baseline
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rules", default="rules.json")
+    parser.add_argument("--qa", default="qa.csv")
+    parser.add_argument("--no-browser", action="store_true", help="skip the phases that need Chrome")
+    args = parser.parse_args()
+    args.rules, args.qa = os.path.abspath(args.rules), os.path.abspath(args.qa)
+
+    # Importing main.py sets up logs/ in the working directory, so everything runs in a scratch directory,
+    # with a copy of qa.csv that loading may upgrade
+    scratch = tempfile.mkdtemp()
+    if os.path.exists(args.qa):
+        args.qa = shutil.copy(args.qa, scratch)
+    os.chdir(scratch)
+
+    print(f"import main:           {import_seconds('import main', scratch):.2f}s")
+    print(f"import bs4:            {import_seconds('import bs4', scratch):.2f}s (deferred until first use)")
+
+    from main import AnswerStore, EasyApplyBot, JobIndex, RuleEngine, resolve_chromedriver
+
+    # A bot without __init__, holding just what the start-up phases need
+    bot = EasyApplyBot.__new__(EasyApplyBot)
+    bot.startup_timings = {}
+    bot.headless, bot.block_resources, bot.user_data_dir, bot.profile_path = True, None, None, ""
+    bot.rate = bot.salary = bot.city = bot.zipcode = bot.state = bot.phone_number = ""
+    bot.options = bot.browser_options()
+
+    def load_rules():
+        with open(args.rules, 'r', encoding='utf-8') as file:
+            bot.rules = json.load(file)
+        bot.rule_engine = RuleEngine(bot.rules)
+
+    phases = {
+        "job index": lambda: JobIndex(Path(scratch) / "visited_jobs.bin", sources=[ROOT / "output.csv", ROOT / "applications.csv"]),
+        "qa.csv": lambda: AnswerStore(args.qa).close(),
+        "rules.json": load_rules,
+    }
+    if not args.no_browser:
+        start = time.perf_counter()
+        resolve_chromedriver(refresh=True)
+        print(f"chromedriver (cold):   {time.perf_counter() - start:.2f}s")
+        phases["browser"] = lambda: bot.launch_browser().quit()
+
+    start = time.perf_counter()
+    resolve_chromedriver()
+    print(f"chromedriver (pinned): {time.perf_counter() - start:.3f}s")
+
+    sequential = time.perf_counter()
+    for name, phase in phases.items():
+        bot.timed_phase(name, phase)
+        print(f"{name + ':':<22} {bot.startup_timings[name]:.2f}s")
+    sequential = time.perf_counter() - sequential
+
+    overlapped = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+        for future in [executor.submit(bot.timed_phase, name, phase) for name, phase in phases.items()]:
+            future.result()
+    overlapped = time.perf_counter() - overlapped
+
+    print(f"sequential total:      {sequential:.2f}s")
+    print(f"overlapped total:      {overlapped:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Check that the job queue keeps the outcome of every job when later searches show it again.
+
+Harvests the same job cards twice through the real `EasyApplyBot.select_jobs`, with applications recorded in
+between, and checks that `JobQueue.history()` (what `ComboScheduler` scores the combos with) and `counts()`
+are the same after the second harvest. Runs in a scratch directory without a browser: the only browser call
+of `select_jobs`, dismissing a card, is a no-op here.
+
+Usage:
+    python benchmarks/check_job_queue.py
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def card(job_id, easy_apply=True, applied=False):
+    return {"id": job_id, "title": "Python Developer", "company": "Initech", "easy_apply": easy_apply,
+            "applied": applied, "promoted": False, "text": f"Python Developer\nInitech\n{'Easy Apply' if easy_apply else ''}"}
+
+
+def main():
+    # Importing main.py sets up logs/ in the working directory
+    os.chdir(tempfile.mkdtemp(prefix="check_job_queue_"))
+    from main import Blacklist, EasyApplyBot, JobIndex, JobQueue
+
+    bot = EasyApplyBot.__new__(EasyApplyBot)
+    bot.job_queue = JobQueue("jobs.db")
+    bot.visited_IDs = JobIndex("visited_jobs.bin")
+    bot.banned = Blacklist()
+    bot.dismiss_job_card = lambda jobID: None
+
+    search = ("Python Developer", "Remote")
+    bot.job_queue.plan([search])
+    cards = [card("4100000001"), card("4100000002"), card("4100000003", easy_apply=False)]
+
+    # First search: two jobs selected, one applied to, one failed
+    selected = list(bot.select_jobs(cards, search + (0,)))
+    for job_id, state in zip(selected, ("applied", "failed")):
+        bot.job_queue.set_state([job_id], "applying")
+        bot.job_queue.set_state([job_id], state)
+        bot.visited_IDs.add(job_id)
+    bot.job_queue.search_progress(*search, 25, done=True, seconds=30)
+    before = (bot.job_queue.history(), bot.job_queue.counts())
+
+    # A later search shows the same jobs again, the applied one now marked "Applied" on its card
+    cards[0]["applied"] = True
+    bot.select_jobs(cards, search + (0,))
+    after = (bot.job_queue.history(), bot.job_queue.counts())
+
+    print(f"history before: {before[0]}\nhistory after:  {after[0]}")
+    print(f"counts before:  {before[1]}\ncounts after:   {after[1]}")
+    bot.job_queue.close()
+    if before != after:
+        sys.exit("FAILED: the second harvest changed the recorded outcomes")
+    print("OK: history survives a second harvest of the same cards")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,447 @@
+"""
+Offline stand-in for the LinkedIn pages `EasyApplyBot` works with.
+
+Serves synthetic but deterministic pages with the DOM structure the bot's `self.locator` table expects:
+- `/login` and `/feed/`: a login form with the `username`/`password` fields and a "Sign in" button.
+- `/jobs/search/?keywords=...&location=...&start=N`: 25 job cards per page inside a scrollable list that
+  loads more cards as it is scrolled. Cards can be Easy Apply, already applied or promoted.
+- `/jobs/view/<id>`: a job page with the top card, the description and an Easy Apply, external apply,
+  "already applied" or "no longer accepting applications" state.
+- A detail pane next to the search results: clicking a job card shows the same job there without leaving
+  the page (the content comes from `/api/job/<id>`, like LinkedIn's single-page-app navigation).
+- An Easy Apply modal with several steps: contact info, one or two pages of questions (radio buttons,
+  dropdowns, text inputs, text areas) with validation errors, review and submit.
+- `/api/stats`: counters of the pages served and the applications submitted, as JSON.
+
+Every search (keywords + location) gets its own reproducible set of jobs, so different searches have
+different yields.
+
+Usage:
+    python benchmarks/fixture_server.py --port 8765 --jobs 200
+    # then point the bot at it with `base_url: http://127.0.0.1:8765` in config.yaml
+"""
+import argparse
+import html
+import json
+import random
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+TITLES = ["Full Stack Developer", "Backend Engineer", "Python Developer", "Software Engineer II",
+          "Senior Data Engineer", "DevOps Engineer", "Frontend Developer", "Machine Learning Engineer",
+          "Site Reliability Engineer", "Staff Software Engineer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Health", "Stark Industries", "Wayne Enterprises",
+             "Hooli", "Vandelay Industries", "Wonka Labs", "Soylent Systems"]
+QUESTIONS = [
+    {"kind": "radio", "label": "Are you legally authorized to work in the United States?", "options": ["Yes", "No"]},
+    {"kind": "radio", "label": "Will you now or in the future require sponsorship for employment visa status?",
+     "options": ["Yes", "No"]},
+    {"kind": "radio", "label": "Do you have experience with REST APIs?", "options": ["Yes", "No"]},
+    {"kind": "select", "label": "What is your level of proficiency in English?",
+     "options": ["Select an option", "Native or bilingual", "Professional", "Conversational"]},
+    {"kind": "select", "label": "How did you hear about this job?",
+     "options": ["Select an option", "LinkedIn", "Referral", "Other"]},
+    {"kind": "text", "label": "How many years of work experience do you have with Python?"},
+    {"kind": "text", "label": "What is your desired salary?"},
+    {"kind": "text", "label": "What city do you currently live in?"},
+    {"kind": "textarea", "label": "Why are you interested in this position?"},
+]
+PAGE_SIZE = 25
+
+
+class FixtureSite:
+    """Generates the jobs and pages of the stand-in site from a seed."""
+
+    def __init__(self, jobs=200, seed=0, easy_apply_rate=0.85, applied_rate=0.05, promoted_rate=0.03,
+                 closed_rate=0.03, external_rate=0.05):
+        self.seed = seed
+        self.jobs = {}
+        rng = random.Random(seed)
+        for index in range(jobs):
+            job_id = str(4100000000 + index)
+            roll = rng.random()
+            if roll < closed_rate:
+                state = "closed"
+            elif roll < closed_rate + external_rate:
+                state = "external"
+            elif roll < closed_rate + external_rate + applied_rate:
+                state = "applied"
+            else:
+                state = "easy_apply"
+            questions = rng.sample(range(len(QUESTIONS)), rng.randint(2, 5))
+            self.jobs[job_id] = {
+                "id": job_id,
+                "title": rng.choice(TITLES),
+                "company": rng.choice(COMPANIES),
+                "state": state,
+                "easy_apply_card": state != "external" and rng.random() < easy_apply_rate / (1 - external_rate),
+                "promoted": rng.random() < promoted_rate,
+                # Questions are split over one or two pages of the Easy Apply modal
+                "pages": [questions[:3], questions[3:]] if len(questions) > 3 else [questions],
+                "posted": f"{rng.randint(1, 28)} days ago",
+            }
+        self.stats = {"search": 0, "job": 0, "pane": 0, "login": 0, "submitted": []}
+        self.lock = threading.Lock()
+
+    def count(self, page):
+        with self.lock:
+            self.stats[page] += 1
+
+    def search_results(self, keywords, location):
+        """The jobs found by one search; each (keywords, location) pair has its own reproducible set."""
+        rng = random.Random(zlib.crc32(f"{self.seed}|{keywords}|{location}".encode()))
+        ids = list(self.jobs)
+        return rng.sample(ids, rng.randint(0, len(ids)))
+
+    # ------------------------------------------------------------------ pages
+
+    def login_page(self):
+        return page("LinkedIn Login, Sign in | LinkedIn", """
+            <form onsubmit="return false">
+              <input id="username" name="session_key" type="text">
+              <input id="password" name="session_password" type="password">
+              <button type="submit" onclick="login()">Sign in</button>
+            </form>
+            <script>
+              function login() {
+                document.cookie = "li_at=fixture-session; path=/";
+                setTimeout(() => { location.href = "/feed/"; }, 100);
+              }
+            </script>""")
+
+    def feed_page(self):
+        return page("Feed | LinkedIn", "<main><h1>Home</h1></main>")
+
+    def search_page(self, keywords, location, start):
+        found = self.search_results(keywords, location)
+        cards = []
+        for job_id in found[start:start + PAGE_SIZE]:
+            job = self.jobs[job_id]
+            if job["state"] == "applied":
+                footer = '<li class="job-card-container__footer-job-state">Applied</li>'
+            elif job["promoted"]:
+                footer = "<li>Promoted</li>"
+            else:
+                footer = "<li>Easy Apply</li>" if job["easy_apply_card"] else "<li>Be an early applicant</li>"
+            cards.append({
+                "id": "urn:li:promoted" if job["promoted"] and job["state"] != "applied" else job_id,
+                "title": job["title"], "company": job["company"], "footer": footer,
+            })
+
+        last_page = start + PAGE_SIZE >= len(found)
+        return page(f"{keywords} Jobs in {location} | LinkedIn", f"""
+            <style>
+              #results {{ height: 700px; overflow-y: auto; width: 480px; }}
+              .job-card-container {{ height: 140px; border-bottom: 1px solid #ddd; }}
+            </style>
+            <div class="jobs-search-results-list" id="results">
+              <ul id="list" class="scaffold-layout__list-container"></ul>
+              {'<p class="jobs-search-no-results-banner">No matching jobs found.</p>' if not cards else ''}
+            </div>
+            <div class="jobs-search__job-details--container" id="detail-pane"></div>
+            <div class="jobs-search-pagination">
+              <p class="jobs-search-pagination__page-state">Page {start // PAGE_SIZE + 1} of {max(1, -(-len(found) // PAGE_SIZE))}</p>
+              <button class="jobs-search-pagination__button--next"{' disabled' if last_page else ''}>Next</button>
+            </div>
+            <script>
+              const CARDS = {script_json(cards)};
+              let rendered = 0;
+              const list = document.getElementById("list");
+              // Like LinkedIn, every job of the page has a placeholder up front; the cards are filled in on scroll
+              const items = CARDS.map(card => {{
+                const item = document.createElement("li");
+                item.dataset.occludableJobId = card.id;
+                list.appendChild(item);
+                return item;
+              }});
+              function renderMore(count) {{
+                CARDS.slice(rendered, rendered + count).forEach((card, offset) => {{
+                  const item = items[rendered + offset];
+                  item.innerHTML = `
+                    <div data-job-id="${{card.id}}" class="job-card-container">
+                      <a class="job-card-list__title" href="/jobs/view/${{card.id}}/">${{card.title}}</a>
+                      <div class="artdeco-entity-lockup__subtitle">${{card.company}}</div>
+                      <div><ul>${{card.footer}}</ul></div>
+                      <button aria-label="Dismiss ${{card.title}} job">x</button>
+                    </div>`;
+                  item.querySelector("button").addEventListener("click", () => item.remove());
+                }});
+                rendered = Math.min(CARDS.length, rendered + count);
+              }}
+              renderMore(7);
+              // Clicking a card opens the job in the detail pane, without a page load
+              function setupEasyApply(JOB) {{ {MODAL_SCRIPT} }}
+              list.addEventListener("click", event => {{
+                const link = event.target.closest("a.job-card-list__title");
+                if (!link) return;
+                event.preventDefault();
+                const jobId = link.closest("[data-job-id]").dataset.jobId;
+                history.replaceState(null, "", location.pathname + location.search.replace(/&currentJobId=\\d+/, "") + "&currentJobId=" + jobId);
+                fetch("/api/job/" + jobId).then(response => response.json()).then(detail => {{
+                  document.getElementById("detail-pane").innerHTML = detail.html;
+                  document.title = detail.title;
+                  setupEasyApply(detail.job);
+                }});
+              }});
+              // Like LinkedIn, more cards arrive a moment after the list is scrolled near its end
+              document.getElementById("results").addEventListener("scroll", event => {{
+                const results = event.target;
+                if (results.scrollTop + results.clientHeight >= results.scrollHeight - 100 && rendered < CARDS.length) {{
+                  setTimeout(() => renderMore(6), 200);
+                }}
+              }});
+            </script>""")
+
+    def job_page(self, job_id):
+        detail = self.job_detail(job_id)
+        if detail is None:
+            return None
+        return page(detail["title"], f"""{detail["html"]}
+            <script>
+              const JOB = {script_json(detail["job"])};
+              {MODAL_SCRIPT}
+            </script>""")
+
+    def job_detail(self, job_id):
+        """Title, HTML (top card, description, modal root) and modal data of a job, for its page and the pane."""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        title, company = html.escape(job["title"]), html.escape(job["company"])
+        if job["state"] == "easy_apply":
+            action = (f'<button aria-label="Easy Apply to {title} at {company}" class="jobs-apply-button">'
+                      f'<span>Easy Apply</span></button>')
+        elif job["state"] == "external":
+            action = (f'<button aria-label="Apply to {title} on company website" class="jobs-apply-button">'
+                      f'<span>Apply</span></button>')
+        elif job["state"] == "applied":
+            action = '<div class="post-apply-timeline"><span>You applied on LinkedIn 3 days ago</span></div>'
+        else:
+            action = ('<div class="jobs-details-top-card__apply-error">'
+                      '<span class="artdeco-inline-feedback__message">No longer accepting applications</span></div>')
+
+        modal_job = {"id": job_id, "company": job["company"],
+                     "pages": [[dict(QUESTIONS[q], id=q) for q in questions] for questions in job["pages"]]}
+        return {"title": f"{title} | {company} | LinkedIn", "job": modal_job, "html": f"""
+            <div class="job-details-jobs-unified-top-card__container">
+              <div class="job-details-jobs-unified-top-card__job-title">
+                <h1><a href="/jobs/view/{job_id}/">{title}</a></h1>
+              </div>
+              <div class="job-details-jobs-unified-top-card__company-name"><a href="#">{company}</a></div>
+              <div class="job-details-jobs-unified-top-card__primary-description-container">
+                <span>Remote</span> · <span>{job["posted"]}</span> · <span>42 applicants</span>
+              </div>
+              <div class="jobs-s-apply">{action}</div>
+            </div>
+            <article class="jobs-description__container">
+              <div id="job-details" class="jobs-description__content">
+                <h2>About the job</h2>
+                <p>{company} is hiring a {title}. {"Lorem ipsum dolor sit amet. " * 40}</p>
+              </div>
+            </article>
+            <div id="modal-root"></div>"""}
+
+
+def page(title, body):
+    return (f'<!doctype html><html lang="en"><head><meta charset="utf-8"><title>{title}</title></head>'
+            f'<body>{body}</body></html>')
+
+
+def script_json(value):
+    """JSON that is safe to embed inside a <script> tag."""
+    return json.dumps(value).replace("</", "<\\/")
+
+
+# The Easy Apply modal: contact info -> question pages (validated) -> review -> submit -> "sent"
+MODAL_SCRIPT = """
+  const root = document.getElementById("modal-root");
+  const steps = ["contact", ...JOB.pages.map((_, i) => "questions-" + i), "review", "submit"];
+  let step = 0;
+  const prefix = "urn:li:jobs_applyformcommon_easyApplyFormElement:";
+  const formId = (kind, question) => kind + "-form-component-formElement-urn-li-jobs-applyformcommon-easyApplyFormElement-" + JOB.id + "-" + question.id;
+
+  function fieldHtml(question) {
+    if (question.kind === "radio") {
+      const inputs = question.options.map((option, i) => {
+        const id = "urn:li:fsd_formElement:" + prefix + "(" + JOB.id + "," + question.id + ",multipleChoice)-" + i;
+        return `<div><input type="radio" name="q${question.id}" id="${id}" value="${option}">` +
+               `<label for="${id}">${option}</label></div>`;
+      }).join("");
+      return `<div class="fb-dash-form-element" data-required="radio"><fieldset>` +
+             `<legend><span>${question.label}</span></legend>${inputs}</fieldset></div>`;
+    }
+    if (question.kind === "select") {
+      const id = formId("text-entity-list", question);
+      const options = question.options.map(option => `<option value="${option}">${option}</option>`).join("");
+      return `<div class="fb-dash-form-element" data-required="select"><label for="${id}">${question.label}</label>` +
+             `<select id="${id}" required="">${options}</select></div>`;
+    }
+    if (question.kind === "textarea") {
+      const id = formId("multiline-text", question);
+      return `<div class="fb-dash-form-element" data-required="text"><label for="${id}">${question.label}</label>` +
+             `<textarea id="${id}" required=""></textarea></div>`;
+    }
+    const id = formId("single-line-text", question);
+    return `<div class="fb-dash-form-element" data-required="text"><label for="${id}">${question.label}</label>` +
+           `<input id="${id}" type="text" required=""></div>`;
+  }
+
+  function stepBody(name) {
+    if (name === "contact") {
+      return fieldHtml({kind: "text", id: "phoneNumber-nationalNumber", label: "Mobile phone number"}) +
+             `<p>Email address: fixture@example.com</p>`;
+    }
+    if (name.startsWith("questions-")) {
+      return JOB.pages[Number(name.split("-")[1])].map(fieldHtml).join("");
+    }
+    if (name === "review") return `<h3>Review your application</h3><p>Check your answers before submitting.</p>`;
+    return `<input type="checkbox" id="follow-company-checkbox" checked>` +
+           `<label for="follow-company-checkbox">Follow ${JOB.company} to stay up to date with their page.</label>`;
+  }
+
+  function stepButton(name) {
+    if (name === "submit") return `<button aria-label="Submit application" data-action="submit">Submit application</button>`;
+    if (name === "review") return `<button aria-label="Review your application" data-action="next">Review</button>`;
+    return `<button aria-label="Continue to next step" data-action="next">Next</button>`;
+  }
+
+  function render() {
+    const name = steps[step];
+    const progress = Math.round(step / (steps.length - 1) * 100);
+    root.innerHTML = `
+      <div role="dialog" class="artdeco-modal jobs-easy-apply-modal" aria-labelledby="apply-header"
+           style="position:fixed;top:40px;left:25%;width:50%;max-height:80%;overflow:auto;background:#fff;border:1px solid #999">
+        <h2 id="apply-header">Apply to ${JOB.company}</h2>
+        <button aria-label="Dismiss" data-action="dismiss">x</button>
+        <progress max="100" value="${progress}" aria-label="Your job application progress is at ${progress} percent."></progress>
+        <div class="jobs-easy-apply-content" data-step="${name}">${stepBody(name)}</div>
+        <footer>${stepButton(name)}</footer>
+      </div>`;
+  }
+
+  function validate() {
+    let valid = true;
+    for (const field of root.querySelectorAll(".fb-dash-form-element")) {
+      const kind = field.dataset.required;
+      let ok;
+      if (kind === "radio") ok = !!field.querySelector("input:checked");
+      else if (kind === "select") ok = field.querySelector("select").selectedIndex > 0;
+      else ok = field.querySelector("input, textarea").value.trim() !== "";
+
+      const error = field.querySelector(".artdeco-inline-feedback");
+      if (!ok && !error) {
+        field.insertAdjacentHTML("beforeend", `<div class="artdeco-inline-feedback artdeco-inline-feedback--error">` +
+          `<span class="artdeco-inline-feedback__message">Please enter a valid answer</span></div>`);
+      } else if (ok && error) {
+        error.remove();
+      }
+      valid = valid && ok;
+    }
+    return valid;
+  }
+
+  root.addEventListener("click", event => {
+    const action = event.target.closest("[data-action]");
+    if (!action) return;
+    if (action.dataset.action === "dismiss") { root.innerHTML = ""; return; }
+    if (action.dataset.action === "next") {
+      if (validate()) { step += 1; render(); }
+      return;
+    }
+    if (action.dataset.action === "submit") {
+      fetch("/api/submit?job=" + JOB.id, {method: "POST"});
+      root.innerHTML = `<div role="dialog" class="artdeco-modal jobs-easy-apply-modal">` +
+        `<h2>Your application was sent to ${JOB.company}!</h2>` +
+        `<button aria-label="Dismiss" data-action="dismiss">Done</button></div>`;
+    }
+  });
+
+  const easyApply = document.querySelector("button.jobs-apply-button");
+  if (easyApply && easyApply.innerText.trim() === "Easy Apply") {
+    easyApply.addEventListener("click", () => { step = 0; render(); });
+  }
+"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    site = None
+
+    def log_message(self, format, *args):
+        pass  # Keep the benchmark output readable
+
+    def send(self, status, body, content_type="text/html; charset=utf-8"):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+
+        if url.path.startswith("/login"):
+            self.site.count("login")
+            self.send(200, self.site.login_page())
+        elif url.path.startswith("/feed"):
+            self.send(200, self.site.feed_page())
+        elif url.path == "/robots.txt":
+            self.send(200, "User-agent: *\n", "text/plain")
+        elif url.path.startswith("/jobs/search"):
+            self.site.count("search")
+            start = int(query.get("start", "0") or 0)
+            self.send(200, self.site.search_page(query.get("keywords", ""), query.get("location", ""), start))
+        elif len(parts) >= 3 and parts[:2] == ["jobs", "view"]:
+            self.site.count("job")
+            body = self.site.job_page(parts[2])
+            self.send(200 if body else 404, body or page("Page not found | LinkedIn", "<h1>Page not found</h1>"))
+        elif len(parts) == 3 and parts[:2] == ["api", "job"]:
+            self.site.count("pane")
+            detail = self.site.job_detail(parts[2])
+            self.send(200 if detail else 404, json.dumps(detail), "application/json")
+        elif url.path == "/api/stats":
+            self.send(200, json.dumps(self.site.stats), "application/json")
+        else:
+            self.send(404, page("Page not found | LinkedIn", "<h1>Page not found</h1>"))
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path == "/api/submit":
+            job_id = parse_qs(url.query).get("job", [""])[0]
+            with self.site.lock:
+                self.site.stats["submitted"].append(job_id)
+            self.send(200, "{}", "application/json")
+        else:
+            self.send(404, "{}", "application/json")
+
+
+def start_server(site, host="127.0.0.1", port=0):
+    """Serves `site` on a background thread. Returns the server and its base URL."""
+    handler = type("BoundFixtureHandler", (FixtureHandler,), {"site": site})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server, base_url = start_server(FixtureSite(jobs=args.jobs, seed=args.seed), args.host, args.port)
+    print(f"Serving {args.jobs} fixture jobs on {base_url} (Ctrl-C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
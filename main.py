@@ -1,22 +1,36 @@
+import argparse
+import atexit
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from collections import deque
 import csv
+import difflib
+import functools
 import logging
+import math
+import multiprocessing
+import queue
+import threading
 import traceback
 import os
 import random
 import re
+import sqlite3
+import sys
 import time
 from datetime import datetime, timedelta
 from datetime import date
 from pathlib import Path
 import json
+import hashlib
 import yaml
-import pandas as pd
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException
 from selenium.common.exceptions import StaleElementReferenceException
 from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import SessionNotCreatedException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -26,8 +40,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 
 from selenium.webdriver.chrome.service import Service as ChromeService
-import webdriver_manager.chrome as ChromeDriverManager
-ChromeDriverManager = ChromeDriverManager.ChromeDriverManager
 
 log = logging.getLogger(__name__)  # Create a logger object with the current module's name.
 
@@ -87,11 +99,1320 @@ def setupLogger() -> None:
     log.addHandler(c_handler)
 
 
+def resolve_chromedriver(cache_file=".chromedriver.json", refresh=False):
+    """
+    Returns the path of the chromedriver binary, resolving it with `webdriver-manager` only once.
+
+    **How It Works**:
+    - The resolved path is pinned in `cache_file`. Later starts reuse it without any version lookup or
+      network access, as long as the binary still exists.
+    - `refresh=True` ignores the pin (e.g. after a Chrome update made the pinned driver incompatible).
+    - If the driver cannot be resolved (e.g. offline without a pin), returns None so Selenium falls back
+      to a chromedriver on the PATH or its own Selenium Manager.
+    """
+    cache = Path(cache_file)
+    if not refresh and cache.is_file():
+        try:
+            path = json.loads(cache.read_text(encoding='utf-8')).get("path")
+            if path and Path(path).is_file():
+                return path
+        except Exception as e:
+            log.debug(f"Ignoring unreadable {cache}: {e}")
+
+    try:
+        # Imported here: only needed when the pinned driver is missing
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        cache.write_text(json.dumps({"path": path, "resolved": datetime.now().isoformat()}), encoding='utf-8')
+        return path
+    except Exception as e:
+        log.warning(f"Could not resolve chromedriver ({e}), using the one Selenium finds")
+        return None
+
+
+class RuleEngine:
+    """
+    Compiles the rules from `rules.json` once into an indexed matcher used by `ans_question`.
+
+    **How It Works**:
+    - Every keyword of every condition is loaded into a single Aho-Corasick automaton, so one pass
+      over the question finds all keyword hits at once.
+    - Each keyword points back to the rules that use it. Only rules with at least one hit (or rules
+      without keyword conditions) are checked, in their original order.
+    - Conditions are then evaluated against the set of hits, which gives exactly the same result as
+      the `in` checks in `evaluate_conditions`, including the first-match-wins behaviour.
+
+    **Example**:
+    ```python
+    engine = RuleEngine(json.load(open("rules.json")))
+    engine.response("do you speak english?")  # -> "Yes"
+    ```
+    """
+
+    def __init__(self, rules):
+        self.rules = rules.get("rules", [])
+        self.default = rules.get("default")
+
+        # Automaton tables: transitions, failure links and keyword ids ending at each node
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        keyword_ids = {}
+        self._empty_hits = set()     # Ids of "" keywords, which are in every question
+        self._conditions = []        # Per rule: list of (type, keyword ids)
+        self._always = []            # Rules that are candidates without any keyword hit
+        self._keyword_rules = {}     # Keyword id -> indices of rules using it
+
+        for index, rule in enumerate(self.rules):
+            compiled = []
+            needs_hit = False
+            never = False
+            for condition in rule.get("conditions", []):
+                ids = []
+                for keyword in condition.get("keywords", []):
+                    if keyword not in keyword_ids:
+                        keyword_ids[keyword] = len(keyword_ids)
+                        self._add_keyword(keyword, keyword_ids[keyword])
+                    ids.append(keyword_ids[keyword])
+                compiled.append((condition.get("type"), ids))
+
+                if condition.get("type") == "OR" and not ids:
+                    never = True  # any([]) is False, so this rule can never match
+                elif condition.get("type") in ("AND", "OR") and ids:
+                    needs_hit = True
+                    for keyword_id in ids:
+                        self._keyword_rules.setdefault(keyword_id, []).append(index)
+
+            self._conditions.append(compiled)
+            if not needs_hit and not never:
+                self._always.append(index)
+
+        self._build_failure_links()
+
+    def _add_keyword(self, keyword, keyword_id):
+        """Adds one keyword to the trie of the automaton."""
+        if keyword == "":
+            self._empty_hits.add(keyword_id)
+            return
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = next_node
+        self._out[node].append(keyword_id)
+
+    def _build_failure_links(self):
+        """Computes the failure links breadth first and merges the outputs of suffix nodes."""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def scan(self, question):
+        """Returns the ids of every keyword that occurs in `question`, found in a single pass."""
+        hits = set(self._empty_hits)
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for char in question:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                hits.update(out[node])
+        return hits
+
+    def match(self, question):
+        """Returns the index of the first rule matching `question`, or None if no rule matches."""
+        hits = self.scan(question)
+        candidates = set(self._always)
+        for keyword_id in hits:
+            candidates.update(self._keyword_rules.get(keyword_id, ()))
+
+        for index in sorted(candidates):
+            if self._evaluate(self._conditions[index], hits):
+                return index
+        return None
+
+    def response(self, question):
+        """
+        Returns the raw `response` of the first matching rule. Falls back to the `default` response,
+        or to None when there are no rules at all, just like the original loop in `ans_question`.
+        """
+        index = self.match(question)
+        if index is not None:
+            return self.rules[index]["response"]
+        return self.default if self.rules else None
+
+    @staticmethod
+    def _evaluate(conditions, hits):
+        for condition_type, ids in conditions:
+            if condition_type == "AND":
+                if not all(keyword_id in hits for keyword_id in ids):
+                    return False
+            elif condition_type == "OR":
+                if not any(keyword_id in hits for keyword_id in ids):
+                    return False
+        return True
+
+
+class Blacklist:
+    """
+    Compiles the `blacklist` (companies) and `blackListTitles` (job titles) of `config.yaml` once into a
+    matcher for job cards and job pages.
+
+    **Entries**:
+    - `Acme Corp`: Matches the words `acme corp` anywhere in the field, case-insensitive and on word
+      boundaries only (`Intern` matches "Software Intern" but not "International").
+    - `re:<pattern>`: A regular expression, searched case-insensitive (e.g. `re:\\bsr\\.?\\b`).
+    - `=<name>`: The whole field must be exactly `<name>` (ignoring case and spacing), e.g. `=Meta` to skip
+      Meta without skipping "Metadata Inc".
+
+    **How It Works**:
+    - Per list, all plain entries are merged into one trie-shaped regular expression, so a field is scanned
+      once however long the list is. Regex entries are compiled on their own and searched one by one after
+      it (merging them could break on inline flags such as `(?i)` or on named groups used twice). Exact
+      entries are a set lookup.
+    - Company entries are checked against the card's company line and title entries against its title.
+      When the card has no such line (changed markup), the card's full text is checked instead.
+
+    **Example**:
+    ```python
+    blacklist = Blacklist(["Acme", "re:staffing|recruit", "=Meta"], ["Senior", "Intern"])
+    blacklist.card({"title": "Senior Developer", "company": "Initech", "text": "..."})  # -> "Senior"
+    blacklist.title("Python Developer | Initech | LinkedIn")  # -> None
+    ```
+    """
+
+    REGEX_PREFIX = "re:"
+    EXACT_PREFIX = "="
+
+    def __init__(self, companies=(), titles=()):
+        self._companies = self._compile(companies or ())
+        self._titles = self._compile(titles or ())
+
+    @staticmethod
+    def _normalize(text):
+        """Lower case with single spaces, as entries and fields are compared."""
+        return " ".join(str(text).casefold().split())
+
+    @classmethod
+    def _compile(cls, entries):
+        """Returns `(regex, words, patterns, exact)` for one list: the merged regex of the plain entries and the entries."""
+        words, patterns, exact = {}, [], {}
+        for entry in entries:
+            entry = str(entry).strip() if entry is not None else ""
+            if entry.startswith(cls.REGEX_PREFIX) and entry[len(cls.REGEX_PREFIX):].strip():
+                pattern = entry[len(cls.REGEX_PREFIX):].strip()
+                try:
+                    patterns.append((re.compile(pattern, re.IGNORECASE), entry))
+                except re.error as e:
+                    raise ValueError(f"Invalid blacklist pattern {entry!r}: {e}")
+            elif entry.startswith(cls.EXACT_PREFIX) and cls._normalize(entry[len(cls.EXACT_PREFIX):]):
+                exact[cls._normalize(entry[len(cls.EXACT_PREFIX):])] = entry
+            elif cls._normalize(entry):
+                words.setdefault(cls._normalize(entry), entry)
+
+        alternatives = []
+        # Entries starting with a letter or digit need a word boundary in front; others (".net") do not
+        for starts_word in (True, False):
+            group = [word for word in words if bool(re.match(r"\w", word)) == starts_word]
+            if group:
+                alternatives.append((r"(?<!\w)" if starts_word else "") + cls._trie_pattern(group))
+        regex = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        return (regex, words, patterns, exact)
+
+    @staticmethod
+    def _trie_pattern(words):
+        """
+        One regular expression for a list of literal words, shaped like their trie (`(?:acme|ac(?:e|me))` becomes
+        `ac(?:e|me)`), so matching costs about as much as for a single word. Words ending in a letter or digit
+        get a word boundary at their end.
+        """
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = r"(?!\w)" if re.match(r"\w", word[-1]) else ""
+
+        def build(node):
+            # The end of a word goes last, so a longer word is tried first
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if "" in node:
+                branches.append(node[""])
+            if len(branches) == 1:
+                return branches[0]
+            return "(?:" + "|".join(branches) + ")"
+
+        return build(trie)
+
+    def _match(self, compiled, field, exact=True):
+        """The entry of `compiled` that matches `field`, or None."""
+        regex, words, patterns, exact_names = compiled
+        field = self._normalize(field)
+        if not field:
+            return None
+        if exact and field in exact_names:
+            return exact_names[field]
+        found = regex.search(field) if regex else None
+        if found is not None:
+            return words[found.group(0)]
+        return next((entry for pattern, entry in patterns if pattern.search(field)), None)
+
+    def company(self, text, exact=True):
+        """The company entry matching `text` (a company name), or None. `exact=False` skips the `=` entries."""
+        return self._match(self._companies, text, exact)
+
+    def title(self, text, exact=True):
+        """The title entry matching `text` (a job title), or None. `exact=False` skips the `=` entries."""
+        return self._match(self._titles, text, exact)
+
+    def card(self, card):
+        """
+        The entry that bans a job card (see `EasyApplyBot.harvest_job_cards`), or None. Fields missing from the
+        card are looked up in its full text, without the exact entries.
+        """
+        company, title = card.get("company"), card.get("title")
+        return (self.company(company) if company else self.company(card.get("text", ""), exact=False)) \
+            or (self.title(title) if title else self.title(card.get("text", ""), exact=False))
+
+
+# Scores of the ways an option can match an answer, best first (see `score_options`)
+OPTION_SCORES = {"exact": 1.0, "normalized": 0.95, "number": 0.9, "tokens": 0.85, "fuzzy": 0.8}
+# Similarity every word of the answer needs to some word of an option before the fuzzy score counts
+# (spelling variants like "colour"/"color" pass, different words like "man"/"woman" or "mr"/"mrs" don't)
+FUZZY_WORD_MIN = 0.85
+PLACEHOLDER_OPTION = re.compile(r"^\s*(select an option|select|choose an option|-+)?\s*$", re.IGNORECASE)
+
+
+def _option_tokens(text):
+    return re.findall(r"\w+", str(text).casefold())
+
+
+def score_options(answer, options):
+    """
+    Scores how well every option of a radio group, dropdown or fieldset matches `answer`, in one pass.
+
+    Each option (`{"value": ..., "label": ...}`, as `snapshot_form` returns them) is compared by its label and by
+    its value, keeping the better score:
+    - `exact`: same text. `normalized`: same words, ignoring case, punctuation and spacing ("yes." = "Yes").
+    - `number`: a numeric answer inside a range option ("4" -> "3-5 years", "10" -> "10+").
+    - `tokens`: word overlap (Dice coefficient), or the answer's words all found in the option
+      ("Native" -> "Native or bilingual").
+    - `fuzzy`: `difflib` similarity of the normalized texts, for spelling variants. Only counts when every word
+      of the answer has a close spelling in the option (`FUZZY_WORD_MIN`), so "Man" never picks "Woman".
+    Every measure is weighted with `OPTION_SCORES`, so an exact match always ranks first. Placeholder options
+    ("Select an option") score -1.
+
+    **Returns**:
+    - `list[float]`: One score in [0, 1] per option (-1 for placeholders).
+    """
+    answer = str(answer).strip()
+    answer_tokens = _option_tokens(answer)
+    answer_words = set(answer_tokens)
+    normalized = " ".join(answer_tokens)
+    number = float(answer) if re.fullmatch(r"\d+(\.\d+)?", answer) else None
+
+    def score(text):
+        text = str(text or "").strip()
+        tokens = _option_tokens(text)
+        if text == answer:
+            return OPTION_SCORES["exact"]
+        if tokens and " ".join(tokens) == normalized:
+            return OPTION_SCORES["normalized"]
+        best = 0.0
+        if number is not None:
+            found = re.search(r"(\d+(?:\.\d+)?)\s*(?:-|to|–)\s*(\d+(?:\.\d+)?)|(\d+(?:\.\d+)?)\s*\+", text)
+            if found and (float(found.group(1)) <= number <= float(found.group(2)) if found.group(1)
+                          else number >= float(found.group(3))):
+                best = OPTION_SCORES["number"]
+        words = set(tokens)
+        if words and answer_words:
+            shared = len(words & answer_words)
+            # Dice overlap, or the share of the answer's words found in the option (discounted)
+            overlap = max(2 * shared / (len(words) + len(answer_words)), 0.8 * shared / len(answer_words))
+            best = max(best, OPTION_SCORES["tokens"] * overlap)
+        if normalized and tokens and all(
+                any(difflib.SequenceMatcher(None, word, token).ratio() >= FUZZY_WORD_MIN for token in words)
+                for word in answer_words):
+            best = max(best, OPTION_SCORES["fuzzy"] * difflib.SequenceMatcher(None, normalized, " ".join(tokens)).ratio())
+        return best
+
+    return [-1.0 if PLACEHOLDER_OPTION.match(option.get("label") or "") and PLACEHOLDER_OPTION.match(option.get("value") or "")
+            else max(score(option.get("label")), score(option.get("value")))
+            for option in options]
+
+
+def best_option(answer, options, min_score=0.6):
+    """
+    The index of the option that matches `answer` best (see `score_options`) and its score. The index is None
+    when no option scores at least `min_score`.
+    """
+    scores = score_options(answer, options)
+    if not scores:
+        return None, 0.0
+    index = max(range(len(scores)), key=lambda i: scores[i])  # The first of equally good options
+    return (index if scores[index] >= min_score else None), scores[index]
+
+
+class JobPage:
+    """
+    Lazy model of a job page: title, company, posted date and description of one job, read from the page
+    at most once.
+
+    **How It Works**:
+    - Creating it costs nothing. The first property that is read takes one `execute_script` snapshot of the
+      page: `document.title` plus the HTML of the job top card and the description only, a few KB instead
+      of the several MB of `page_source`.
+    - The snapshot is parsed with BeautifulSoup only when a property needs the HTML, and only once.
+    - Read the first property while the job page is still shown (`apply_to_job` does so before the Easy
+      Apply modal opens); later reads come from the snapshot.
+    - In the detail pane of the search results, `document.title` is still the title of the search. The
+      caller then passes the job's title line read from the pane (`title`), which `browser_title` returns.
+
+    **Example**:
+    ```python
+    page = JobPage(browser, "3912345678")
+    page.title, page.company, page.posted  # -> "Python Developer", "Initech", date(2024, 5, 2)
+    ```
+    """
+
+    TOP_CARD = ".job-details-jobs-unified-top-card__container, .job-details-jobs-unified-top-card__container--two-pane, .jobs-unified-top-card"
+    DESCRIPTION = "#job-details, .jobs-description__content"
+    TITLE = ".job-details-jobs-unified-top-card__job-title h1, .job-details-jobs-unified-top-card__job-title, h1"
+    COMPANY = ".job-details-jobs-unified-top-card__company-name a, .job-details-jobs-unified-top-card__company-name"
+    POSTED = (".job-details-jobs-unified-top-card__primary-description-container, "
+              ".job-details-jobs-unified-top-card__tertiary-description-container")
+    AGE_DAYS = {"minute": 0, "hour": 0, "day": 1, "week": 7, "month": 30, "year": 365}  # "3 weeks ago" -> 21 days
+
+    def __init__(self, browser, job_id, title=None):
+        self.browser = browser
+        self.job_id = str(job_id)
+        self.pane_title = title
+
+    @functools.cached_property
+    def snapshot(self):
+        """`title` (document title), `top_card` and `description` (HTML), read in one call."""
+        script = """
+            const [topCard, description] = arguments;
+            const html = selector => { const element = document.querySelector(selector); return element ? element.outerHTML : ""; };
+            return {
+                title: document.title,
+                top_card: html(topCard),
+                description: html(description)
+            };
+        """
+        try:
+            return self.browser.execute_script(script, self.TOP_CARD, self.DESCRIPTION) or {}
+        except Exception as e:
+            log.debug(f"Could not read job page {self.job_id}: {e}")
+            return {}
+
+    @functools.cached_property
+    def soup(self):
+        from bs4 import BeautifulSoup  # Imported here to keep the bot's start-up fast
+        return BeautifulSoup(self.snapshot.get("top_card", "") + self.snapshot.get("description", ""), "lxml")
+
+    def _text(self, selector):
+        element = self.soup.select_one(selector)
+        return " ".join(element.get_text(" ").split()) if element else ""
+
+    @property
+    def browser_title(self):
+        """
+        The document title, "<title> | <company> | LinkedIn" (with a "(3) " prefix for unread notifications),
+        or the same line read from the detail pane for a job shown there.
+        """
+        if self.pane_title is not None:
+            return self.pane_title
+        return self.snapshot.get("title", "")
+
+    @functools.cached_property
+    def title(self):
+        parts = self.browser_title.split(" | ")
+        return self._text(self.TITLE) or re.sub(r"^\(\d+\)\s*", "", parts[0]).strip()
+
+    @functools.cached_property
+    def company(self):
+        parts = self.browser_title.split(" | ")
+        return self._text(self.COMPANY) or (parts[1].strip() if len(parts) > 2 else "")
+
+    @functools.cached_property
+    def posted(self):
+        """Date the job was posted, from "2 days ago" in the top card. Today if the top card doesn't say."""
+        found = re.search(r"(\d+)\s+(minute|hour|day|week|month|year)s?\s+ago", self._text(self.POSTED))
+        if not found:
+            return date.today()
+        return date.today() - timedelta(days=int(found.group(1)) * self.AGE_DAYS[found.group(2)])
+
+    @functools.cached_property
+    def description(self):
+        return self._text(self.DESCRIPTION)
+
+
+class AnswerStore:
+    """
+    Read-through store for the questions and answers kept in `qa.csv`.
+
+    **How It Works**:
+    - The file is streamed once at startup with the `csv` module (no pandas), so even a file with
+      100k+ questions loads in a fraction of a second.
+    - Known questions are answered straight from memory by `get()`.
+    - New answers are buffered by `add()` and written in batches: when `batch_size` rows are pending,
+      every `flush_interval` seconds from a background timer, and on shutdown or a crash through
+      `close()`, which is registered with `atexit`.
+
+    **Fingerprint**:
+    - Every row records the `fingerprint` of the rules and settings that produced the answer (see
+      `EasyApplyBot.answers_fingerprint`). `get()` only serves answers with the current fingerprint, so after
+      a change to `rules.json` or to the salary, rate or personal details in `config.yaml`, questions seen
+      before are answered again from the rules (and the new answer is appended).
+    - Rows from before fingerprints were recorded are kept in the file but never served.
+
+    **Example**:
+    ```python
+    store = AnswerStore("qa.csv", fingerprint="3f2a...")
+    store.get("are you legally authorized to work?")  # -> "Yes" if it was answered before
+    store.add("how did you hear about us?", "Other")
+    store.close()
+    ```
+    """
+
+    HEADER = ["Question", "Answer", "Fingerprint"]
+
+    def __init__(self, path="qa.csv", flush_interval=30, batch_size=50, fingerprint=""):
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.fingerprint = fingerprint
+        self.answers = {}  # Question -> (answer, fingerprint); the last row of a question wins
+        self._pending = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+        self.load()
+
+        # Flush pending rows on a timer and at interpreter exit (normal exit, Ctrl-C or a crash)
+        self._timer = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._timer.start()
+        atexit.register(self.close)
+
+    def load(self):
+        """Streams the existing file into memory, or creates it with headers if it is missing or empty."""
+        if not self.path.is_file() or self.path.stat().st_size == 0:
+            with open(self.path, 'w', newline='', encoding='utf-8') as file:
+                csv.writer(file).writerow(self.HEADER)
+            log.info(f"Created a new {self.path} file with headers.")
+            return
+
+        try:
+            with open(self.path, 'r', newline='', encoding='utf-8') as file:
+                reader = csv.reader(file)
+                header = next(reader, None)
+                rows = list(reader)
+            for row in rows:
+                if len(row) >= 2 and row[0]:
+                    self.answers[row[0]] = (row[1], row[2] if len(row) > 2 else "")
+            # A file from before fingerprints gets the new header; its rows stay, unfingerprinted
+            if header != self.HEADER:
+                with open(self.path, 'w', newline='', encoding='utf-8') as file:
+                    writer = csv.writer(file)
+                    writer.writerow(self.HEADER)
+                    writer.writerows(rows)
+            log.info(f"Loaded {len(self.answers)} answers from {self.path}")
+        except Exception as e:
+            log.error(f"Error reading {self.path}: {e}")
+
+    def get(self, question):
+        """
+        Returns the stored answer for `question`, or None if it has not been answered before or was answered
+        under other rules or settings (another fingerprint).
+        """
+        answer, fingerprint = self.answers.get(question, (None, None))
+        if answer is None or answer == "" or fingerprint != self.fingerprint:
+            return None
+        return answer
+
+    def add(self, question, answer):
+        """Remembers a new answer and queues it for the next batched write."""
+        with self._lock:
+            if self.answers.get(question, (None, None))[1] == self.fingerprint:
+                return
+            self.answers[question] = (answer, self.fingerprint)
+            self._pending.append([question, answer, self.fingerprint])
+            should_flush = len(self._pending) >= self.batch_size
+
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """Appends all pending rows to the file in one write."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return
+            try:
+                with open(self.path, 'a', newline='', encoding='utf-8') as file:
+                    csv.writer(file).writerows(rows)
+            except Exception as e:
+                # Keep the rows so the next flush can retry them
+                self._pending = rows + self._pending
+                log.error(f"Failed to write answers to {self.path}: {e}")
+
+    def close(self):
+        """Stops the flush timer and writes whatever is still pending."""
+        self._closed.set()
+        self.flush()
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+
+class BloomFilter:
+    """
+    Small Bloom filter over integer job IDs. `in` returns False only when the ID was definitely never
+    added, so it can answer most "is this a new job?" checks without touching the exact index.
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.to_bytes(8, 'little'), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class JobIndex:
+    """
+    Persistent index of every job ID the bot has already processed, shared across runs.
+
+    **How It Works**:
+    - IDs are kept as integers in memory and appended to `path` as 8-byte little-endian integers, so
+      loading tens of thousands of IDs at startup is a single `array.fromfile` call.
+    - On startup, the CSVs the bot already writes (`output.csv` and `applications.csv`) are imported
+      whenever they are newer than the index, so jobs handled by earlier runs are skipped right away.
+    - With `use_bloom=True` a `BloomFilter` sits in front of the exact set.
+
+    **Example**:
+    ```python
+    index = JobIndex("visited_jobs.bin", sources=["output.csv", "applications.csv"])
+    if "4093838983" not in index:
+        ...
+    index.add("4093838983")
+    ```
+    """
+
+    JOB_LINK = re.compile(r"/jobs/view/(\d+)")
+
+    def __init__(self, path="visited_jobs.bin", sources=(), use_bloom=False):
+        self.path = Path(path)
+        self._ids = set()
+        self._lock = threading.Lock()
+        self.bloom = BloomFilter() if use_bloom else None
+
+        index_mtime = self.path.stat().st_mtime if self.path.is_file() else 0
+        if self.path.is_file():
+            ids = array('Q')
+            with open(self.path, 'rb') as file:
+                ids.frombytes(file.read())
+            self._remember(ids)
+
+        # Import jobs recorded by earlier runs that are not in the index yet
+        imported = list(dict.fromkeys(
+            job_id for source in sources
+            if Path(source).is_file() and Path(source).stat().st_mtime >= index_mtime
+            for job_id in self.read_csv_ids(source) if job_id not in self._ids
+        ))
+        if imported:
+            self._remember(imported)
+            self._append(imported)
+
+        log.info(f"{len(self._ids)} previously processed jobs will be skipped")
+
+    @classmethod
+    def read_csv_ids(cls, path):
+        """Yields the job IDs in a CSV: a numeric 2nd column (`output.csv`) or a job link (`applications.csv`)."""
+        with open(path, 'r', newline='', encoding='utf-8', errors='ignore') as file:
+            for row in csv.reader(file):
+                if len(row) > 1 and row[1].strip().isdigit():
+                    yield int(row[1])
+                    continue
+                for cell in row:
+                    match = cls.JOB_LINK.search(cell)
+                    if match:
+                        yield int(match.group(1))
+                        break
+
+    def _remember(self, ids):
+        self._ids.update(ids)
+        if self.bloom is not None:
+            for job_id in ids:
+                self.bloom.add(job_id)
+
+    def _append(self, ids):
+        with open(self.path, 'ab') as file:
+            array('Q', ids).tofile(file)
+
+    def __contains__(self, job_id):
+        try:
+            key = int(job_id)
+        except (TypeError, ValueError):
+            return False
+        if self.bloom is not None and key not in self.bloom:
+            return False
+        return key in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, job_id):
+        """Marks a job as processed, both in memory and on disk."""
+        key = int(job_id)
+        with self._lock:
+            if key in self._ids:
+                return
+            self._remember([key])
+            self._append([key])
+
+    def unseen(self, job_ids):
+        """Returns the given job IDs without the ones that were already processed, keeping their order."""
+        return [job_id for job_id in job_ids if job_id not in self]
+
+
+class JobQueue:
+    """
+    Durable record of a run (SQLite in WAL mode), so a run that died can be resumed where it stopped.
+
+    **Stages**:
+    - `searches`: Every (position, location) combo of the run, in the order it is searched, with its state
+      (`pending`, `searching`, `done`) and the offset of the next result page.
+    - `search_log`: Discovery time of every finished search (result pages, without the applications), across
+      runs (see `history()`).
+    - `jobs` (discovery): Every job card seen, with its state:
+      `discovered` -> `filtered` (selected for applying) or `skipped` (rejected by the filters) ->
+      `applying` -> `applied`, `failed` or `deferred` (not finished in this run, retried on resume).
+    - `outcomes`: Append-only log of every application attempt (`applying`, `applied`, `failed`, `deferred`).
+
+    **Resuming**:
+    - `plan(combos, resume=True)` returns the unfinished searches with their page offsets, and
+      `pending_jobs()` the jobs that were selected but not applied to (including one interrupted mid-application).
+    - A fresh `plan` drops the unfinished searches and jobs of the previous run.
+
+    **Example**:
+    ```python
+    queue = JobQueue("jobs.db")
+    for position, location, start in queue.plan([("Engineer", "Remote")], resume=True):
+        ...
+    ```
+    """
+
+    PENDING_STATES = ("filtered", "applying", "deferred")
+    OUTCOME_STATES = ("applying", "applied", "failed", "deferred")
+    LEFT_OVER = "left over from an earlier run"  # Detail of the selected jobs a fresh plan drops
+
+    def __init__(self, path="jobs.db"):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        # Worker processes each open their own connection; WAL lets them write while the others read
+        self.db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            self.db.executescript("""
+                CREATE TABLE IF NOT EXISTS searches (
+                    position TEXT, location TEXT, ord INTEGER, state TEXT, next_start INTEGER, updated_at REAL,
+                    PRIMARY KEY (position, location));
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY, position TEXT, location TEXT, page_start INTEGER,
+                    state TEXT, detail TEXT, discovered_at REAL, updated_at REAL);
+                CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state);
+                CREATE TABLE IF NOT EXISTS outcomes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT, state TEXT, detail TEXT, at REAL);
+                CREATE TABLE IF NOT EXISTS search_log (
+                    position TEXT, location TEXT, finished_at REAL, seconds REAL);
+            """)
+
+    def plan(self, combos, resume=False):
+        """
+        Returns the searches to run as `(position, location, start)` tuples. A fresh plan records `combos`
+        (`(position, location)` pairs, in the order to search them); a resumed plan continues the unfinished
+        searches of the last run in their original order.
+        """
+        with self._lock, self.db:
+            if resume:
+                rows = self.db.execute(
+                    "SELECT position, location, next_start FROM searches WHERE state != 'done' ORDER BY ord").fetchall()
+                log.info(f"Resuming {len(rows)} unfinished searches and {len(self.pending_jobs(locked=True))} pending jobs")
+                return [tuple(row) for row in rows]
+
+            now = time.time()
+            self.db.execute("DELETE FROM searches")
+            self.db.executemany("INSERT INTO searches VALUES (?, ?, ?, 'pending', 0, ?)",
+                                [(position, location, order, now) for order, (position, location) in enumerate(combos)])
+            self.db.execute("UPDATE jobs SET state = 'skipped', updated_at = ?, "
+                            "detail = CASE state WHEN 'discovered' THEN detail ELSE ? END "
+                            "WHERE state IN ('discovered', 'filtered', 'applying', 'deferred')", (now, self.LEFT_OVER))
+            return [(position, location, 0) for position, location in combos]
+
+    def search_progress(self, position, location, next_start, done=False, seconds=None):
+        """
+        Records that the search continues at result `next_start`, or that it is `done`. The `seconds` a
+        finished search spent on discovery (loading and reading result pages, not applying) go to `search_log`.
+        """
+        with self._lock, self.db:
+            if done and seconds is not None:
+                self.db.execute("INSERT INTO search_log VALUES (?, ?, ?, ?)", (position, location, time.time(), seconds))
+            self.db.execute("INSERT INTO searches VALUES (?, ?, (SELECT COALESCE(MAX(ord), 0) + 1 FROM searches), ?, ?, ?) "
+                            "ON CONFLICT (position, location) DO UPDATE SET state = excluded.state, "
+                            "next_start = excluded.next_start, updated_at = excluded.updated_at",
+                            (position, location, "done" if done else "searching", next_start, time.time()))
+
+    def discovered(self, job_ids, position, location, start):
+        """Adds the jobs of a results page; jobs seen before keep their state."""
+        now = time.time()
+        with self._lock, self.db:
+            self.db.executemany("INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, 'discovered', '', ?, ?)",
+                                [(job_id, position, location, start, now, now) for job_id in job_ids])
+
+    def set_state(self, job_ids, state, detail="", only_from=None):
+        """
+        Moves jobs to `state`; application states are also logged in `outcomes`. With `only_from` (a tuple of
+        states), jobs in any other state keep it, e.g. a job applied to in an earlier search stays `applied`
+        when a later search filters it again.
+        """
+        now = time.time()
+        query = "UPDATE jobs SET state = ?, detail = ?, updated_at = ? WHERE job_id = ?"
+        if only_from:
+            query += f" AND state IN ({', '.join('?' * len(only_from))})"
+        with self._lock, self.db:
+            self.db.executemany(query, [(state, detail, now, job_id, *(only_from or ())) for job_id in job_ids])
+            if state in self.OUTCOME_STATES:
+                self.db.executemany("INSERT INTO outcomes (job_id, state, detail, at) VALUES (?, ?, ?, ?)",
+                                    [(job_id, state, detail, now) for job_id in job_ids])
+
+    def pending_jobs(self, locked=False):
+        """Job IDs that were selected but not applied to, oldest first."""
+        query = f"SELECT job_id FROM jobs WHERE state IN ({', '.join('?' * len(self.PENDING_STATES))}) ORDER BY discovered_at"
+        if locked:
+            return [row[0] for row in self.db.execute(query, self.PENDING_STATES)]
+        with self._lock:
+            return [row[0] for row in self.db.execute(query, self.PENDING_STATES)]
+
+    def history(self):
+        """
+        Yield of every (position, location) combo over all runs: `seconds` of discovery, `searches` run, jobs
+        `found` (selected for applying), and `applied` and `attempted` applications.
+        """
+        with self._lock:
+            history = {}
+            for position, location, seconds, searches in self.db.execute(
+                    "SELECT position, location, SUM(seconds), COUNT(*) FROM search_log GROUP BY position, location"):
+                history[(position, location)] = {"seconds": seconds, "searches": searches,
+                                                 "found": 0, "applied": 0, "attempted": 0}
+            for position, location, found, applied, attempted in self.db.execute(
+                    "SELECT position, location, "
+                    "SUM(state IN ('filtered', 'applying', 'applied', 'failed', 'deferred') OR detail = ?), "
+                    "SUM(state = 'applied'), SUM(state IN ('applied', 'failed')) "
+                    "FROM jobs GROUP BY position, location", (self.LEFT_OVER,)):
+                if (position, location) in history:
+                    history[(position, location)].update(found=found, applied=applied, attempted=attempted)
+            return history
+
+    def counts(self):
+        """Number of jobs per state."""
+        with self._lock:
+            return dict(self.db.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+
+    def close(self):
+        with self._lock:
+            self.db.close()
+
+
+class ComboScheduler:
+    """
+    Orders the (position, location) combos of a run by their yield in earlier runs and shares the search time
+    out between them.
+
+    **Scoring**:
+    - Yield of a combo = new jobs found per minute of discovery x success rate of its applications. Discovery is
+      the time spent loading and reading result pages; time spent applying is left out, so a combo with many jobs
+      to apply to is not scored down for it. The success rate is smoothed (`(applied + 1) / (attempted + 2)`),
+      so a combo with few applications is neither written off nor overrated.
+    - Combos without history, or with less than `MIN_SECONDS` of discovery in total, are scored like the best known
+      combo, so every combo gets explored before the scheduler settles on the best ones.
+
+    **Budgets**:
+    - Every search gets at least `MIN_SHARE` of an even share of the total time; the rest is shared out in
+      proportion to the scores. A combo that stopped yielding still gets a short look every run.
+    - Searches run in order of their score (ties in random order). A search that ends early hands its unused
+      time to the next one (see `EasyApplyBot.applications_loop`).
+
+    **Example**:
+    ```python
+    scheduler = ComboScheduler(job_queue.history())
+    for (position, location), budget in zip(scheduler.rank(combos), scheduler.budgets(combos, 3600)):
+        ...
+    ```
+    """
+
+    MIN_SHARE = 0.25  # Share of an even split of the time that every search gets
+    MIN_SECONDS = 15  # Discovery time below which a combo counts as untried
+
+    def __init__(self, history=None):
+        self.history = history or {}
+
+    def score(self, combo):
+        """Jobs found per minute times the smoothed success rate, or None for a combo without enough history."""
+        stats = self.history.get(tuple(combo))
+        if not stats or stats["seconds"] < self.MIN_SECONDS:
+            return None
+        return stats["found"] / (stats["seconds"] / 60) * (stats["applied"] + 1) / (stats["attempted"] + 2)
+
+    def scores(self, combos):
+        """Score of every combo; untried combos get the best known score (1.0 if nothing was tried yet)."""
+        known = {tuple(combo): self.score(combo) for combo in combos}
+        optimistic = max([score for score in known.values() if score is not None], default=0.0) or 1.0
+        return [optimistic if known[tuple(combo)] is None else known[tuple(combo)] for combo in combos]
+
+    def rank(self, combos):
+        """The combos, best first; combos with the same score in random order."""
+        combos = list(combos)
+        random.shuffle(combos)
+        scores = dict(zip(map(tuple, combos), self.scores(combos)))
+        return sorted(combos, key=lambda combo: scores[tuple(combo)], reverse=True)
+
+    def budgets(self, combos, total):
+        """Seconds for every combo, adding up to `total`."""
+        if not combos:
+            return []
+        scores = self.scores(combos)
+        floor = self.MIN_SHARE * total / len(combos)
+        rest = total - floor * len(combos)
+        if sum(scores) <= 0:
+            return [total / len(combos)] * len(combos)
+        return [floor + rest * score / sum(scores) for score in scores]
+
+    def report(self, searches):
+        """Logs the planned searches and their budgets."""
+        for position, location, start, budget in searches:
+            stats = self.history.get((position, location))
+            seen = f"{stats['found']} jobs in {stats['seconds'] / 60:.0f} min, {stats['applied']}/{stats['attempted']} applied" \
+                if stats else "untried"
+            log.info(f"Search {position}: {location}: {budget / 60:.1f} min ({seen})")
+
+
+def schedule_searches(positions, locations, search_time, job_queue=None, resume=False, limit=500):
+    """
+    Plans the searches of a run as `(position, location, start, budget)` tuples, best combos first.
+
+    The combos are ranked with a `ComboScheduler` fed with the history of `job_queue` (or shuffled, without one),
+    at most `limit` of them are kept, and they share `search_time` seconds per search. With `resume` the
+    unfinished searches of the last run are continued in their original order instead.
+    """
+    scheduler = ComboScheduler(job_queue.history() if job_queue else None)
+    combos = scheduler.rank((position, location) for position in positions for location in locations)[:limit]
+    if job_queue:
+        searches = job_queue.plan(combos, resume)[:limit]
+    else:
+        searches = [(position, location, 0) for position, location in combos]
+    budgets = scheduler.budgets([search[:2] for search in searches], search_time * len(searches))
+    searches = [search + (budget,) for search, budget in zip(searches, budgets)]
+    scheduler.report(searches)
+    return searches
+
+
+class Pacer:
+    """
+    Single place for every randomized delay of the bot, so throughput can be tuned in one spot.
+
+    **Profiles**:
+    - `human`: The original delays, meant to look like a person filling in forms.
+    - `fast`: A quarter of the original delays. Waits marked `essential` (2FA/CAPTCHA, autocomplete
+      suggestions) are kept in full.
+    - `replay`: No delays at all, for replaying recorded or local pages at full speed.
+
+    **Budgets**:
+    - Delays run inside scopes (`with pacer.scope("job"):`). If a budget is set for the scope
+      (`job_budget`, `form_budget`, in seconds), non-essential sleeps are shortened once the scope
+      has slept that long in total.
+
+    **Reporting**:
+    - Every scope logs how long it slept versus worked, and `report()` logs the totals of the run.
+
+    **Example**:
+    ```python
+    pacer = Pacer("fast", form_budget=10)
+    with pacer.scope("form"):
+        pacer.sleep(3, 6, "question")
+    ```
+    """
+
+    PROFILES = {
+        "human": {"scale": 1.0, "essential_scale": 1.0, "job_budget": None, "form_budget": None},
+        "fast": {"scale": 0.25, "essential_scale": 1.0, "job_budget": 30, "form_budget": 10},
+        "replay": {"scale": 0.0, "essential_scale": 0.0, "job_budget": None, "form_budget": None},
+    }
+
+    def __init__(self, profile="human", job_budget=None, form_budget=None):
+        if profile not in self.PROFILES:
+            log.warning(f"Unknown pacing profile '{profile}', using 'human'")
+            profile = "human"
+        self.profile = profile
+        settings = self.PROFILES[profile]
+        self.scale = settings["scale"]
+        self.essential_scale = settings["essential_scale"]
+        self.budgets = {
+            "job": settings["job_budget"] if job_budget is None else job_budget,
+            "form": settings["form_budget"] if form_budget is None else form_budget,
+        }
+        self.started = time.time()
+        self.slept = 0.0
+        self.slept_by_label = {}
+        self._scopes = []
+        self._lock = threading.Lock()
+
+    def sleep(self, low, high=None, label="", essential=False):
+        """
+        Sleeps for a random time between `low` and `high` seconds (exactly `low` if `high` is None),
+        scaled by the profile and capped by the remaining budget of the open scopes.
+        """
+        seconds = low if high is None else random.uniform(low, high)
+        seconds *= self.essential_scale if essential else self.scale
+
+        if not essential:
+            for scope in self._scopes:
+                budget = self.budgets.get(scope["name"])
+                if budget is not None:
+                    seconds = min(seconds, max(0.0, budget - scope["slept"]))
+
+        if seconds <= 0:
+            return 0.0
+        time.sleep(seconds)
+
+        with self._lock:
+            self.slept += seconds
+            self.slept_by_label[label] = self.slept_by_label.get(label, 0.0) + seconds
+            for scope in self._scopes:
+                scope["slept"] += seconds
+        return seconds
+
+    @contextlib.contextmanager
+    def scope(self, name):
+        """Tracks the delays of one unit of work (e.g. a `job` or a `form`) and applies its budget."""
+        scope = {"name": name, "slept": 0.0, "started": time.time()}
+        self._scopes.append(scope)
+        try:
+            yield scope
+        finally:
+            self._scopes.remove(scope)
+            elapsed = time.time() - scope["started"]
+            log.debug(f"Pacing [{name}]: slept {scope['slept']:.1f}s, worked {elapsed - scope['slept']:.1f}s")
+
+    def report(self):
+        """Logs the total time spent sleeping versus working in this run."""
+        elapsed = time.time() - self.started
+        log.info(f"Pacing profile '{self.profile}': slept {self.slept:.0f}s, worked {elapsed - self.slept:.0f}s "
+                 f"({self.slept / elapsed * 100 if elapsed else 0:.0f}% of the run spent sleeping)")
+        for label, seconds in sorted(self.slept_by_label.items(), key=lambda item: -item[1]):
+            log.debug(f"Pacing: {seconds:.1f}s sleeping for '{label}'")
+
+
+class Metrics:
+    """
+    Timing spans for the stages of a run (search pages, job pages, forms, widgets, ...), to see where
+    the minutes per application go.
+
+    **Recording**:
+    - `with metrics.span("get_job_page"):` times a block; the `timed_span` decorator does the same for
+      a whole `EasyApplyBot` method. Every span adds one sample to the histogram of its name.
+
+    **Exporting**:
+    - `summary()` returns count, total, p50, p95 and max seconds per span.
+    - `export(json_path, textfile_path)` writes the summary as JSON and/or as a Prometheus textfile
+      (for node_exporter's textfile collector). Both files are replaced atomically.
+
+    **Example**:
+    ```python
+    metrics = Metrics()
+    with metrics.span("send_resume"):
+        ...
+    metrics.export("metrics.json", "easy_apply.prom")
+    ```
+    """
+
+    def __init__(self, labels=None):
+        self.labels = dict(labels or {})
+        self.samples = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name):
+        """Times the block and records it under `name`, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        with self._lock:
+            self.samples.setdefault(name, []).append(seconds)
+
+    @staticmethod
+    def percentile(values, fraction):
+        """Nearest-rank percentile of the sorted list `values`."""
+        return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+    def summary(self):
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self.samples.items()}
+        return {
+            name: {
+                "count": len(values),
+                "total": sum(values),
+                "p50": self.percentile(values, 0.50),
+                "p95": self.percentile(values, 0.95),
+                "max": values[-1],
+            }
+            for name, values in samples.items()
+        }
+
+    def export(self, json_path=None, textfile_path=None):
+        """Writes the summary to `json_path` (JSON) and `textfile_path` (Prometheus text format)."""
+        summary = self.summary()
+        if json_path:
+            document = {"started": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+                        "seconds": time.time() - self.started, "labels": self.labels, "spans": summary}
+            self._write_atomically(json_path, json.dumps(document, indent=2))
+        if textfile_path:
+            self._write_atomically(textfile_path, self.prometheus_text(summary))
+
+    def prometheus_text(self, summary):
+        def labels(**extra):
+            pairs = {**self.labels, **extra}
+            return "{" + ",".join(f'{key}="{value}"' for key, value in pairs.items()) + "}"
+
+        lines = ["# HELP easy_apply_span_seconds Time spent in each stage of the Easy Apply bot.",
+                 "# TYPE easy_apply_span_seconds summary"]
+        for name, stats in sorted(summary.items()):
+            lines.append(f"easy_apply_span_seconds{labels(span=name, quantile='0.5')} {stats['p50']:.6f}")
+            lines.append(f"easy_apply_span_seconds{labels(span=name, quantile='0.95')} {stats['p95']:.6f}")
+            lines.append(f"easy_apply_span_seconds_sum{labels(span=name)} {stats['total']:.6f}")
+            lines.append(f"easy_apply_span_seconds_count{labels(span=name)} {stats['count']}")
+        lines += ["# HELP easy_apply_span_max_seconds Longest single span of each stage in this run.",
+                  "# TYPE easy_apply_span_max_seconds gauge"]
+        for name, stats in sorted(summary.items()):
+            lines.append(f"easy_apply_span_max_seconds{labels(span=name)} {stats['max']:.6f}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _write_atomically(path, text):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as file:
+            file.write(text)
+        os.replace(temporary, path)
+
+    def report(self):
+        """Logs the slowest stages of the run by total time."""
+        for name, stats in sorted(self.summary().items(), key=lambda item: -item[1]["total"]):
+            log.info(f"Span {name}: {stats['count']}x, total {stats['total']:.1f}s, p50 {stats['p50']:.2f}s, "
+                     f"p95 {stats['p95']:.2f}s, max {stats['max']:.2f}s")
+
+
+def timed_span(name):
+    """Records every call of the decorated `EasyApplyBot` method as a span of `self.metrics`."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            metrics = getattr(self, "metrics", None)
+            if metrics is None:
+                return method(self, *args, **kwargs)
+            with metrics.span(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class CommandProfiler:
+    """
+    Counts the WebDriver commands (HTTP round trips to chromedriver) of the bot and the time each one takes.
+
+    **How It Works**:
+    - `attach(browser)` wraps `browser.execute`. Every WebElement sends its commands through the driver
+      that found it, so `find_element`, `.text`, `get_attribute`, `click`, `execute_script` etc. are all counted.
+    - Every command is grouped three ways:
+        - by **command** (e.g. `findElements`, `getElementText`),
+        - by **calling bot method**, e.g. `send_resume` or `send_resume/is_present` when it went through one of
+          the generic helpers,
+        - by **locator key** of `self.locator`. Find commands are matched on their selector, and commands on an
+          element are credited to the locator that found it.
+    - Totals are kept per job (`job_report`, which also resets them) and per run (`report`).
+
+    **Example**:
+    ```python
+    profiler = CommandProfiler(bot, bot.locator)
+    profiler.attach(bot.browser)
+    ...
+    profiler.job_report("4100000001")
+    ```
+    """
+
+    # Generic helpers that are reported together with the bot method that called them
+    HELPERS = {"is_present", "get_child", "get_children", "clickjs", "timed_phase"}
+    # Key of element references in WebDriver responses (W3C)
+    ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+    def __init__(self, owner, locators=None, top=10):
+        self.owner = owner
+        self.top = top
+        self.selectors = {}
+        for key, (by, value) in (locators or {}).items():
+            for using, selector in self.wire_selectors(by, value):
+                self.selectors[(using, selector)] = key
+        self.element_keys = {}
+        self.job = self.empty_totals()
+        self.run = self.empty_totals()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def empty_totals():
+        return {"command": {}, "method": {}, "locator": {}}
+
+    @staticmethod
+    def wire_selectors(by, value):
+        """The selector as given, and as Selenium sends it (ID, NAME and CLASS_NAME go out as CSS selectors)."""
+        yield by, value
+        if by == By.ID:
+            yield By.CSS_SELECTOR, f'[id="{value}"]'
+        elif by == By.NAME:
+            yield By.CSS_SELECTOR, f'[name="{value}"]'
+        elif by == By.CLASS_NAME:
+            yield By.CSS_SELECTOR, f".{value}"
+        elif by == By.TAG_NAME:
+            yield By.CSS_SELECTOR, value
+
+    def attach(self, browser):
+        execute = browser.execute
+
+        def profiled_execute(driver_command, params=None):
+            start = time.perf_counter()
+            response = execute(driver_command, params)
+            self.record(driver_command, params or {}, response, time.perf_counter() - start)
+            return response
+        browser.execute = profiled_execute
+
+    def caller(self):
+        """Name of the bot method that sent the command, skipping frames that aren't the bot's."""
+        helper = None
+        frame = sys._getframe(1)
+        while frame is not None:
+            if frame.f_locals.get("self") is self.owner and frame.f_code.co_name != "wrapper":
+                name = frame.f_code.co_name
+                if name not in self.HELPERS:
+                    return f"{name}/{helper}" if helper else name
+                helper = helper or name
+            frame = frame.f_back
+        return helper or "-"
+
+    def locator_key(self, params):
+        if "using" in params:
+            return self.selectors.get((params["using"], params.get("value")), "(other selector)")
+        return self.element_keys.get(params.get("id"), "-")
+
+    def record(self, command, params, response, seconds):
+        method = self.caller()
+        key = self.locator_key(params)
+        with self._lock:
+            # Remember which locator found the returned elements, to credit their later commands
+            if "using" in params and isinstance(response, dict):
+                value = response.get("value")
+                for element in value if isinstance(value, list) else [value]:
+                    if isinstance(element, dict) and self.ELEMENT_KEY in element:
+                        self.element_keys[element[self.ELEMENT_KEY]] = key
+            for totals in (self.job, self.run):
+                for group, name in (("command", command), ("method", method), ("locator", key)):
+                    entry = totals[group].setdefault(name, [0, 0.0])
+                    entry[0] += 1
+                    entry[1] += seconds
+
+    def log_totals(self, title, totals):
+        commands = sum(count for count, _ in totals["command"].values())
+        seconds = sum(total for _, total in totals["command"].values())
+        log.info(f"{title}: {commands} WebDriver commands, {seconds:.1f}s")
+        for group in ("method", "locator", "command"):
+            ranked = sorted(totals[group].items(), key=lambda item: -item[1][1])[:self.top]
+            log.info(f"  top {group}s: " + ", ".join(f"{name} {count}x/{total:.2f}s" for name, (count, total) in ranked))
+
+    def job_report(self, jobID):
+        """Logs the commands of the job that just finished and starts counting the next one."""
+        with self._lock:
+            totals, self.job = self.job, self.empty_totals()
+            self.element_keys.clear()
+        self.log_totals(f"Job {jobID}", totals)
+
+    def report(self):
+        """Logs the commands of the whole run."""
+        self.log_totals("Run", self.run)
+
+
 class EasyApplyBot:
     setupLogger()
     # Modify it to increase search time
     # 60 * 1 = 1 minute 
     MAX_SEARCH_TIME = 60 * 10 
+    # Seconds without new job cards before a results page counts as loaded, and the upper bound per page
+    SCROLL_QUIET_PERIOD = 1.5
+    SCROLL_TIMEOUT = 20
+    # Estimated duration of the old fixed scroll loop (8 steps of 0.5-2s sleep, 10s on average, not measured),
+    # used to estimate the time saved in `scroll_report`
+    LEGACY_LOAD_SECONDS = 10
+    # Jobs on one page of search results, and result pages in a row without a new job before a search is dropped
+    JOBS_PER_PAGE = 25
+    STALE_PAGES_LIMIT = 1
+    # Pipelined mode: jobs queued for the apply tab, at most, and the queue length at which the next page is harvested
+    PIPELINE_QUEUE_SIZE = 50
+    PIPELINE_LOW_WATER = 2
+    # Seconds to wait for a login to go through, including the time to approve 2FA or a CAPTCHA
+    LOGIN_TIMEOUT = 60
+    # Entries per group in the WebDriver command reports of `profile_webdriver`
+    PROFILER_TOP = 10
+    # URL patterns that block a whole type of resource when listed in `block_resources: types:`
+    RESOURCE_PATTERNS = {
+        "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*media.licdn.com/dms/image*"],
+        "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*"],
+        "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*", "*dms.licdn.com/playlist*"],
+        "tracking": ["*doubleclick.net*", "*google-analytics.com*", "*googletagmanager.com*", "*px.ads.linkedin.com*",
+                     "*linkedin.com/li/track*", "*bat.bing.com*", "*facebook.net*"],
+    }
+    # Responses from `rules.json` whose answer must be recomputed every time
+    VOLATILE_RESPONSES = {"dynamic_date"}
 
     def __init__(self,
                 salary,
@@ -103,7 +1424,23 @@ class EasyApplyBot:
                 filename='output.csv',
                 blacklist=[],
                 blackListTitles=[],
-                experience_level=[]
+                experience_level=[],
+                job_index='visited_jobs.bin',
+                bloom_filter=False,
+                pacing='human',
+                user_data_dir=None,
+                claims=None,
+                headless=False,
+                block_resources=None,
+                session_file='session.json',
+                base_url='https://www.linkedin.com',
+                metrics_file='metrics.json',
+                metrics_textfile=None,
+                profile_webdriver=False,
+                pipeline=False,
+                pane_navigation=False,
+                fast_fill=False,
+                job_queue='jobs.db'
                 ) -> None:
         """
         Initializes the Easy Apply Bot with configurations and settings for automating LinkedIn job applications.
@@ -131,6 +1468,37 @@ class EasyApplyBot:
             - `5`: Executive
             - `6`: Internship
         Defaults to applying for all experience levels.
+        - `job_index` (str, optional): File that keeps the IDs of processed jobs across runs. Defaults to `'visited_jobs.bin'`.
+        - `bloom_filter` (bool, optional): Puts a Bloom filter in front of the job index. Defaults to `False`.
+        - `pacing` (str or dict, optional): Pacing profile (`human`, `fast` or `replay`), or a dict with `profile`,
+          `job_budget` and `form_budget` (seconds). Defaults to `'human'`.
+        - `user_data_dir` (str, optional): Chrome profile directory for this browser session. Used by the worker pool
+          so every browser has its own profile. Defaults to Chrome's temporary profile.
+        - `claims` (tuple, optional): `(dict, lock)` shared between worker processes so two workers never apply to the
+          same job ID. Defaults to `None` (single browser).
+        - `headless` (bool, optional): Runs Chrome without a window, e.g. on Linux servers. Defaults to `False`.
+        - `block_resources` (dict, optional): Network blocklist applied through the DevTools protocol, with `types`
+          (any of `image`, `font`, `media`, `tracking`) and `urls` (extra URL patterns, `*` as wildcard).
+          Also turns on the per-page network report; `baseline` names the file that the averages of a run without
+          blocking are saved to, so later runs report the bytes saved per page type. Defaults to `None` (nothing blocked).
+        - `session_file` (str, optional): Where the LinkedIn session (cookies and local storage) is saved after logging in,
+          so the next start can skip the login. `None` turns it off. Defaults to `'session.json'`.
+        - `base_url` (str, optional): Site the bot talks to. Point it at a local stand-in such as
+          `benchmarks/fixture_server.py` to replay recorded pages. Defaults to `'https://www.linkedin.com'`.
+        - `metrics_file` (str, optional): JSON file that receives the timing summary of the run (count, p50, p95 and max
+          seconds per stage, see `Metrics`). `None` turns it off. Defaults to `'metrics.json'`.
+        - `metrics_textfile` (str, optional): Same summary in the Prometheus text format, e.g. for node_exporter's
+          textfile collector. Defaults to `None`.
+        - `profile_webdriver` (bool, optional): Counts every WebDriver command and its time by bot method and locator,
+          and logs the top entries after every job and at the end of the run (see `CommandProfiler`). Defaults to `False`.
+        - `pipeline` (bool, optional): Keeps the search results in a second tab that prefetches the next page while the
+          first tab applies (see `pipelined_applications_loop`). Defaults to `False`.
+        - `pane_navigation` (bool, optional): Opens every job in the detail pane of the search results instead of loading
+          its page (see `open_job_pane`). Not used together with `pipeline`. Defaults to `False`.
+        - `fast_fill` (bool, optional): Fills the plain text fields of a form step in one script call instead of typing
+          them key by key (see `fill_text_fields`). Defaults to `False`.
+        - `job_queue` (str, optional): SQLite file that records the searches, the jobs and their outcomes as the run goes,
+          so `--resume` can continue an interrupted run (see `JobQueue`). `None` turns it off. Defaults to `'jobs.db'`.
 
         **Attributes**:
         - Sets up browser automation using Selenium.
@@ -152,7 +1520,32 @@ class EasyApplyBot:
         - Creates empty CSV files if they do not exist, ensuring the bot can run without interruptions.
         """
 
+        # All randomized delays go through the pacer (see `Pacer` for the profiles)
+        if isinstance(pacing, dict):
+            self.pace = Pacer(pacing.get('profile', 'human'), pacing.get('job_budget'), pacing.get('form_budget'))
+        else:
+            self.pace = Pacer(pacing or 'human')
         self.uploads = uploads
+        self.user_data_dir = user_data_dir
+        self.headless = headless
+        self.block_resources = block_resources
+        self.session_file = Path(session_file) if session_file else None
+        self.base_url = base_url.rstrip("/")
+        # Timing spans of the stages of the run (see `Metrics`), exported by `export_metrics()`
+        self.metrics = Metrics()
+        self.metrics_file = metrics_file
+        self.metrics_textfile = metrics_textfile
+        self.profile_webdriver = profile_webdriver
+        self.pipeline = pipeline
+        # The pipelined mode applies in a tab without search results, so it has no pane to open jobs in
+        self.pane_navigation = pane_navigation and not pipeline
+        if pane_navigation and pipeline:
+            log.warning("pane_navigation is not used together with pipeline, job pages are loaded instead")
+        self.fast_fill = fast_fill
+        self.left_results = False  # Set once a job page replaced the search results (see `open_job`)
+        self.network_stats = {}
+        self.network_pages = {}  # Page type open in each tab, for `record_network`
+        self.claims = claims
         self.salary = salary
         self.rate = rate
         self.first_name = person['name']['first_name']
@@ -178,14 +1571,37 @@ class EasyApplyBot:
         if directory and not os.path.exists(directory):
             os.makedirs(directory)
         #
-        self.options = self.browser_options()
-        self.browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=self.options)
-        self.wait = WebDriverWait(self.browser, 30)
         self.blacklist = blacklist
         self.blackListTitles = blackListTitles
+        self.banned = Blacklist(blacklist, blackListTitles)  # Both lists compiled into one matcher
         self.experience_level = experience_level
         self.time_filter = time_filter
-        self.visited_IDs = {}
+        self.scroll_stats = {"pages": 0, "seconds": 0.0}
+        self.startup_timings = {}
+        startup = time.time()
+
+        # Independent start-up steps run in parallel: launching Chrome takes the longest, and loading
+        # the CSVs and rules.json doesn't need the browser.
+        self.options = self.browser_options()
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="startup") as executor:
+            browser = executor.submit(self.timed_phase, "browser", self.launch_browser)
+            # Jobs processed in this or earlier runs (preloaded from the output and applications CSVs)
+            visited = executor.submit(self.timed_phase, "job index", JobIndex, job_index,
+                                      sources=[self.filename, "applications.csv"], use_bloom=bloom_filter)
+            # Known questions are answered from memory and new answers are written to the file in batches.
+            self.qa_file = Path("qa.csv")
+            answers = executor.submit(self.timed_phase, "qa.csv", AnswerStore, self.qa_file)
+            rules = executor.submit(self.timed_phase, "rules.json", self.load_rules)
+
+            self.visited_IDs = visited.result()
+            self.answer_store = answers.result()
+            rules.result()
+            # Stored answers only count while rules.json and the settings they were made from are unchanged
+            self.answer_store.fingerprint = self.answers_fingerprint()
+            self.browser = browser.result()
+        self.wait = WebDriverWait(self.browser, 30)
+        # Durable record of the searches and jobs of this run, for `--resume`
+        self.job_queue = JobQueue(job_queue) if job_queue else None
 
         # First message
         log.info("Welcome to Easy Apply Bot")
@@ -246,47 +1662,104 @@ class EasyApplyBot:
         # Add "search" after defining "links"
         self.locator["search"] = (By.XPATH, f'//div[{self.locator["links"][1]}]')
 
-        # After locators are compeleted, login into LinkedIn
-        self.start_linkedin(person['account']['username'], person['account']['password'])
-        # Initialize questions and answers file
-        self.qa_file = Path("qa.csv")
-        self.answers = {}
+        # Optional WebDriver command profiler, attached before the login so it is counted as well
+        self.profiler = None
+        if self.profile_webdriver:
+            self.profiler = CommandProfiler(self, self.locator, top=self.PROFILER_TOP)
+            self.profiler.attach(self.browser)
 
-        # Check if the qa file exists and is not empty
-        if self.qa_file.is_file() and self.qa_file.stat().st_size > 0:
-            # Load the existing file into a dictionary
-            try:
-                df = pd.read_csv(self.qa_file)
-                self.answers = dict(zip(df['Question'], df['Answer']))
-            except Exception as e:
-                print(f"Error reading file: {e}")
-                self.create_empty_csv()
-        else:
-            # Create a new file with headers "Question" and "Answer"
-            self.create_empty_csv()
+        # After locators are compeleted, login into LinkedIn, unless the saved session is still valid
+        login_start = time.time()
+        if not self.restore_session():
+            self.start_linkedin(person['account']['username'], person['account']['password'])
+        self.startup_timings["login"] = time.time() - login_start
 
         # Initialize the applications file
         self.applications_file = Path("applications.csv")
 
         # If applications.csv does not exist, create it with headers
         if not self.applications_file.is_file():
-            data = {
-                'company': ['some text'],
-                'link': ['some link'],
-            }
-            df = pd.DataFrame(data)
-            # Write only the header to a CSV file (this will create an empty file with headers)
-            df.head(0).to_csv('applications.csv', index=False)
+            with open(self.applications_file, 'w', newline='', encoding='utf-8') as file:
+                csv.writer(file).writerow(['company', 'link'])
+
+        self.startup_timings["total"] = time.time() - startup
+        log.info("Start-up took " + ", ".join(f"{phase}: {seconds:.2f}s" for phase, seconds in self.startup_timings.items()))
 
+    def timed_phase(self, name, function, *args, **kwargs):
+        """Runs one start-up step and records how long it took in `self.startup_timings`."""
+        start = time.time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.startup_timings[name] = time.time() - start
+
+    def export_metrics(self) -> None:
+        """Writes the timing spans of the run to `self.metrics_file` (JSON) and `self.metrics_textfile` (Prometheus)."""
+        try:
+            self.metrics.export(self.metrics_file, self.metrics_textfile)
+        except OSError as e:
+            log.warning(f"Could not export the metrics: {e}")
 
+    def launch_browser(self):
+        """
+        Starts Chrome with the pinned chromedriver (see `resolve_chromedriver`). If the pinned driver no
+        longer matches the installed Chrome, the driver is resolved again once.
+        """
+        path = resolve_chromedriver()
+        try:
+            browser = webdriver.Chrome(service=ChromeService(path) if path else ChromeService(), options=self.options)
+        except SessionNotCreatedException as e:
+            log.warning(f"Pinned chromedriver doesn't match Chrome ({e.msg}), resolving it again")
+            path = resolve_chromedriver(refresh=True)
+            browser = webdriver.Chrome(service=ChromeService(path) if path else ChromeService(), options=self.options)
+
+        self.browser = browser
+        self.apply_network_blocklist()
+        return browser
+
+    def load_rules(self):
+        """Reads `rules.json` and compiles it, so `ans_question` doesn't re-scan every rule for every question."""
         with open("rules.json", 'r', encoding='utf-8') as file:
             self.rules = json.load(file)
 
-    def create_empty_csv(self):
-        """Creates an empty CSV file with the correct headers."""
-        df = pd.DataFrame(columns=["Question", "Answer"])
-        df.to_csv(self.qa_file, index=False, encoding='utf-8')
-        print("Created a new qa.csv file with headers.")
+        self.rule_engine = RuleEngine(self.rules)
+        self.responses = self.response_table()
+
+    def answers_fingerprint(self):
+        """
+        Hash of everything an answer from the rules depends on: `rules.json` and the values of the `dynamic_*`
+        responses (salary, rate, personal details). `random_choice` and `VOLATILE_RESPONSES` are left out.
+        """
+        values = {name: str(handler()) for name, handler in sorted(self.responses.items())
+                  if name != "random_choice" and name not in self.VOLATILE_RESPONSES}
+        data = json.dumps([self.rules, values], sort_keys=True, default=str)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+    def response_table(self):
+        """
+        Maps the special `response` values of `rules.json` to functions that produce the actual answer.
+        Any response that is not in this table is used as the answer as-is.
+        """
+        return {
+            "random_choice": lambda: random.choice(["6", "5", "4", "3"]),
+            "dynamic_rate": lambda: self.rate,
+            "dynamic_salary": lambda: self.salary,
+            "dynamic_date": lambda: date.today().strftime("%m/%d/%Y"),
+            "dynamic_city": lambda: self.city,
+            "dynamic_zipcode": lambda: self.zipcode,
+            "dynamic_first_name": lambda: self.first_name,
+            "dynamic_last_name": lambda: self.last_name,
+            "dynamic_full_name": lambda: self.first_name + " " + self.last_name,
+            "dynamic_github": lambda: self.github,
+            "dynamic_linkedin": lambda: self.linkedin,
+            "dynamic_portfolio": lambda: self.portfolio,
+            "dynamic_disability": lambda: self.disability,
+            "dynamic_state": lambda: self.state,
+            "dynamic_gender": lambda: self.gender,
+            "dynamic_lgbtq": lambda: self.lgbtq,
+            "dynamic_veteran": lambda: self.veteran,
+            "dynamic_phone_number": lambda: self.phone_number,
+        }
 
     def browser_options(self):
         """
@@ -305,8 +1778,15 @@ class EasyApplyBot:
         """
         options = webdriver.ChromeOptions()
 
-        # Start the browser in maximized mode
-        options.add_argument("--start-maximized") 
+        if self.headless:
+            # No window at all; give the page a desktop-sized viewport so LinkedIn serves the desktop layout
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--disable-dev-shm-usage")
+        else:
+            # Start the browser in maximized mode
+            options.add_argument("--start-maximized") 
         
         # Ignore SSL certificate errors
         options.add_argument("--ignore-certificate-errors")
@@ -322,17 +1802,228 @@ class EasyApplyBot:
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--force-device-scale-factor=0.8")
 
+        # Keep timers and rendering running in tabs that aren't in front (the pipelined search tab loads in the background)
+        options.add_argument("--disable-background-timer-throttling")
+        options.add_argument("--disable-renderer-backgrounding")
+        options.add_argument("--disable-backgrounding-occluded-windows")
+
         # Uncomment if debugging locally via Chrome remote debugging port
         # options.add_argument(r'--remote-debugging-port=9222')
         
         # Uncomment to specify a particular user profile in Chrome
         # options.add_argument(r'--profile-directory=Person 1')
 
-        # Uncomment if you want to load a specific user profile for persistent session data
-        # options.add_argument(r"--user-data-dir={}".format(self.profile_path))
+        # Every worker of the worker pool gets its own profile directory
+        if self.user_data_dir:
+            options.add_argument(r"--user-data-dir={}".format(self.user_data_dir))
+
+        # Otherwise load the configured user profile for persistent session data.
+        # A path like '.../User Data/Profile 1' is split into the user data dir and the profile directory.
+        elif self.profile_path:
+            profile = Path(self.profile_path)
+            if profile.name == "Default" or profile.name.startswith("Profile "):
+                options.add_argument(r"--user-data-dir={}".format(profile.parent))
+                options.add_argument(r"--profile-directory={}".format(profile.name))
+            else:
+                options.add_argument(r"--user-data-dir={}".format(profile))
+
+        if self.block_resources is not None:
+            # Don't even decode images, and record network events for `network_report()`
+            if "image" in self.block_resources.get("types", []):
+                options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
         return options
 
+    def apply_network_blocklist(self) -> None:
+        """
+        Blocks the resource types and URL patterns from `block_resources` through the Chrome DevTools
+        protocol (`Network.setBlockedURLs`), so images, fonts, video and tracking scripts the bot never
+        uses are not downloaded. Does nothing when `block_resources` is not configured.
+        """
+        if not self.block_resources:
+            return
+
+        patterns = []
+        for resource_type in self.block_resources.get("types", []):
+            if resource_type not in self.RESOURCE_PATTERNS:
+                log.warning(f"Unknown resource type to block: {resource_type}")
+            patterns += self.RESOURCE_PATTERNS.get(resource_type, [])
+        patterns += [url for url in self.block_resources.get("urls", []) if url]
+
+        try:
+            self.browser.execute_cdp_cmd("Network.enable", {})
+            self.browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            log.info(f"Blocking {len(patterns)} URL patterns")
+        except Exception as e:
+            log.error(f"Could not set the network blocklist: {e}")
+
+    def record_network(self, page_type=None) -> None:
+        """
+        Adds the network events logged since the last call (requests, bytes transferred, requests blocked)
+        to the page type each tab had open until now, then starts a page of `page_type` (e.g. `"search"` or
+        `"job"`) in the current tab. Call it right BEFORE navigating, so the traffic of a page is never
+        counted for the page that follows it. Events are matched to their tab, so the background search tab
+        of the pipeline keeps its own page type. `None` only drains the log (at the end of a run).
+        Only active with `block_resources`.
+        """
+        if self.block_resources is None:
+            return
+        try:
+            entries = self.browser.get_log("performance")
+            tab = self.browser.current_window_handle.replace("CDwindow-", "")
+        except Exception as e:
+            log.debug(f"Performance log not available: {e}")
+            return
+
+        for entry in entries:
+            logged = json.loads(entry["message"])
+            open_page = self.network_pages.get(logged.get("webview"), self.network_pages.get(tab))
+            if open_page is None:
+                continue
+            stats = self.network_stats[open_page]
+            message = logged.get("message", {})
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                stats["requests"] += 1
+            elif method == "Network.loadingFinished":
+                stats["bytes"] += params.get("encodedDataLength", 0)
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                stats["blocked"] += 1
+
+        if page_type is not None:
+            self.network_pages[tab] = page_type
+            stats = self.network_stats.setdefault(page_type, {"pages": 0, "requests": 0, "bytes": 0, "blocked": 0})
+            stats["pages"] += 1
+
+    def network_report(self) -> None:
+        """
+        Logs requests, bytes and blocked requests per page for every page type.
+
+        A run with nothing blocked (`block_resources: {types: []}`) saves its per-page averages to the
+        `baseline` file of `block_resources` (default `network_baseline.json`). A run that blocks resources
+        then also logs the bytes and requests it saved per page compared to that baseline.
+        """
+        if self.block_resources is None:
+            return
+        self.record_network()
+
+        averages = {}
+        for page_type, stats in self.network_stats.items():
+            pages = stats["pages"] or 1
+            averages[page_type] = {"requests": stats["requests"] / pages, "bytes": stats["bytes"] / pages}
+            log.info(f"Network [{page_type}]: {stats['pages']} pages, "
+                     f"{stats['requests'] / pages:.0f} requests/page, "
+                     f"{stats['bytes'] / pages / 1024:.0f} KiB/page, "
+                     f"{stats['blocked'] / pages:.0f} requests blocked/page")
+
+        baseline_file = self.block_resources.get("baseline", "network_baseline.json")
+        if not baseline_file:
+            return
+        blocking = self.block_resources.get("types") or self.block_resources.get("urls")
+        if not blocking:
+            try:
+                with open(baseline_file, "w") as file:
+                    json.dump(averages, file, indent=2)
+                log.info(f"Network baseline saved to {baseline_file}")
+            except OSError as e:
+                log.error(f"Could not save the network baseline: {e}")
+            return
+        try:
+            with open(baseline_file) as file:
+                baseline = json.load(file)
+        except (OSError, ValueError):
+            log.info("No network baseline to compare with; run once with `block_resources: {types: []}` to record one")
+            return
+        for page_type, average in averages.items():
+            if page_type not in baseline:
+                continue
+            saved_bytes = baseline[page_type]["bytes"] - average["bytes"]
+            saved_requests = baseline[page_type]["requests"] - average["requests"]
+            share = saved_bytes / baseline[page_type]["bytes"] if baseline[page_type]["bytes"] else 0
+            log.info(f"Network [{page_type}]: saved {saved_bytes / 1024:.0f} KiB/page ({share:.0%}) "
+                     f"and {saved_requests:.0f} requests/page compared to the baseline")
+
+    def is_logged_in(self) -> bool:
+        """
+        Returns True if the browser holds a LinkedIn session: the `li_at` auth cookie is set and the
+        current page is not a login, auth wall or security checkpoint page.
+        """
+        url = self.browser.current_url
+        if any(part in url for part in ("/login", "/authwall", "/checkpoint", "/uas/")):
+            return False
+        return any(cookie["name"] == "li_at" for cookie in self.browser.get_cookies())
+
+    def save_session(self) -> None:
+        """
+        Saves the cookies and local storage of the logged in session to `self.session_file`.
+
+        **Notes**:
+        - The file holds live authentication cookies. It is only readable by the current user and is listed in `.gitignore`.
+        """
+        if not self.session_file:
+            return
+        try:
+            session = {
+                "saved": datetime.now().isoformat(),
+                "cookies": self.browser.get_cookies(),
+                "local_storage": self.browser.execute_script(
+                    "return Object.fromEntries(Object.entries(window.localStorage));"
+                ),
+            }
+            # Created readable by the current user only, so the cookies are never readable by others
+            descriptor = os.open(self.session_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            if hasattr(os, "fchmod"):
+                os.fchmod(descriptor, 0o600)  # A file left by an older version may still be world readable
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+                json.dump(session, file)
+            log.info(f"Saved the LinkedIn session to {self.session_file}")
+        except Exception as e:
+            log.error(f"Could not save the session: {e}")
+
+    def restore_session(self) -> bool:
+        """
+        Restores the session saved by `save_session()` and checks that it is still valid.
+
+        **Workflow**:
+        1. Opens LinkedIn once so cookies can be set for its domain.
+        2. Adds the saved cookies and local storage entries.
+        3. Opens the feed and checks with `is_logged_in()` that LinkedIn accepted the session.
+
+        **Returns**:
+        - `bool`: True if the bot is logged in and `start_linkedin()` can be skipped. False if there is no
+          saved session or it expired, in which case the full login flow runs.
+        """
+        if not self.session_file or not self.session_file.is_file():
+            return False
+        try:
+            with open(self.session_file, 'r', encoding='utf-8') as file:
+                session = json.load(file)
+
+            self.browser.get(self.base_url + "/robots.txt")
+            for cookie in session.get("cookies", []):
+                # chromedriver rejects cookies with an unknown sameSite value
+                if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                    cookie.pop("sameSite", None)
+                try:
+                    self.browser.add_cookie(cookie)
+                except Exception as e:
+                    log.debug(f"Skipped cookie {cookie.get('name')}: {e}")
+            self.browser.execute_script(
+                "for (const [key, value] of Object.entries(arguments[0])) window.localStorage.setItem(key, value);",
+                session.get("local_storage", {})
+            )
+
+            self.browser.get(self.base_url + "/feed/")
+            if self.is_logged_in():
+                log.info(f"Restored the LinkedIn session saved on {session.get('saved')}, skipping login")
+                return True
+            log.info("The saved LinkedIn session expired, logging in again")
+        except Exception as e:
+            log.error(f"Could not restore the session: {e}")
+        return False
+
     def start_linkedin(self, username, password) -> None:
         """
         Logs into the user's LinkedIn account using the provided credentials.
@@ -347,7 +2038,8 @@ class EasyApplyBot:
         3. Inputs the username and password into their respective fields.
         4. Simulates user interaction with small delays to prevent detection by LinkedIn's anti-bot mechanisms.
         5. Clicks the login button using JavaScript execution for reliability.
-        6. Pauses execution for 20 seconds to handle potential Two-Factor Authentication (2FA) or CAPTCHA prompts.
+        6. Waits (up to `LOGIN_TIMEOUT` seconds) until the login went through, which leaves time for potential Two-Factor Authentication (2FA) or CAPTCHA prompts.
+        7. Saves the session with `save_session()` so the next start can skip the login.
 
         **Locators Used**:
         - `username_field`: Locator for the username input field.
@@ -362,7 +2054,7 @@ class EasyApplyBot:
 
         **Additional Notes**:
         - The method utilizes Selenium's `WebDriverWait` to ensure elements are present before interacting with them, reducing the risk of runtime errors.
-        - `time.sleep` is used sparingly to mimic user behavior and handle potential UI delays.
+        - Delays go through `self.pace` (see `Pacer`) to mimic user behavior and handle potential UI delays.
         - JavaScript execution (`clickjs`) is used for the login button to avoid interaction issues.
 
         **Example**:
@@ -372,9 +2064,9 @@ class EasyApplyBot:
         """
 
         log.info("Logging in.....Please wait :)")
-        self.browser.get("https://www.linkedin.com/login?trk=guest_homepage-basic_nav-header-signin")
+        self.browser.get(self.base_url + "/login?trk=guest_homepage-basic_nav-header-signin")
 
-        time.sleep(5)
+        self.pace.sleep(5, label="login page")
 
         try:
             user_field = self.get_child(self.locator["username_field"])
@@ -388,17 +2080,22 @@ class EasyApplyBot:
             login_button = self.get_child(self.locator["login_button"])
             
             user_field.send_keys(username)
-            time.sleep(random.uniform(0.5, 2.0))
+            self.pace.sleep(0.5, 2.0, "typing")
             user_field.send_keys(Keys.TAB)
-            time.sleep(random.uniform(0.5, 2.0))
+            self.pace.sleep(0.5, 2.0, "typing")
             pw_field.send_keys(password)
-            time.sleep(random.uniform(0.5, 2.0))
+            self.pace.sleep(0.5, 2.0, "typing")
             
             # Click the login button after ensuring it is clickable
             self.wait.until(EC.element_to_be_clickable(login_button))
             self.clickjs(login_button)
-            # Timer for 20 seconds, in cases where 2FA and/or CAPTCHA needs to be approved
-            time.sleep(20)
+
+            # Wait until the login went through. This also leaves time to approve 2FA and/or CAPTCHA prompts.
+            try:
+                WebDriverWait(self.browser, self.LOGIN_TIMEOUT, poll_frequency=1).until(lambda _: self.is_logged_in())
+                self.save_session()
+            except TimeoutException:
+                log.warning(f"Still not logged in after {self.LOGIN_TIMEOUT} seconds, continuing anyway")
 
         except TimeoutException:
             log.info("TimeoutException! Username/password field or login button not found")
@@ -406,22 +2103,27 @@ class EasyApplyBot:
             log.error(f"Element not found: {e}")
  
     # This method that starts application process
-    def start_apply(self, positions, locations) -> None:
+    def start_apply(self, positions, locations, resume=False) -> None:
         """
         Initiates the job application process by applying to a combination of positions and locations.
         
         Args:
             positions (list): A list of job positions to apply for.
             locations (list): A list of locations to apply for.
+            resume (bool): Continues the searches and jobs the last run left unfinished (needs `job_queue`).
         
         Workflow:
             - Starts by recording the start time.
             - Fills in initial data for the application.
-            - Iterates through randomly selected combinations of positions and locations.
-            - Ensures each position-location combination is unique.
+            - Plans the combinations of positions and locations with `schedule_searches()`: combos that found
+              and landed more jobs in earlier runs go first and get more of the search time, untried combos
+              are explored.
             - Logs each application attempt.
             - Calls the `applications_loop()` method to apply for each position at the specified location.
-            - Stops after either applying to all combinations or after 500 attempts, whichever comes first.
+            - Searches that end early (last page, or no new jobs) hand their unused time to the next search.
+            - With `resume`, first applies to the jobs the last run had selected, then continues its unfinished
+              searches at the page they had reached.
+            - Stops after either applying to all combinations or after 500 searches, whichever comes first.
         
         Returns:
             None
@@ -431,27 +2133,31 @@ class EasyApplyBot:
         self.positions = positions  # Set the positions to apply for.
         self.locations = locations  # Set the locations to apply for.
         
-        combos: list = []  # List to store unique combinations of position and location.
-        
-        # Continue until all unique combinations of positions and locations are tried.
-        while len(combos) < len(positions) * len(locations):
-            # Randomly select a position and location from the provided lists.
-            position = positions[random.randint(0, len(positions) - 1)]
-            location = locations[random.randint(0, len(locations) - 1)]
-            combo: tuple = (position, location)  # Create a position-location tuple.
-
-            # Ensure the combination has not already been tried.
-            if combo not in combos:
-                combos.append(combo)  # Add the new combo to the list of applied combos.
-                log.info(f"Applying to {position}: {location}")  # Log the application attempt.
-
-                # Modify location for the application loop.
-                location = "&location=" + location
-                self.applications_loop(position, location)  # Apply for the selected position and location.
-
-            # Break the loop if more than 500 applications are attempted to avoid excessive loops.
-            if len(combos) > 500:
-                break
+        leftover: float = 0.0  # Seconds left over from searches that ended early
+
+        # Every unique combination of positions and locations, best yield first, with its share of the search time.
+        # With the job queue, the plan is recorded (or, when resuming, read back with the page each search stopped at).
+        searches: list = schedule_searches(positions, locations, self.MAX_SEARCH_TIME, self.job_queue, resume)
+
+        # Jobs the interrupted run had selected but not applied to come first
+        if resume and self.job_queue:
+            self.apply_loop(self.job_queue.pending_jobs())
+
+        # At most 500 searches per run, to avoid excessive loops.
+        for position, location, search_start, budget in searches:
+            log.info(f"Applying to {position}: {location}" + (f" from result {search_start}" if search_start else ""))
+
+            # Modify location for the application loop.
+            location = "&location=" + location
+            # Time a search didn't need goes to the next one
+            leftover = self.applications_loop(position, location, budget + leftover, start=search_start)
+
+        self.scroll_report()
+        self.network_report()
+        self.pace.report()
+        self.metrics.report()
+        if self.profiler:
+            self.profiler.report()
 
     def fill_window(self) -> None:
         """
@@ -488,120 +2194,414 @@ class EasyApplyBot:
 
         """
 
+        # A headless browser has no window to hide
+        if self.headless:
+            return
+
         self.browser.set_window_size(1, 1)
         self.browser.set_window_position(2000, 2000)
 
-    def applications_loop(self, position, location):
+    def applications_loop(self, position, location, budget=None, start=0):
         """
         Main loop to search and apply for jobs based on the specified position and location.
 
         Args:
             position (str): The job position to search for (e.g., "Software Engineer").
             location (str): The location to search in (e.g., "New York").
+            budget (float, optional): Seconds this search may take. Defaults to `MAX_SEARCH_TIME`.
+            start (int, optional): Result to start from, e.g. where an interrupted run stopped. Defaults to 0.
 
         Workflow:
-            - Initializes the job search by setting the window and loading the first page of results.
-            - Logs the time remaining for the search based on `MAX_SEARCH_TIME`.
-            - Scrolls through the job listings, looks for job cards, and checks their status (whether applied or not).
+            - Initializes the job search by setting the window and walking the result pages with `search_pages()`.
+            - Logs the time remaining for the search.
+            - Reads the job cards of each page and checks their status (whether applied or not).
             - Skips jobs that have already been applied to and stores new job IDs for processing.
             - If new jobs are found, passes them to the `apply_loop()` method for further action.
-            - Continues to the next page of jobs after processing the current page.
-            - Repeats the process until the search time runs out or no more jobs are found.
+            - Stops after the last page, after `STALE_PAGES_LIMIT` pages in a row without a new job,
+              or when the budget runs out.
 
         Returns:
-            None
+            float: Seconds of the budget left unused, so the caller can give them to the next search.
         """
-        jobs_per_page = 0  # Initialize the number of jobs found per page.
+        budget = self.MAX_SEARCH_TIME if budget is None else budget
         start_time: float = time.time()  # Record the start time of the job search.
+        stale_pages = 0  # Pages in a row without a new job
+        seen = set()  # Job IDs of the pages of this search so far
+        apply_seconds = 0.0  # Time spent applying, which is not discovery time for `search_log`
 
         log.info("Looking for jobs...Please wait...")  # Log that the search has started.
 
         # Set window position and maximize it for job searching.
-        self.browser.set_window_position(1, 1)
-        self.browser.maximize_window()
-        
-        # Load the first page of jobs based on position and location.
-        self.browser, _ = self.next_jobs_page(position, location, jobs_per_page, experience_level=self.experience_level, time_filter=self.time_filter)
+        if not self.headless:
+            self.browser.set_window_position(1, 1)
+            self.browser.maximize_window()
         log.info("Set and maximize window")
 
-        # Continue searching for jobs until the maximum search time is reached.
-        while time.time() - start_time < self.MAX_SEARCH_TIME:
+        if self.pipeline:
+            return self.pipelined_applications_loop(position, location, budget, start)
+
+        search = (position, location.split("&location=", 1)[-1])  # The combo as the job queue knows it
+        for start, cards in self.search_pages(position, location, start):
             try:
                 # Log the remaining time left for the search.
-                log.info(f"{(self.MAX_SEARCH_TIME - (time.time() - start_time)) // 60} minutes left in this search")
+                log.info(f"{(budget - (time.time() - start_time)) // 60} minutes left in this search (results from {start})")
 
-                # Sleep for a random time between 1.5 to 2.9 seconds to mimic human behavior.
-                randoTime: float = random.uniform(1.5, 2.9)
-                log.debug(f"Sleeping for {round(randoTime, 1)}")
-                self.load_page(sleep=0.5)
+                # A page is stale when it shows no job that is new to the bot, whether or not one was selected
+                stale_pages = 0 if self.new_job_ids(cards, seen) else stale_pages + 1
+                jobIDs = self.select_jobs(cards, search + (start,))
 
-                # Check if the search results are present.
-                if self.is_present(self.locator["search"]):
-                    
-                    scrollresults = self.get_children(self.locator["search"])
+                # If there are new jobs to process, apply to them.
+                if len(jobIDs) > 0:
+                    apply_start = time.time()
+                    self.apply_loop(jobIDs)
+                    apply_seconds += time.time() - apply_start
+                if self.job_queue:
+                    self.job_queue.search_progress(*search, start + self.JOBS_PER_PAGE)
 
-                    # Scroll through job listings to load more results.
-                    for i in range(300, 1500, 100):
-                        self.browser.execute_script("arguments[0].scrollTo(0, {})".format(i + random.uniform(0.5, 5.0)), scrollresults[0])
-                        time.sleep(random.uniform(0.5, 2.0))  # Wait for new elements to load.
+            except Exception as e:
+                print(e)  # Log any exceptions encountered during the search process.
 
-                # Check if job links are present on the page.
-                if self.is_present(self.locator["links"]):
-                    links = self.get_children(self.locator["links"])
-                    
-                    jobIDs = {}  # Dictionary to store job IDs for processing.
+            if stale_pages >= self.STALE_PAGES_LIMIT:
+                log.info(f"No new jobs on the last {stale_pages} page(s), moving on to the next search")
+                break
+            if time.time() - start_time >= budget:
+                break
 
-                    for link in links:
-                        try:
-                            # Check if the job has already been applied to.
-                            applied_status = link.find_element(By.XPATH, 
-                                ".//div/ul/li[contains(@class, 'job-card-container__footer-job-state') and normalize-space(.)='Applied']"
-                            )
+        if self.job_queue:
+            discovery = time.time() - start_time - apply_seconds
+            self.job_queue.search_progress(*search, start, done=True, seconds=discovery)
+        return max(0.0, budget - (time.time() - start_time))
 
-                            # If the job has been applied, dismiss it and skip to the next.
-                            if applied_status.is_displayed():
-                                log.debug(f"Job already applied: {link.text}")
-                                dismissBtn = link.find_element(By.XPATH, ".//button[starts-with(@aria-label, 'Dismiss')]")
-                                self.clickjs(dismissBtn)
-                                continue  # Skip this job card if it's already applied.
-
-                        except NoSuchElementException:
-                            # Add the job's ID to the list of `jobIDs`. If ALL are True: 
-                            # 1) The job title is NOT blacklisted. 
-                            # 2) If the company of the job is not blacklisted
-                            jobIsBanned = False
-
-                            for word in blacklist + blackListTitles:
-                                if word.lower() in link.text.lower():
-                                    log.debug(f"Job has a banned word: {word}\nDetails: {link.text}")
-                                    jobIsBanned = True
-
-                            if jobIsBanned == False:
-                                jobID = link.get_attribute("data-job-id")
-
-                                if jobID.isdigit():
-                                    # Ensure the job ID is unique before adding it for processing.
-                                    if "Easy Apply" in link.text:
-                                        jobIDs[jobID] = True
-
-                                else:
-                                    log.debug(f"Job ID not found, It is likely a 'promoted' job; It doesn't fit the current query {link.text}")
-                                    continue
-                            # traceback.format_exc()
-                    
-                    # If there are new jobs to process, apply to them.
-                    if len(jobIDs) > 0:
-                        self.apply_loop(jobIDs)
+    def pipelined_applications_loop(self, position, location, budget=None, start=0):
+        """
+        Pipelined version of `applications_loop`: discovery and applications run in two tabs of the same browser.
 
-                    # Load the next page of job listings.
-                    self.browser, jobs_per_page = self.next_jobs_page(position, location, jobs_per_page, experience_level=self.experience_level, time_filter=self.time_filter)
+        **How It Works**:
+        - The **search tab** holds the results of the search. Once a page is harvested, the next page is prefetched:
+          the navigation and the `load_page` scroll loader both run inside the page, without blocking WebDriver.
+        - The **apply tab** (the bot's original window) runs `apply_to_job` for the jobs of a queue.
+        - Between two jobs the bot looks into the search tab: as soon as the prefetched page is there, it starts the
+          scroll loader on it. When the queue is down to `PIPELINE_LOW_WATER` jobs, the page is harvested (usually
+          fully loaded by then) and the next one is prefetched.
+        - The queue is bounded: while it holds `PIPELINE_QUEUE_SIZE` jobs or more, no further page is prefetched.
+        - The search tab never navigates away from its results, so they are never reloaded or re-scrolled.
 
-                else:
-                    # If no jobs found, continue to the next page.
-                    self.browser, jobs_per_page = self.next_jobs_page(position, location, jobs_per_page, experience_level=self.experience_level, time_filter=self.time_filter)
+        **Parameters** and **Returns**: Same as `applications_loop`.
 
+        **Notes**:
+        - WebDriver runs one command at a time, so the gain comes from the page loads and scrolling that happen
+          in the browser while the bot works in the other tab.
+        - Stops like `applications_loop`: after the last page, after `STALE_PAGES_LIMIT` pages without a new job,
+          or when the budget runs out.
+        """
+        budget = self.MAX_SEARCH_TIME if budget is None else budget
+        start_time: float = time.time()
+        jobs = deque()  # Job IDs waiting for the apply tab
+        stale_pages = 0  # Pages in a row without a new job
+        seen = set()  # Job IDs of the pages of this search so far, queued jobs included
+        apply_seconds = 0.0  # Time spent in the apply tab, which is not discovery time for `search_log`
+        previous_ids = None
+        search = (position, location.split("&location=", 1)[-1])  # The combo as the job queue knows it
+        # State of the search tab: navigating -> loading -> (harvested) -> idle or navigating ... -> done
+        search_state = "navigating"
+        # A flag that only the page the prefetch navigated away from has
+        page_ready = "return !window.__easyApplyPrefetch && document.readyState === 'complete';"
+
+        def prefetch():
+            url = self.search_url(position, location, start, self.experience_level, self.time_filter)
+            self.record_network("search")
+            self.browser.execute_script("window.__easyApplyPrefetch = true; window.location.href = arguments[0];", url)
+            return "navigating"
+
+        apply_tab = self.browser.current_window_handle
+        self.browser.switch_to.new_window("tab")
+        search_tab = self.browser.current_window_handle
+        self.apply_network_blocklist()  # The blocklist is set per tab
+        log.info("Looking for jobs in a separate search tab...Please wait...")
+
+        try:
+            # The first page is the only one loaded in the foreground
+            self.record_network("search")
+            self.browser.get(self.search_url(position, location, start, self.experience_level, self.time_filter))
+            self.load_page(background=True)
+            search_state = "loading"
+
+            while time.time() - start_time < budget:
+                self.browser.switch_to.window(search_tab)
+                try:
+                    if search_state == "navigating" and self.browser.execute_script(page_ready):
+                        self.load_page(background=True)
+                        search_state = "loading"
+                    elif search_state == "idle" and len(jobs) < self.PIPELINE_QUEUE_SIZE:
+                        search_state = prefetch()
+
+                    # The queue is running low: harvest the page, waiting for it if it isn't ready yet
+                    if search_state in ("navigating", "loading") and len(jobs) <= self.PIPELINE_LOW_WATER:
+                        if search_state == "navigating":
+                            WebDriverWait(self.browser, 30).until(lambda driver: driver.execute_script(page_ready))
+                            self.load_page(background=True)
+                        self.collect_page_load()
+
+                        cards = self.harvest_job_cards()
+                        ids = [card["id"] for card in cards]
+                        if not cards or ids == previous_ids:
+                            log.info(f"No new job cards from result {start} on, end of the search")
+                            search_state = "done"
+                        else:
+                            last_page = self.last_results_page()
+                            stale_pages = 0 if self.new_job_ids(cards, seen) else stale_pages + 1
+                            new_jobs = [jobID for jobID in self.select_jobs(cards, search + (start,)) if jobID not in jobs]
+                            jobs.extend(new_jobs)
+                            log.info(f"{(budget - (time.time() - start_time)) // 60} minutes left in this search "
+                                     f"(results from {start}, {len(new_jobs)} new jobs, {len(jobs)} queued)")
+
+                            if last_page:
+                                log.info(f"Last page of the search (results from {start})")
+                                search_state = "done"
+                            elif stale_pages >= self.STALE_PAGES_LIMIT:
+                                log.info(f"No new jobs on the last {stale_pages} page(s), moving on to the next search")
+                                search_state = "done"
+                            else:
+                                previous_ids = ids
+                                start += self.JOBS_PER_PAGE
+                                search_state = prefetch() if len(jobs) < self.PIPELINE_QUEUE_SIZE else "idle"
+                            if self.job_queue and search_state != "done":
+                                self.job_queue.search_progress(*search, start)
+                except Exception as e:
+                    log.error(f"Search tab failed, finishing the queued jobs: {e}")
+                    search_state = "done"
+                self.browser.switch_to.window(apply_tab)
+
+                if not jobs:
+                    if search_state == "done":
+                        break
+                    continue
+                apply_start = time.time()
+                self.apply_loop([jobs.popleft()])
+                apply_seconds += time.time() - apply_start
+
+            # Jobs still queued when the time ran out are picked up by `--resume`
+            if jobs and self.job_queue:
+                self.job_queue.set_state(list(jobs), "deferred", "search time ran out")
+            if self.job_queue:
+                discovery = time.time() - start_time - apply_seconds
+                self.job_queue.search_progress(*search, start, done=True, seconds=discovery)
+        finally:
+            try:
+                self.browser.switch_to.window(search_tab)
+                self.browser.close()
             except Exception as e:
-                print(e)  # Log any exceptions encountered during the search process.
+                log.debug(f"Could not close the search tab: {e}")
+            self.browser.switch_to.window(apply_tab)
+
+        return max(0.0, budget - (time.time() - start_time))
+
+    def select_jobs(self, cards, search=None):
+        """
+        Picks the jobs to apply to from the job cards of a results page (see `harvest_job_cards`).
+
+        Skips (and dismisses) jobs that were already applied to, blacklisted companies and titles, promoted
+        cards, jobs processed before and jobs without Easy Apply. All filtering runs locally; the browser is
+        only touched for dismiss clicks.
+
+        With the job queue, every card is recorded as `discovered` and then moved to `filtered` or `skipped`;
+        `search` is the `(position, location, start)` of the page.
+
+        **Returns**:
+        - `dict`: The selected job IDs as keys, in page order.
+        """
+        jobIDs = {}  # Dictionary to store job IDs for processing.
+        skipped = {}  # Reason each rejected job was skipped, for the job queue
+
+        for card in cards:
+            # If the job has been applied, dismiss it and skip to the next.
+            if card["applied"]:
+                log.debug(f"Job already applied: {card['text']}")
+                self.dismiss_job_card(card["id"])
+                skipped[card["id"]] = "already applied"
+                continue
+
+            # Add the job's ID to the list of `jobIDs`. If ALL are True:
+            # 1) The job title is NOT blacklisted.
+            # 2) If the company of the job is not blacklisted
+            banned_word = self.banned.card(card)
+            if banned_word:
+                log.debug(f"Job has a banned word: {banned_word}\nDetails: {card['text']}")
+                skipped[card["id"]] = f"banned word: {banned_word}"
+                continue
+
+            jobID = card["id"]
+            # Promoted listings are ads that don't fit the current query
+            if card.get("promoted"):
+                log.debug(f"Promoted job, skipping: {card['text']}")
+                skipped[jobID] = "promoted"
+                continue
+            if not jobID.isdigit():
+                log.debug(f"Job ID not found, skipping: {card['text']}")
+                continue
+
+            # Ensure the job ID is unique before adding it for processing.
+            if jobID in self.visited_IDs:
+                log.debug(f"Job {jobID} was already processed, skipping")
+                skipped[jobID] = "processed before"
+            elif card["easy_apply"]:
+                jobIDs[jobID] = True
+            else:
+                skipped[jobID] = "no Easy Apply"
+
+        if self.job_queue and search:
+            # Promoted cards have no usable job ID and are not recorded
+            found = [card["id"] for card in cards if card["id"].isdigit()]
+            self.job_queue.discovered(found, *search)
+            # Only jobs seen for the first time are moved; jobs from earlier searches keep their state and outcome
+            self.job_queue.set_state(list(jobIDs), "filtered", only_from=("discovered",))
+            for reason in set(skipped.values()):
+                self.job_queue.set_state([job for job, why in skipped.items() if why == reason and job.isdigit()], "skipped", reason,
+                                         only_from=("discovered",))
+        return jobIDs
+
+    def search_pages(self, position, location, start=0):
+        """
+        Walks the result pages of a search, `JOBS_PER_PAGE` jobs at a time.
+
+        **Yields**:
+        - `tuple`: `(start, cards)`, the offset of the page and its job cards (see `harvest_job_cards`), beginning
+          with the page at result `start`.
+
+        **Stops**:
+        - On a page without job cards (past the last page), or after the last page as `last_results_page()`
+          tells it from the pager or the job placeholders (never from the cards rendered, which depend on scrolling).
+        - When a page repeats the job cards of the previous one (LinkedIn serves its last page again when
+          `start` goes past the results it is willing to show).
+        """
+        previous_ids = None
+        while True:
+            self.browser, next_start = self.next_jobs_page(position, location, start, experience_level=self.experience_level, time_filter=self.time_filter)
+            # `next_jobs_page` already scrolled the results until no more cards were loading.
+            # Harvest every job card on the page with a single script call.
+            cards = self.harvest_job_cards()
+            ids = [card["id"] for card in cards]
+
+            if not cards:
+                log.info(f"No job cards from result {start} on, end of the search")
+                return
+            if ids == previous_ids:
+                log.info(f"Results from {start} repeat the previous page, end of the search")
+                return
+
+            # Checked before the jobs are opened, which may navigate away from the results
+            last_page = self.last_results_page()
+            yield start, cards
+
+            if last_page:
+                log.info(f"Last page of the search (results from {start})")
+                return
+            previous_ids = ids
+            start = next_start
+
+    def new_job_ids(self, cards, seen):
+        """
+        Returns the job IDs of `cards` that are new to the bot: not processed before and not on an earlier page of
+        the search (`seen`, which is updated). Promoted cards without a job ID don't count.
+        """
+        ids = [card["id"] for card in cards if card["id"].isdigit() and card["id"] not in seen]
+        seen.update(ids)
+        return self.visited_IDs.unseen(ids)
+
+    def last_results_page(self):
+        """
+        Tells whether the results page in the browser is the last one of the search, in one script call.
+
+        **How It Works**:
+        - The pager decides when the page has one: a disabled "Next" button, a "Page X of Y" with
+          X = Y, or the last page number being the active one.
+        - Without a pager, the `data-occludable-job-id` placeholders are counted. LinkedIn renders one for every
+          job of the page up front and fills in the cards while the list is scrolled, so fewer than
+          `JOBS_PER_PAGE` placeholders means the last page, however many cards were rendered.
+        - When neither is found it returns `False`; `search_pages` then stops on an empty or repeated page.
+        """
+        script = """
+            const pager = document.querySelector(".jobs-search-pagination, .artdeco-pagination");
+            const placeholders = document.querySelectorAll("[data-occludable-job-id]").length;
+            if (!pager) return {pager: null, placeholders: placeholders};
+            const state = pager.querySelector(".jobs-search-pagination__page-state");
+            const pages = state && state.textContent.match(/(\\d+)\\D+(\\d+)/);
+            if (pages) return {pager: +pages[1] >= +pages[2] ? "last" : "more", placeholders: placeholders};
+            const next = pager.querySelector(".jobs-search-pagination__button--next, .artdeco-pagination__button--next");
+            if (next) return {pager: next.disabled ? "last" : "more", placeholders: placeholders};
+            const numbers = pager.querySelectorAll("li[data-test-pagination-page-btn], .artdeco-pagination__indicator--number");
+            if (numbers.length) {
+                const current = numbers[numbers.length - 1];
+                return {pager: current.matches(".active, .selected") ? "last" : "more", placeholders: placeholders};
+            }
+            return {pager: null, placeholders: placeholders};
+        """
+        try:
+            info = self.browser.execute_script(script) or {}
+        except Exception as e:
+            log.debug(f"Could not read the pager: {e}")
+            return False
+        if info.get("pager"):
+            return info["pager"] == "last"
+        return 0 < info.get("placeholders", 0) < self.JOBS_PER_PAGE
+
+    @timed_span("harvest_job_cards")
+    def harvest_job_cards(self):
+        """
+        Reads every job card on the search results page in a single `execute_script` round trip.
+
+        **Returns**:
+        - `list[dict]`: One descriptor per card (matching `self.locator["links"]`) with the keys:
+            - `id` (str): The `data-job-id` attribute, empty if missing.
+            - `title` (str) and `company` (str): Text of the card's title and company lines, if found.
+            - `text` (str): The card's full visible text, used for blacklist checks.
+            - `easy_apply` (bool): Whether the card advertises "Easy Apply".
+            - `applied` (bool): Whether the visible footer says "Applied".
+            - `promoted` (bool): Whether the card is a "Promoted" listing.
+
+        **Notes**:
+        - Before this, every card cost a `find_element`, an `is_displayed`, a `get_attribute` and one
+          `.text` call per blacklisted word, i.e. hundreds of WebDriver calls per page.
+        """
+        script = """
+            const snapshot = document.evaluate(arguments[0], document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const textOf = (card, selector) => {
+                const element = card.querySelector(selector);
+                return element ? element.innerText.trim() : "";
+            };
+            const cards = [];
+            for (let i = 0; i < snapshot.snapshotLength; i++) {
+                const card = snapshot.snapshotItem(i);
+                const text = card.innerText || "";
+                const applied = Array.from(card.querySelectorAll("div ul li.job-card-container__footer-job-state"))
+                    .some(li => li.textContent.trim() === "Applied" && li.getClientRects().length > 0);
+                cards.push({
+                    id: card.getAttribute("data-job-id") || "",
+                    title: textOf(card, ".job-card-list__title, .job-card-list__title--link, .job-card-container__link"),
+                    company: textOf(card, ".artdeco-entity-lockup__subtitle, .job-card-container__primary-description, .job-card-container__company-name"),
+                    text: text,
+                    easy_apply: text.includes("Easy Apply"),
+                    applied: applied,
+                    promoted: /\\bPromoted\\b/.test(text)
+                });
+            }
+            return cards;
+        """
+        try:
+            return self.browser.execute_script(script, self.locator["links"][1]) or []
+        except Exception as e:
+            log.error(f"Failed to read job cards: {e}")
+            return []
+
+    def dismiss_job_card(self, jobID):
+        """Clicks the "Dismiss" button of the job card with the given ID (one lookup, one click)."""
+        button = self.get_child((By.XPATH, f'//div[@data-job-id="{jobID}"]' + self.locator["dismiss_button"][1][1:]))
+        if button:
+            try:
+                self.clickjs(button)
+            except Exception as e:
+                log.debug(f"Could not dismiss job {jobID}: {e}")
 
     def apply_loop(self, jobIDs):
         """
@@ -616,7 +2616,7 @@ class EasyApplyBot:
         - **Applies to Each Job**:
         - Calls the `apply_to_job()` method for each job ID, which handles the individual application process.
         - **Tracks Visited Jobs**:
-        - Updates the `visited_IDs` dictionary to keep track of jobs that have already been processed, preventing redundant applications.
+        - Updates the `visited_IDs` index (a `JobIndex` persisted on disk) to keep track of jobs that have already been processed, preventing redundant applications across runs.
 
         **Parameters**:
         - `jobIDs` (list): A list of unique job identifiers (strings or integers) that the bot will apply to.
@@ -625,7 +2625,9 @@ class EasyApplyBot:
         1. Logs the start of the `apply_loop()` process for debugging.
         2. Iterates over each job ID in the input list.
         3. Calls the `apply_to_job(jobID)` method for each ID to perform the application.
-        4. Marks the job as visited by setting `self.visited_IDs[jobID] = True`.
+        4. Marks the job as visited with `self.visited_IDs.add(jobID)` as soon as it finishes.
+        5. With the job queue, records the job as `applying` before and `applied` or `failed` after the attempt.
+           A job stuck behind a security checkpoint is recorded as `deferred` and not marked as visited.
 
         **Example**:
         ```python
@@ -640,15 +2642,46 @@ class EasyApplyBot:
 
         **Notes**:
         - Relies on the `apply_to_job()` method for the actual application logic.
-        - The `visited_IDs` dictionary must be maintained throughout the session to ensure proper tracking.
+        - Known job IDs are dropped before any navigation, so already processed jobs cost no page loads.
         """
         log.debug("In `apply_loop()`")
-        for jobID in jobIDs:
-            if jobID not in self.visited_IDs:
-                self.apply_to_job(jobID)
-                self.visited_IDs[jobID] = True
+        self.left_results = False  # A new batch comes from the results in the browser
+        for jobID in self.visited_IDs.unseen(jobIDs):
+            # In worker pool mode, another browser may already be applying to this job
+            if not self.claim_job(jobID):
+                log.debug(f"Job {jobID} was claimed by another worker, skipping")
+                continue
+            if self.job_queue:
+                self.job_queue.set_state([jobID], "applying")
+            with self.pace.scope("job"):
+                result = self.apply_to_job(jobID)
+            if result is None:
+                # Stuck at a security checkpoint: not processed, so it is tried again later (`--resume`)
+                if self.job_queue:
+                    self.job_queue.set_state([jobID], "deferred", "security checkpoint")
+            else:
+                self.visited_IDs.add(jobID)
+                if self.job_queue:
+                    self.job_queue.set_state([jobID], "applied" if result else "failed")
+            if self.profiler:
+                self.profiler.job_report(jobID)
 
 
+    def claim_job(self, jobID):
+        """
+        Reserves a job ID for this browser session. Returns False if another worker of the worker pool
+        already claimed it. Always True when the bot runs on its own.
+        """
+        if self.claims is None:
+            return True
+        claimed, lock = self.claims
+        with lock:
+            if jobID in claimed:
+                return False
+            claimed[jobID] = os.getpid()
+            return True
+
+    @timed_span("apply_to_job")
     def apply_to_job(self, jobID):
         """
         Applies to a job using the provided job ID by interacting with the job page and handling the Easy Apply process.
@@ -657,8 +2690,12 @@ class EasyApplyBot:
             jobID (str): The unique identifier for the job being applied to.
 
         Workflow:
-            - Navigates to the job page using the provided job ID.
-            - Checks if the job page contains an Easy Apply button.
+            - Opens the job: in the detail pane of the search results with `pane_navigation`, otherwise (or if
+              its card isn't on the page) by navigating to the job page.
+            - Waits for the job page to show its state (`probe_job_page`): Easy Apply, already applied,
+              external apply only, closed or a security checkpoint, whichever comes first.
+            - At a security checkpoint, waits `LOGIN_TIMEOUT` seconds for the user to solve it, then loads the job
+              again. If the checkpoint stays, the job is left for later.
             - Skips applying if any blacklisted keywords are found in the job title.
             - If the Easy Apply button is present, it clicks the button and proceeds with filling out the application form.
             - Sends the resume and logs the result of the application (success or failure).
@@ -666,47 +2703,53 @@ class EasyApplyBot:
             - Logs the outcome of the job application and writes the result to a file for future reference.
 
         Returns:
-            result (bool): True if the application was successfully submitted, False otherwise.
+            result (bool or None): True if the application was successfully submitted, False otherwise, and None
+            if a security checkpoint kept the job from being checked (it is then neither visited nor written to file).
         """
-        # Navigate to the job page using the job ID.
-        self.get_job_page(jobID)
+        # Open the job (in the detail pane or on its own page). Title, company and posted date all come from this one model.
+        page = self.open_job(jobID)
 
-        time.sleep(random.uniform(5, 10))
+        # Wait for whichever state the job page settles in first: Easy Apply, applied, external, closed, ...
+        probe = self.probe_job_page()
+
+        # LinkedIn wants the login or a security check confirmed; give the user time to do it in the browser,
+        # then load the job again. A job still behind the checkpoint is deferred, not counted as processed.
+        if probe["state"] == "checkpoint":
+            log.warning(f"Security checkpoint on job {jobID}, waiting up to {self.LOGIN_TIMEOUT}s for it to be solved")
+            try:
+                WebDriverWait(self.browser, self.LOGIN_TIMEOUT, poll_frequency=1).until(lambda _: self.is_logged_in())
+            except TimeoutException:
+                log.warning(f"Still at the security checkpoint, deferring job {jobID}")
+                return None
+            page = self.get_job_page(jobID)
+            probe = self.probe_job_page()
+            if probe["state"] == "checkpoint":
+                log.warning(f"Security checkpoint again on job {jobID}, deferring it")
+                return None
+        button = probe["button"] or False
 
-        # Try to find the Easy Apply button on the job page.
-        button = self.get_easy_apply_button()
-    
         if button is not False:
             # Skip job if the title contains blacklisted keywords.
-            if any(word in self.browser.title for word in blackListTitles):
+            if self.banned.title(page.title):
                 log.info('Skipping this application, a blacklisted keyword was found in the job position')
                 string_easy = "~ Contains blacklisted keyword"
                 result = False
             else:
-                job_element = self.get_child(self.locator["job_title"])
-                if job_element:
-                    job_title = job_element.text
-                else:
-                    job_title = "No title available"
-                    
-                company_element = self.get_child(self.locator["company_name"])
-                if company_element:
-                    company_name = company_element.text
-                else:
-                    company_name = "No title available"
-
-                posted_date = date.today().strftime("%m/%d/%Y")
-                # posted_date = today.
+                job_title = page.title or "No title available"
+                company_name = page.company or "No title available"
+                posted_date = page.posted.strftime("%m/%d/%Y")
                 # Easy Apply button is available, so click it to proceed.
                 string_easy = "~ Has Easy Apply Button. Clicking now!"
+                # The time a person takes to read the job before applying; jobs without Easy Apply skip it
+                self.pace.sleep(5, 10, "job page")
                 self.clickjs(button)
 
                 # Fill out the necessary fields on the Easy Apply form.
-                time.sleep(random.uniform(1, 2.0))
+                self.pace.sleep(1, 2.0, "easy apply")
 
                 self.fill_out_fields()
 
-                time.sleep(random.uniform(0.5, 2.0))
+                self.pace.sleep(0.5, 2.0, "easy apply")
                 
                 # Send the resume and determine if the application was successful.
                 result: bool = self.send_resume()
@@ -717,154 +2760,365 @@ class EasyApplyBot:
                     string_easy = "~ Did not apply: Failed to send Resume"
 
         # Handle case where the job has already been applied to.
-        elif "You applied on" in self.browser.page_source:
+        elif probe["state"] == "applied":
             string_easy = "~ Already Applied"
             result = False
+        elif probe["state"] == "closed":
+            string_easy = "~ No longer accepting applications"
+            result = False
         # Handle case where no Easy Apply button exists.
         else:
             string_easy = "~ Doesn't have Easy Apply Button"
             result = False
 
         # Log the result of the job application and write to a file for tracking.
-        log.info(f"\nPosition {jobID}:\n {self.browser.title} \n {string_easy} \n")
-        self.write_to_file(button, jobID, self.browser.title, result)
+        log.info(f"\nPosition {jobID}:\n {page.browser_title} \n {string_easy} \n")
+        self.write_to_file(button, jobID, page, result)
 
         return result
 
-    def get_job_page(self, jobID):
+    def open_job(self, jobID):
+        """
+        Shows a job and returns its `JobPage`: in the detail pane of the search results with `pane_navigation`,
+        falling back to the job page when the pane can't show it (e.g. pending jobs of a resumed run).
+        Once a job page was loaded the results are gone, so the rest of the batch (`apply_loop`) uses job pages too.
+        """
+        if self.pane_navigation and not self.left_results:
+            self.record_network("job pane")
+            opened, title = self.open_job_pane(jobID)
+            if opened:
+                self.job_page = JobPage(self.browser, jobID, title=title)
+                return self.job_page
+            log.info(f"Job {jobID} is not in the results pane, loading job pages for the rest of this batch")
+        return self.get_job_page(jobID)
+
+    # Seconds to wait for the detail pane to show a job after its card was clicked
+    PANE_TIMEOUT = 15
+
+    @timed_span("open_job_pane")
+    def open_job_pane(self, jobID, timeout=None):
+        """
+        Opens a job in the detail pane of the search results by clicking its card, without leaving the page.
+
+        **Purpose**:
+        Loading `/jobs/view/<id>` for every job is a full navigation, and the search results have to be loaded
+        again afterwards. LinkedIn shows the same top card, description and Easy Apply button in the detail pane
+        next to the results, loaded in place (single-page-app navigation). The results stay loaded and scrolled.
+
+        **How It Works** (one asynchronous script call):
+        - Closes a dialog left open by the previous job (the "application was sent" confirmation, or an
+          unfinished Easy Apply modal, whose "Discard" confirmation is accepted).
+        - Scrolls the job card into view and clicks its title link.
+        - Waits (`MutationObserver`, up to `timeout` seconds, defaults to `PANE_TIMEOUT`) until the top card
+          of the pane links to the job.
+
+        **Returns**:
+        - `tuple`: `(opened, title)`. `opened` is True if the pane shows the job; False if the card isn't on the
+          page or the pane didn't switch in time (the caller then loads the job page). `title` is the job's
+          "<title> | <company> | LinkedIn" line read from the pane, as the job page's document title would be.
+        """
+        timeout = self.PANE_TIMEOUT if timeout is None else timeout
+        script = """
+            const [jobId, topCardSelector, titleSelector, companySelector, timeoutMs] = arguments;
+            const done = arguments[arguments.length - 1];
+            const start = Date.now();
+            const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+            const shows = () => {
+                const card = document.querySelector(topCardSelector);
+                return !!(card && card.querySelector('a[href*="/jobs/view/' + jobId + '"]'));
+            };
+            // The document keeps the title of the search, so the job's title line comes from the pane
+            const opened = () => {
+                const card = document.querySelector(topCardSelector);
+                const text = selector => { const element = card.querySelector(selector); return element ? element.innerText.trim() : ""; };
+                return {opened: true, title: [text(titleSelector), text(companySelector), "LinkedIn"].join(" | ")};
+            };
+
+            (async () => {
+                // A dialog of the previous job would catch the click
+                for (let i = 0; i < 3 && document.querySelector("[role='dialog']"); i++) {
+                    const discard = Array.from(document.querySelectorAll("[role='alertdialog'] button, [role='dialog'] button"))
+                        .find(b => b.getAttribute("data-control-name") === "discard_application_confirm_btn" || /^discard$/i.test(b.innerText.trim()));
+                    const dismiss = document.querySelector("[role='dialog'] button[aria-label^='Dismiss']");
+                    if (discard) discard.click(); else if (dismiss) dismiss.click(); else break;
+                    await sleep(300);
+                }
+
+                const card = document.querySelector('[data-job-id="' + jobId + '"]');
+                if (!card) return {opened: false, reason: "no card"};
+                if (shows()) return opened();
+                card.scrollIntoView({block: "center"});
+                (card.querySelector("a.job-card-list__title, a.job-card-container__link, a[href*='/jobs/view/']") || card).click();
+
+                while (Date.now() - start < timeoutMs) {
+                    if (shows()) return opened();
+                    await new Promise(resolve => {
+                        const observer = new MutationObserver(() => { observer.disconnect(); resolve(); });
+                        observer.observe(document.body, {childList: true, subtree: true});
+                        setTimeout(() => { observer.disconnect(); resolve(); }, 250);
+                    });
+                }
+                return shows() ? opened() : {opened: false, reason: "timeout"};
+            })().then(done, error => done({opened: false, reason: String(error)}));
+        """
+        try:
+            self.browser.set_script_timeout(timeout + 10)
+            result = self.browser.execute_async_script(script, str(jobID), JobPage.TOP_CARD, JobPage.TITLE,
+                                                       JobPage.COMPANY, int(timeout * 1000)) or {}
+        except Exception as e:
+            result = {"opened": False, "reason": str(e)}
+        if not result.get("opened"):
+            log.debug(f"Could not open job {jobID} in the detail pane ({result.get('reason')}), loading its page")
+        return bool(result.get("opened")), result.get("title")
 
-        job: str = 'https://www.linkedin.com/jobs/view/' + str(jobID)
+    @timed_span("get_job_page")
+    def get_job_page(self, jobID):
+        """Opens the page of a job and returns its `JobPage`, which reads the page only when asked."""
+        job: str = self.base_url + '/jobs/view/' + str(jobID)
+        self.record_network("job")
         self.browser.get(job)
-        self.job_page = self.load_page(sleep=0.5)
+        self.left_results = True  # The detail pane is gone with the results, until the next batch
+        # Job pages don't load content on scroll, so the results loader is not used here
+        self.job_page = JobPage(self.browser, jobID)
 
         return self.job_page
 
-    def load_page(self, sleep=1):
+    @timed_span("load_page")
+    def load_page(self, quiet_period=None, timeout=None, background=False):
         """
-        Scrolls through a webpage to load all dynamic content and retrieves the page's HTML.
+        Scrolls the job search results until no more job cards are being loaded, then returns.
 
         **Purpose**:
-        This method ensures that all dynamically loaded content on a webpage is fully visible and accessible by simulating user scrolling. Many modern web pages load content dynamically as users scroll, so this function is essential for extracting complete data using web scraping tools like BeautifulSoup.
+        LinkedIn loads search results as the results list is scrolled. The old loader always scrolled to
+        4000px in 500px steps with a 0.5-2s sleep per step (~10 seconds per call), whether content was
+        still loading or not. This loader stops as soon as the page is stable.
 
         **Functionality**:
-        - **Scrolls Down the Page**:
-        - Simulates scrolling by incrementally moving down the webpage in steps of 500 pixels.
-        - Repeats this process until the maximum scroll height (4000 pixels) is reached.
-        - **Pauses Between Scrolls**:
-        - Introduces a delay (default 1 second) between scrolls to mimic human interaction and allow content to load.
-        - **Resets to the Top**:
-        - Scrolls back to the top of the page after completing the downward scroll.
-        - **Retrieves Page Source**:
-        - Extracts the current state of the page's HTML source using Selenium and parses it with BeautifulSoup.
+        - Runs as a single asynchronous script in the page (one WebDriver round trip).
+        - Finds the scrollable container of the job cards (falls back to the window) and scrolls it down step by step.
+        - The job-card count and the scroll height, polled every 100ms, tell whether content is still arriving. (Other
+          DOM changes, e.g. impression trackers, ads and lazy images, are ignored: they never stop.)
+        - Returns once the bottom is reached and nothing has changed for `quiet_period` seconds, or after `timeout` seconds.
+        - Scrolls back to the top before returning.
 
         **Parameters**:
-        - `sleep` (int, optional): The number of seconds to pause between scroll steps. Default is 1 second.
+        - `quiet_period` (float, optional): Seconds without changes before the page counts as stable. Defaults to `SCROLL_QUIET_PERIOD`.
+        - `timeout` (float, optional): Upper bound in seconds. Defaults to `SCROLL_TIMEOUT`.
+        - `background` (bool, optional): Starts the loader and returns at once; the result is picked up later with
+          `collect_page_load()`. Used by the pipelined mode to load the search tab while the other tab applies.
 
         **Returns**:
-        - `page` (BeautifulSoup object): A parsed HTML representation of the webpage's current state.
-
-        **Example**:
-        ```python
-        page_content = bot.load_page(sleep=2)
-        print(page_content.prettify())
-        ```
-
-        **Why This Method is Important**:
-        - **Handles Infinite Scrolling**: Essential for scraping sites that load content dynamically as the user scrolls (e.g., job boards, social media feeds).
-        - **Ensures Complete Data**: Helps retrieve the full page content, which might not be available if the user only loads the top section.
-        - **Enhances Scraping Accuracy**: By using BeautifulSoup on the fully loaded page, it ensures no content is missed.
+        - `dict`: `cards` (job cards on the page), `height` (scroll height), `seconds` (time spent) and `timed_out`.
+          `None` when `background` is set.
 
         **Notes**:
-        - The maximum scroll height (`4000`) and step size (`500`) can be adjusted based on the webpage's structure and behavior.
-        - Increasing the `sleep` time may help with slower-loading pages and/or reduce the risk of being flagged as a bot.
+        - Only used for search result pages. Job detail pages don't need scrolling.
+        - Every call is recorded in `self.scroll_stats`; `scroll_report()` logs how much time was saved
+          compared to the fixed loop (`LEGACY_LOAD_SECONDS` per call).
         """
-        scroll_page = 0
-        while scroll_page < 4000:
-            self.browser.execute_script("window.scrollTo(0," + str(scroll_page) + " );")
-            scroll_page += 500 + random.uniform(0.5, 5.0)
-            time.sleep(random.uniform(0.5, 2.0))
+        quiet_period = self.SCROLL_QUIET_PERIOD if quiet_period is None else quiet_period
+        timeout = self.SCROLL_TIMEOUT if timeout is None else timeout
+
+        script = """
+            const [cardsXpath, quietMs, timeoutMs, stepPx] = arguments;
+            // Called asynchronously, the result goes to WebDriver; in the background it is left in the page
+            const callback = arguments[arguments.length - 1];
+            const done = typeof callback === "function" ? callback : result => { window.__easyApplyLoad = result; };
+            window.__easyApplyLoad = null;
+            const countCards = () => document.evaluate("count(" + cardsXpath + ")", document, null,
+                XPathResult.NUMBER_TYPE, null).numberValue;
+
+            // The results list scrolls inside its own container; find the first scrollable ancestor of a card
+            let scroller = null;
+            const firstCard = document.evaluate(cardsXpath, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            for (let node = firstCard && firstCard.parentElement; node; node = node.parentElement) {
+                const overflow = getComputedStyle(node).overflowY;
+                if ((overflow === "auto" || overflow === "scroll") && node.scrollHeight > node.clientHeight) {
+                    scroller = node;
+                    break;
+                }
+            }
+            scroller = scroller || document.scrollingElement || document.documentElement;
+
+            const start = Date.now();
+            // Only new job cards or a taller list count as changes; impression trackers, ads and lazy images
+            // mutate the list all the time and would keep it from ever becoming quiet
+            let lastChange = start, lastCount = countCards(), lastHeight = scroller.scrollHeight;
+
+            const tick = () => {
+                const cards = countCards(), height = scroller.scrollHeight, now = Date.now();
+                if (cards !== lastCount || height !== lastHeight) {
+                    lastCount = cards;
+                    lastHeight = height;
+                    lastChange = now;
+                }
+                const atBottom = scroller.scrollTop + scroller.clientHeight >= height - 2;
+                if (!atBottom) {
+                    scroller.scrollTop += stepPx;
+                    window.scrollBy(0, stepPx);
+                }
+                const timedOut = now - start >= timeoutMs;
+                if ((atBottom && now - lastChange >= quietMs) || timedOut) {
+                    scroller.scrollTop = 0;
+                    window.scrollTo(0, 0);
+                    done({cards: cards, height: height, timed_out: timedOut, seconds: (now - start) / 1000});
+                } else {
+                    setTimeout(tick, 100);
+                }
+            };
+            tick();
+        """
+        if background:
+            try:
+                self.browser.execute_script(script, self.locator["links"][1], int(quiet_period * 1000),
+                                            int(timeout * 1000), 500, None)
+            except Exception as e:
+                log.error(f"Failed to start loading the page: {e}")
+            return None
 
-        self.browser.execute_script("window.scrollTo(0,0);")
+        start = time.time()
+        try:
+            self.browser.set_script_timeout(timeout + 10)
+            result = self.browser.execute_async_script(
+                script, self.locator["links"][1], int(quiet_period * 1000), int(timeout * 1000), 500
+            ) or {}
+        except Exception as e:
+            log.error(f"Failed to load the page: {e}")
+            result = {"cards": 0, "height": 0, "timed_out": True}
+        result["seconds"] = time.time() - start
+
+        self.scroll_stats["pages"] += 1
+        self.scroll_stats["seconds"] += result["seconds"]
+        log.debug(f"Page stable after {result['seconds']:.1f}s with {result.get('cards')} job cards "
+                  f"(fixed scroll loop: ~{self.LEGACY_LOAD_SECONDS}s)")
+        return result
 
-        page = BeautifulSoup(self.browser.page_source, "lxml")
-        return page
+    def collect_page_load(self, timeout=None):
+        """
+        Waits for a loader started with `load_page(background=True)` in the current tab and returns its result
+        (see `load_page`), or `None` if it did not finish within `timeout` seconds (default: `SCROLL_TIMEOUT`).
+        """
+        timeout = self.SCROLL_TIMEOUT if timeout is None else timeout
+        try:
+            result = WebDriverWait(self.browser, timeout, poll_frequency=0.2).until(
+                lambda driver: driver.execute_script("return window.__easyApplyLoad || null;"))
+        except TimeoutException:
+            return None
+        self.scroll_stats["pages"] += 1
+        self.scroll_stats["seconds"] += result.get("seconds", 0)
+        return result
 
-    def get_easy_apply_button(self):
+    def scroll_report(self):
         """
-        Identifies and retrieves the "Easy Apply" button from a LinkedIn job listing page.
+        Logs how much time the results loader spent, and an estimate of the time saved compared to the fixed
+        scroll loop. The estimate assumes `LEGACY_LOAD_SECONDS` per page for the old loop (its average sleep
+        time, not a measurement); it is not a benchmark.
+        """
+        pages = self.scroll_stats["pages"]
+        if not pages:
+            return
+        spent = self.scroll_stats["seconds"]
+        saved = pages * self.LEGACY_LOAD_SECONDS - spent
+        log.info(f"Loaded {pages} result pages in {spent:.1f}s ({spent / pages:.1f}s per page; estimated "
+                 f"{saved / pages:.1f}s per page saved, assuming ~{self.LEGACY_LOAD_SECONDS}s per page for the fixed scroll loop)")
+
+    # Upper bound in seconds for a job page to show one of its terminal states (see `probe_job_page`)
+    JOB_PAGE_TIMEOUT = 30
+
+    @timed_span("probe_job_page")
+    def probe_job_page(self, timeout=None):
+        """
+        Waits for the job page to settle into one of its terminal states and reports which one, in a single
+        asynchronous script call.
 
         **Purpose**:
-        This method is crucial for automating job applications on LinkedIn, specifically targeting positions with the "Easy Apply" feature. It searches for buttons labeled "Easy Apply," ensuring the automation interacts with the correct UI element.
-
-        **Functionality**:
-        - **Waits for Buttons to Load**:
-        - Uses `WebDriverWait` to wait up to 30 seconds for the presence of elements matching the locator for "Easy Apply" buttons.
-        - **Retrieves and Normalizes Button Text**:
-        - Extracts the text content of each button and normalizes it to lowercase with extra whitespace removed for accurate comparison.
-        - **Identifies the Correct Button**:
-        - Checks for the presence of the phrase "easy apply" in the button's normalized text.
-        - Returns the first matching button.
+        `apply_to_job` used to sleep 5-10 seconds, then wait up to 30 seconds for an Easy Apply button, and only
+        then read the whole `page_source` to see whether the job was already applied to. Every job without
+        Easy Apply paid the full wait. This races all states in the page and returns as soon as one shows up.
+
+        **States**:
+        - `easy_apply`: A visible Easy Apply button (`self.locator["easy_apply_button"]`) is shown.
+        - `applied`: The page says "You applied on ..." (or shows the post-apply timeline).
+        - `external`: Only an "Apply" button that leads to the company website.
+        - `closed`: "No longer accepting applications", or another apply error.
+        - `checkpoint`: LinkedIn redirected to a login, auth wall or security checkpoint page.
+        - `timeout`: None of the above within `timeout` seconds (defaults to `JOB_PAGE_TIMEOUT`).
 
-        **Parameters**:
-        - None.
+        **How It Works**:
+        - The states are checked once right away, then again after every DOM change (`MutationObserver`,
+          throttled to one check per 50ms) and on a 250ms timer.
+        - Text checks only read the job top card (the body if there is none), not the whole page.
 
         **Returns**:
-        - `EasyApplyButton` (WebElement or bool): The identified "Easy Apply" button if found, otherwise `False`.
-
-        **Example**:
-        ```python
-        easy_apply_button = bot.get_easy_apply_button()
-        if easy_apply_button:
-            easy_apply_button.click()
-        else:
-            print("Easy Apply button not found.")
-        ```
-
-        **Why This Method is Important**:
-        - **Automates Job Applications**: Identifies the specific button required to proceed with automated applications on LinkedIn.
-        - **Handles Dynamic Content**: Waits for dynamic loading of buttons, a common behavior on modern web pages.
-        - **Reduces Errors**: Ensures the automation script interacts only with the relevant "Easy Apply" button, avoiding unintended actions.
-
-        **Error Handling**:
-        - Logs detailed errors if the button cannot be found within the timeout period.
-        - Captures and prints debugging information, such as raw and normalized button text, for troubleshooting.
-
-        **Notes**:
-        - This method assumes the locator for "Easy Apply" buttons is stored in `self.locator["easy_apply_button"]`.
-        - Adjustments to the timeout duration may be necessary for slower-loading pages.
-        - Multiple matching buttons are possible; this method returns the first match.
+        - `dict`: `state` (str, see above), `button` (the Easy Apply WebElement, or None) and `seconds`
+          (time until the state was known).
+        """
+        timeout = self.JOB_PAGE_TIMEOUT if timeout is None else timeout
+        script = """
+            const [easyApplyXpath, topCardSelector, timeoutMs] = arguments;
+            const done = arguments[arguments.length - 1];
+            const start = Date.now();
+            const visible = element => element.getClientRects().length > 0;
+
+            const probe = () => {
+                if (/\\/(login|authwall|checkpoint|uas)\\b/.test(location.pathname)) return {state: "checkpoint", button: null};
+                const buttons = document.evaluate(easyApplyXpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                for (let i = 0; i < buttons.snapshotLength; i++) {
+                    const button = buttons.snapshotItem(i);
+                    if (visible(button) && /easy apply/i.test(button.innerText.replace(/\\s+/g, " "))) {
+                        return {state: "easy_apply", button: button};
+                    }
+                }
+                const card = document.querySelector(topCardSelector) || document.body;
+                if (!card) return null;
+                const text = card.innerText || "";
+                if (card.querySelector(".post-apply-timeline") || /You applied on/i.test(text)) return {state: "applied", button: null};
+                if (card.querySelector(".jobs-details-top-card__apply-error") || /No longer accepting applications/i.test(text)) {
+                    return {state: "closed", button: null};
+                }
+                const apply = Array.from(card.querySelectorAll(".jobs-apply-button, .jobs-s-apply button")).filter(visible);
+                if (apply.length && !apply.some(b => /easy apply/i.test(b.innerText))) return {state: "external", button: null};
+                return null;
+            };
+
+            let finished = false, scheduled = false, timer = null, observer = null;
+            const finish = result => {
+                if (finished) return;
+                finished = true;
+                if (observer) observer.disconnect();
+                clearInterval(timer);
+                result.seconds = (Date.now() - start) / 1000;
+                done(result);
+            };
+            const check = () => {
+                scheduled = false;
+                const result = probe();
+                if (result) finish(result);
+                else if (Date.now() - start >= timeoutMs) finish({state: "timeout", button: null});
+            };
+
+            check();
+            if (!finished) {
+                observer = new MutationObserver(() => {
+                    if (!scheduled) { scheduled = true; setTimeout(check, 50); }
+                });
+                observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+                timer = setInterval(check, 250);
+            }
         """
-        EasyApplyButton = False
         try:
-            # Wait for up to 30 seconds for the button(s) to appear
-            WebDriverWait(self.browser, 30).until(
-                lambda _: self.get_children(self.locator["easy_apply_button"])
-            )
-            # Retrieve the buttons once they're present
-            buttons = self.get_children(self.locator["easy_apply_button"])
-            
-            for button in buttons:
-                # Capture the button text
-                button_text = button.get_attribute("innerText")
-                print(f"Raw button text: {repr(button_text)}")
-
-                # Normalize and check for a match
-                cleaned_text = " ".join(button_text.lower().split())
-                print(f"Normalized button text: {repr(cleaned_text)}")
-
-                if "easy apply" in cleaned_text:
-                    print("Found Easy Apply button!")
-                    EasyApplyButton = button
-                    break  # Exit the loop after finding the first matching button
-                else:
-                    print(f"Button text did not match: {repr(cleaned_text)}")
-
+            self.browser.set_script_timeout(timeout + 10)
+            result = self.browser.execute_async_script(script, self.locator["easy_apply_button"][1],
+                                                       JobPage.TOP_CARD, int(timeout * 1000))
         except Exception as e:
-            log.error(f"Error finding Easy Apply button: {str(e)}")
-            log.error(traceback.format_exc())
-
-        return EasyApplyButton
+            log.error(f"Failed to read the job page: {e}")
+            result = None
+        result = result or {"state": "timeout", "button": None, "seconds": timeout}
+        log.debug(f"Job page state: {result['state']} after {result['seconds']:.1f}s")
+        return result
 
+    @timed_span("fill_out_fields")
     def fill_out_fields(self):
         """
         Fills out form fields on a job application page, such as the "Mobile phone number" field.
@@ -937,7 +3191,7 @@ class EasyApplyBot:
                     field_input = self.get_child((By.TAG_NAME, "input"), field)
                     field_input.clear()
                     field_input.send_keys(self.city)
-                    time.sleep(random.uniform(0.5, 2.0))
+                    self.pace.sleep(0.5, 2.0, "autocomplete", essential=True)
                     field_input.send_keys(Keys.ARROW_DOWN)
                     field_input.send_keys(Keys.ENTER)
 
@@ -946,50 +3200,171 @@ class EasyApplyBot:
             log.error(e)
 
 
-    def send_resume(self) -> bool:
+    # Seconds to wait for the Easy Apply modal to react to an action, actions per step before giving up,
+    # and the upper bound for a whole application
+    MODAL_TRANSITION_TIMEOUT = 10
+    MODAL_STEP_ATTEMPTS = 3
+    MODAL_TIMEOUT = 300
+    # Buttons and elements of the Easy Apply modal reported by `probe_modal`
+    MODAL_CONTROLS = ["submit", "next", "continue_applying", "review", "follow", "upload_cover", "error"]
+
+    def probe_modal(self, previous=None, timeout=0):
         """
-        Attempts to submit a job application by uploading required documents and completing the application process.
+        Reports the state of the Easy Apply modal in a single script call, optionally waiting for it to change.
 
         **Purpose**:
-        This method automates the job application submission process, handling various steps such as uploading resumes 
-        and cover letters, answering additional questions, and interacting with buttons (e.g., "Submit", "Next", 
-        "Continue Applying").
-
-        **Workflow**:
-        - Checks for the presence of various elements needed for submission (e.g., upload fields, buttons).
-        - Uploads the resume and cover letter if applicable.
-        - Interacts with buttons for submission and navigation through application steps.
-        - Handles errors or prompts for additional information.
-        - Logs whether the application was successfully submitted.
-
-        **Key Functional Steps**:
-        1. **Follow Button**:
-        - Interacts with the "Follow" checkbox if present to mark the company as followed.
-        2. **Submit Button**:
-        - Attempts to submit the application by interacting with the "Submit" button.
-        3. **Error Handling**:
-        - Checks for errors during submission and handles questions or other issues dynamically.
-        - Monitors the application process for success or failure.
-        4. **Navigation Buttons**:
-        - Handles "Next", "Continue Applying", and "Review" buttons to progress through the application.
-        5. **Time Management**:
-        - Terminates the process if it exceeds a specific time limit (5 minutes).
+        `send_resume` used to sleep and then call `is_present` for up to seven locators per iteration, and
+        read the whole `page_source` to look for "application was sent". This reads everything at once.
 
         **Parameters**:
-        - None.
+        - `previous` (str, optional): The `signature` of an earlier probe. If given, the script waits in the page
+          (`MutationObserver`) until the modal no longer matches it, or until `timeout` seconds have passed.
+        - `timeout` (float, optional): Upper bound of the wait, in seconds.
 
         **Returns**:
-        - `bool`: `True` if the resume was successfully submitted, `False` otherwise.
+        - `dict` with the keys:
+            - `state` (str): `sent` (confirmation shown), `submit`, `next`, `continue_applying` or `review` (the
+              button that moves the application on), `closed` (no modal) or `unknown` (modal without a known button).
+            - `action` (WebElement or None): The button for `state`.
+            - `follow` (WebElement or None): The "Follow company" label, only while its checkbox is ticked.
+            - `cover` (WebElement or None): The cover letter upload input.
+            - `errors` (list[str]): Visible validation messages.
+            - `progress` (int or None): Progress of the application in percent.
+            - `fields` (int) and `empty` (int): Form fields of the step, and how many of them have no answer.
+            - `step` (str) and `signature` (str): Fingerprints of the step, and of the step plus its errors.
+            - `changed` (bool): Whether the modal changed from `previous` before the timeout.
+        """
+        controls = [[name, *self.locator[name]] for name in self.MODAL_CONTROLS]
+        script = """
+            const [controls, fieldsXpath, previous, timeoutMs] = arguments;
+            const done = arguments[arguments.length - 1];
+            const findAll = (by, value) => {
+                if (by === "xpath") {
+                    const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    const nodes = [];
+                    for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+                    return nodes;
+                }
+                const selector = by === "class name" ? "." + value
+                    : by === "id" ? "#" + CSS.escape(value)
+                    : by === "name" ? '[name="' + value + '"]'
+                    : value;
+                return Array.from(document.querySelectorAll(selector));
+            };
+            const visible = element => element.getClientRects().length > 0;
+
+            const probe = () => {
+                const found = {};
+                for (const [name, by, value] of controls) {
+                    // File inputs are usually hidden behind a styled button
+                    found[name] = findAll(by, value).filter(e => name === "upload_cover" || visible(e));
+                }
+                const dialog = document.querySelector("[role='dialog']");
+                const sent = /application was sent/i.test(document.body ? document.body.innerText : "");
+
+                let state = sent ? "sent" : dialog ? "unknown" : "closed";
+                let action = null;
+                if (!sent) {
+                    for (const name of ["submit", "next", "continue_applying", "review"]) {
+                        if (found[name].length) { state = name; action = found[name][0]; break; }
+                    }
+                }
+
+                const bar = (dialog || document).querySelector("progress, [role='progressbar']");
+                const progress = bar ? Math.round(Number(bar.value !== undefined ? bar.value : bar.getAttribute("aria-valuenow"))) : null;
+                const errors = found.error.map(e => e.innerText.trim()).filter(text => text);
+                const fields = findAll("xpath", fieldsXpath);
+                const empty = fields.filter(field => {
+                    const inputs = Array.from(field.querySelectorAll("input, select, textarea")).filter(i => i.type !== "hidden");
+                    const choices = inputs.filter(i => i.type === "radio" || i.type === "checkbox");
+                    if (choices.length) return !choices.some(i => i.checked);
+                    return inputs.some(i => i.tagName === "SELECT"
+                        ? i.selectedIndex < 0 || /select an option/i.test(i.options[i.selectedIndex].text)
+                        : !i.value.trim());
+                }).length;
+                const checkbox = document.getElementById("follow-company-checkbox");
+                const heading = dialog ? (dialog.querySelector("h2, h3") || {innerText: ""}).innerText.trim() : "";
+                const step = [state, progress, heading, fields.length].join("|");
+
+                return {
+                    state: state,
+                    action: action,
+                    follow: checkbox && checkbox.checked && found.follow.length ? found.follow[0] : null,
+                    cover: found.upload_cover.length ? found.upload_cover[0] : null,
+                    errors: errors,
+                    progress: progress,
+                    fields: fields.length,
+                    empty: empty,
+                    step: step,
+                    signature: step + "|" + errors.join("/")
+                };
+            };
+
+            const start = Date.now();
+            const first = probe();
+            if (previous === null || first.signature !== previous || timeoutMs <= 0) {
+                first.changed = previous !== null && first.signature !== previous;
+                done(first);
+                return;
+            }
 
-        **Why This Method is Important**:
-        - **Streamlines Automation**: Automates a multi-step process that can be repetitive and error-prone if done manually.
-        - **Handles Dynamic Scenarios**: Adapts to different application flows, including optional fields and follow-up questions.
-        - **Error Recovery**: Implements checks and fallback mechanisms for unexpected errors or incomplete submissions.
-        - **Efficiency**: Saves time by automating tasks like uploading documents, clicking buttons, and answering questions.
+            // Wait for the modal to change: check after DOM mutations, and on a timer for changes
+            // the observer can't see (e.g. the value of a progress bar)
+            let finished = false, scheduled = false, timer = null;
+            const finish = (result, changed) => {
+                if (finished) return;
+                finished = true;
+                observer.disconnect();
+                clearInterval(timer);
+                result.changed = changed;
+                done(result);
+            };
+            const check = () => {
+                scheduled = false;
+                const result = probe();
+                if (result.signature !== previous) finish(result, true);
+                else if (Date.now() - start >= timeoutMs) finish(result, false);
+            };
+            const observer = new MutationObserver(() => {
+                if (!scheduled) { scheduled = true; setTimeout(check, 50); }
+            });
+            observer.observe(document.body, {childList: true, subtree: true, attributes: true, characterData: true});
+            timer = setInterval(check, 250);
+        """
+        try:
+            self.browser.set_script_timeout(timeout + 10)
+            return self.browser.execute_async_script(script, controls, self.locator["fields"][1],
+                                                     previous, int(timeout * 1000))
+        except Exception as e:
+            log.error(f"Failed to read the Easy Apply modal: {e}")
+            return {"state": "unknown", "action": None, "follow": None, "cover": None, "errors": [],
+                    "progress": None, "fields": 0, "empty": 0, "step": "", "signature": "", "changed": False}
 
-        **Error Handling**:
-        - Logs detailed information about any exceptions that occur, including stack traces.
-        - Terminates the process gracefully if issues persist for over 5 minutes.
+    @timed_span("send_resume")
+    def send_resume(self) -> bool:
+        """
+        Walks the Easy Apply modal step by step until the application is sent.
+
+        **Purpose**:
+        Runs the modal as a state machine: detect the step (`probe_modal`, one script call), act on it, then wait
+        for the modal to change instead of sleeping a fixed time and probing every button one after another.
+
+        **Steps**:
+        - `sent`: The confirmation is shown, the application was submitted.
+        - `next`, `continue_applying`, `review`, `submit`: Answers the questions of the step if some are empty or
+          have validation errors (`process_questions`), uploads the cover letter if asked for one, unticks
+          "Follow company", then clicks the button.
+        - `closed`: No modal. After a submit this counts as submitted; otherwise the modal is waited for once,
+          up to `MODAL_TRANSITION_TIMEOUT` seconds (it may still be opening), and the attempt ends if it still isn't there.
+        - `unknown`: A modal without a known button (e.g. still loading); waits for it to change.
+
+        **Transitions**:
+        - After every action, `probe_modal` waits (up to `MODAL_TRANSITION_TIMEOUT` seconds) for the modal to change.
+        - A step that is still the same after `MODAL_STEP_ATTEMPTS` actions (e.g. errors the answers can't fix)
+          ends the attempt, and so does exceeding `MODAL_TIMEOUT` seconds in total.
+
+        **Returns**:
+        - `bool`: `True` if the application was sent, `False` otherwise.
 
         **Example Usage**:
         ```python
@@ -1001,107 +3376,234 @@ class EasyApplyBot:
         ```
 
         **Notes**:
-        - Relies on `self.is_present`, `self.get_children`, and `self.clickjs` to interact with the application page.
-        - Assumes that the locators (`self.locator`) are correctly defined and accessible.
-        - Requires `self.uploads` to contain valid paths for the resume and cover letter, if applicable.
-
-        **Improvements**:
-        - Add support for additional file uploads or field interactions as needed.
-        - Enhance error handling to retry specific steps before terminating.
-        - Include a progress tracker to log steps completed within the application process.
+        - Delays between actions go through `self.pace` ("modal step"), so the `replay` profile runs without any.
+        - Requires `self.uploads` to contain a valid path for the cover letter, if one is asked for.
         """
-
+        start_time = time.time()
         try:
-            submitted = False
-            start_time = time.time()  # Record the start time of the entire process
+            modal = self.probe_modal()
+            attempts = 0  # Actions taken on the current step without it moving on
+            submitted_clicked = False
 
-            # Loop to attempt the resume submission.
             while True:
-                time.sleep(random.uniform(0.5, 2.0))
-                
-                # Handle follow button if present.
-                if self.is_present(self.locator["follow"]):
-                    elements = self.get_children(self.locator["follow"])
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        self.clickjs(button)
-
-                # Handle submit button and complete the application.
-                if self.is_present(self.locator["submit"]):
-                    elements = self.get_children(self.locator["submit"])
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        self.clickjs(button)
-                        log.info("Application Submitted")
-                        submitted = True
-                        break
+                state = modal["state"]
+                log.debug(f"Easy Apply step: {state} ({modal['progress']}%), {modal['fields']} fields, "
+                          f"{modal['empty']} empty, errors: {modal['errors']}")
+
+                if state == "sent" or (state == "closed" and submitted_clicked):
+                    log.info("Application Submitted")
+                    return True
+                if state == "closed" and attempts >= 1:
+                    log.info("The Easy Apply modal did not open")
+                    return False
+                if attempts >= self.MODAL_STEP_ATTEMPTS:
+                    log.info(f"Easy Apply step '{state}' did not move on after {attempts} attempts, errors: {modal['errors']}")
+                    return False
+                if time.time() - start_time > self.MODAL_TIMEOUT:
+                    log.info(f"{self.MODAL_TIMEOUT / 60:.0f} minutes elapsed. Exiting the process.")
+                    return False
 
-                # Handle errors during submission.
-                elif self.is_present(self.locator["error"]):
-                    if "application was sent" in self.browser.page_source:
-                        log.info("Application Submitted")
-                        submitted = True
-                        break
-                    else:
-                        while True:
-                            log.info("Please answer the questions, waiting 2 seconds...")
+                previous = modal
+                if modal["action"] is not None:
+                    # Answer the step before moving on, if LinkedIn would reject it as it is
+                    if modal["errors"] or modal["empty"]:
+                        with self.pace.scope("form"):
                             self.process_questions()
+                    if modal["cover"] is not None and "cover_letter" in self.uploads:
+                        modal["cover"].send_keys(self.uploads["cover_letter"])
+                    # LinkedIn ticks "Follow company" by default
+                    if modal["follow"] is not None:
+                        self.clickjs(modal["follow"])
 
-                            if "application was sent" in self.browser.page_source:
-                                log.info("Application Submitted")
-                                submitted = True
-                                break
-
-                            elif self.is_present(self.locator["easy_apply_button"]):
-                                submitted = False
-                                break
+                    self.pace.sleep(0.5, 2.0, "modal step")
+                    self.clickjs(modal["action"])
+                    submitted_clicked = submitted_clicked or state == "submit"
 
-                            log.debug(f"{(time.time() - start_time) / 60} minutes elapsed")
-
-                            # Check if 5 minutes (300 seconds) have passed since the function started
-                            elapsed_time = time.time() - start_time
-                            if elapsed_time > 300:  # 300 seconds = 5 minutes
-                                log.info("5 minutes elapsed. Exiting the process.")
-                                return False  # Return here to stop the entire process after 5 minutes
-
-                # Handle next, continue, and review buttons if present.
-                elif self.is_present(self.locator["next"]):
-                    elements = self.get_children(self.locator["next"])
-
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        self.clickjs(button)
-
-                elif self.is_present(self.locator["upload_cover"]):
-                    elements = self.get_children(self.locator["upload_cover"])
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        button.send_keys(self.uploads["cover_letter"])
-
-                elif self.is_present(self.locator["continue_applying"]):
-                    elements = self.get_children(self.locator["continue_applying"])
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        self.clickjs(button)
-
-                elif self.is_present(self.locator["review"]):
-                    elements = self.get_children(self.locator["review"])
-                    for element in elements:
-                        button = self.wait.until(EC.element_to_be_clickable(element))
-                        self.clickjs(button)
-
-                # Check if the total process time has exceeded 5 minutes
-                elapsed_time = time.time() - start_time
-                if elapsed_time > 300:  # 300 seconds = 5 minutes
-                    log.info("5 minutes elapsed. Exiting the process.")
-                    return False  # Stop the entire process if 5 minutes are exceeded
+                # Wait for the modal to react instead of sleeping a fixed time
+                modal = self.probe_modal(previous["signature"], self.MODAL_TRANSITION_TIMEOUT)
+                attempts = attempts + 1 if modal["step"] == previous["step"] else 0
 
         except Exception as e:
             log.error(e)
             log.error("Cannot apply to this job")
 
-        return submitted
+        return False
+
+    # Order in which a form field's widget is classified; the first widget found in the field wins
+    FORM_WIDGETS = ["radio_select", "multi_select", "date_select", "text_select", "location_select",
+                    "text_area", "input_select", "date_input"]
+
+    def snapshot_form(self):
+        """
+        Classifies every question of the current Easy Apply step in a single `execute_script` call.
+
+        **Purpose**:
+        `process_questions` used to read `field.text` and then call `is_present` for up to eight
+        locators per field, plus more calls to read each option. This reads everything at once so the
+        answering logic runs locally and only touches the DOM to act.
+
+        **Returns**:
+        - `list[dict]`: One entry per `self.locator["fields"]` element, in page order, with the keys:
+            - `element` (WebElement): The field itself, used to act on it.
+            - `question` (str): The field's visible text.
+            - `type` (str or None): The first widget of `FORM_WIDGETS` found in the field, e.g. `"radio_select"`.
+            - `options` (list[dict]): `value` and `label` of each option of the first widget.
+            - `option_groups` (list[list[dict]]): The options of every widget (a date range has several dropdowns).
+            - `value` (str or None): The field's current value, if any.
+        """
+        widgets = []
+        for name in self.FORM_WIDGETS:
+            strategy, value = self.locator[name]
+            widgets.append([name, value if strategy == By.XPATH else ".//" + value])
+
+        script = """
+            const [fieldsXpath, widgets] = arguments;
+            const findAll = (expression, context) => {
+                const result = document.evaluate(expression, context, null,
+                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                const nodes = [];
+                for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+                return nodes;
+            };
+            const labelOf = input => (input.labels && input.labels.length)
+                ? input.labels[0].innerText.trim() : (input.getAttribute("aria-label") || "").trim();
+
+            return findAll(fieldsXpath, document).map(field => {
+                let type = null, elements = [];
+                for (const [name, expression] of widgets) {
+                    elements = findAll(expression, field);
+                    if (elements.length) { type = name; break; }
+                }
+
+                const groups = [];
+                let value = null;
+                if (type === "multi_select" || type === "date_select") {
+                    for (const select of elements) {
+                        groups.push(Array.from(select.options).map(o => ({value: o.value, label: o.text.trim()})));
+                    }
+                    value = elements[0].selectedOptions.length ? elements[0].selectedOptions[0].text.trim() : null;
+                } else if (type === "radio_select" || type === "input_select") {
+                    groups.push(elements.map(input => ({
+                        value: type === "input_select"
+                            ? (input.getAttribute("data-test-text-selectable-option__input") || input.value)
+                            : input.value,
+                        label: labelOf(input)
+                    })));
+                    const checked = elements.filter(input => input.checked).map(input => input.value);
+                    value = checked.length ? checked.join(",") : null;
+                } else if (type) {
+                    value = elements[0].value;
+                }
+
+                return {
+                    element: field,
+                    question: (field.innerText || "").trim(),
+                    type: type,
+                    options: groups.length ? groups[0] : [],
+                    option_groups: groups,
+                    value: value
+                };
+            });
+        """
+        try:
+            return self.browser.execute_script(script, self.locator["fields"][1], widgets) or []
+        except Exception as e:
+            log.error(f"Failed to read the form: {e}")
+            return []
+
+    # Lowest `score_options` score accepted as an answer; below it the widget's fallback option is picked
+    OPTION_MIN_SCORE = 0.6
+
+    def choose_option(self, field, kind, index, group=0):
+        """
+        Selects option `index` of a field's widget in one script call, without looking the elements up again.
+
+        - Radio buttons and fieldset checkboxes (`radio_select`, `input_select`): clicks input number `index`.
+        - Dropdowns (`multi_select`, `date_select`): sets dropdown number `group` to its option `index` with the
+          native value setter and fires `input` and `change`, so LinkedIn's form state sees the choice.
+
+        **Returns**:
+        - `str`: The label of the chosen option (empty if the widget or the option is gone).
+        """
+        strategy, value = self.locator[kind]
+        script = """
+            const [field, expression, index, group] = arguments;
+            const result = document.evaluate(expression, field, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+            if (nodes.length && nodes[0].tagName === "SELECT") {
+                const select = nodes[group];
+                if (!select || !select.options[index]) return "";
+                const setter = Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, "value").set;
+                setter.call(select, select.options[index].value);
+                select.dispatchEvent(new Event("input", {bubbles: true}));
+                select.dispatchEvent(new Event("change", {bubbles: true}));
+                return select.options[index].text.trim();
+            }
+            const input = nodes[index];
+            if (!input) return "";
+            input.scrollIntoView({block: "center"});
+            input.click();
+            return (input.labels && input.labels.length ? input.labels[0].innerText : input.value).trim();
+        """
+        return self.browser.execute_script(script, field, value if strategy == By.XPATH else ".//" + value, index, group) or ""
+
+    # Widgets `fill_text_fields` fills in one call; autocomplete (`location_select`) and date fields are always typed
+    FAST_FILL_WIDGETS = ["text_select", "text_area"]
+
+    @timed_span("fill_text_fields")
+    def fill_text_fields(self, entries):
+        """
+        Fills the plain text inputs and text areas of a form step in a single asynchronous script call.
+
+        **Purpose**:
+        `clear()` plus `send_keys()` sends every keystroke as its own synthetic event over the wire, after per-field
+        sleeps of up to 6 seconds. This sets all values at once.
+
+        **How It Works**:
+        - Every value is set with the native `value` setter of `HTMLInputElement` / `HTMLTextAreaElement` (so the
+          value tracker of LinkedIn's React form notices the change), followed by `input`, `change` and `blur` events.
+        - After a short pause for the form to validate, every field is checked: the value must have stuck, the
+          input must pass `checkValidity()` and the field must show no error message.
+
+        **Parameters**:
+        - `entries` (list[dict]): `snapshot_form` entries of `FAST_FILL_WIDGETS` fields, each with its `answer`.
+
+        **Returns**:
+        - `list[bool]`: Per entry, whether it was filled and passed validation. Entries that didn't go through the
+          per-keystroke path in `process_questions`.
+        """
+        if not entries:
+            return []
+        fields = [[entry["element"], self.locator[entry["type"]][1] if self.locator[entry["type"]][0] == By.XPATH
+                   else ".//" + self.locator[entry["type"]][1], entry["answer"]] for entry in entries]
+        script = """
+            const [fields, settleMs] = arguments;
+            const done = arguments[arguments.length - 1];
+            const inputs = fields.map(([field, expression, answer]) => {
+                const input = document.evaluate(expression, field, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                if (!input) return null;
+                const prototype = input.tagName === "TEXTAREA" ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+                Object.getOwnPropertyDescriptor(prototype, "value").set.call(input, answer);
+                for (const type of ["input", "change"]) input.dispatchEvent(new Event(type, {bubbles: true}));
+                input.dispatchEvent(new FocusEvent("blur"));
+                input.dispatchEvent(new FocusEvent("focusout", {bubbles: true}));
+                return input;
+            });
+            setTimeout(() => done(inputs.map((input, i) => {
+                if (!input) return false;
+                const error = fields[i][0].querySelector(".artdeco-inline-feedback--error, [role='alert']");
+                return input.value === fields[i][2] && input.checkValidity() && !(error && error.innerText.trim());
+            })), settleMs);
+        """
+        try:
+            self.browser.set_script_timeout(10)
+            return self.browser.execute_async_script(script, fields, 300) or [False] * len(entries)
+        except Exception as e:
+            log.warning(f"Fast fill failed, typing the fields instead: {e}")
+            return [False] * len(entries)
 
+    @timed_span("process_questions")
     def process_questions(self):
         """
         Processes the questions in a job application form by automatically selecting or filling out appropriate answers 
@@ -1116,7 +3618,8 @@ class EasyApplyBot:
         - **Answer Selection**:
         - For **radio buttons**, the method attempts to select the correct option based on predefined answers.
         - For **multi-select** fields, it selects the closest match or a random option if an exact match isn't found.
-        - For **text input** fields, the method enters predefined text answers.
+        - For **text input** fields, the method enters predefined text answers. With `fast_fill`, plain text inputs and
+          text areas are filled together in one call (`fill_text_fields`); fields that fail validation are typed.
         - For **autocomplete fields**, the method types the answer and selects from suggested options.
         - For **date fields**, it selects the correct date from the input.
         - **Error Handling**: Catches errors for stale elements and logs issues when elements are not found or cannot be interacted with.
@@ -1135,8 +3638,9 @@ class EasyApplyBot:
         **Key Functional Steps**:
         2. **Form Iteration**: Iterates through each form field to determine its type and select the appropriate answer.
         3. **Answer Selection**:
-        - For **radio buttons**, the method attempts to select the exact match for the answer, or the closest match if an exact match is not found.
-        - For **multi-selects**, it selects answers that closely match the predefined answers.
+        - For **radio buttons**, **multi-selects** and **fieldsets**, the options from the form snapshot are ranked with
+          `score_options` (exact, normalized, numeric range, word overlap, fuzzy) and the best one is chosen by index
+          with `choose_option`, in one script call.
         - For **text fields**, it types predefined text into the form fields.
         4. **Retries and Error Handling**: If an element becomes stale, the method re-fetches the form and retries actions. The method also logs detailed errors for better debugging.
         5. **Random Selection as Fallback**: If no suitable match is found for certain questions, the method randomly selects an option.
@@ -1161,296 +3665,207 @@ class EasyApplyBot:
         - Allow for customization of answers for specific types of questions (e.g., filling in different answers for the same question on multiple forms).
         """
         
-        form = self.get_children(self.locator["fields"])  # Getting form elements
+        form = self.snapshot_form()  # Question text, widget type and options of every field in one call
 
         print("Length: ", len(form))
 
-        for i in range(len(form)):
-            time.sleep(random.uniform(3, 6))
-            try:
-                field = form[i]
-                question = field.text.strip()  # Strip whitespace from question
+        # With `fast_fill`, the plain text fields are filled together first; the ones that didn't take are typed below
+        if self.fast_fill:
+            batch = [entry for entry in form if entry["type"] in self.FAST_FILL_WIDGETS]
+            for entry in batch:
+                answer = self.ans_question(entry["question"].lower())
+                entry["answer"] = "" if answer is None else str(answer)
+            for entry, filled in zip(batch, self.fill_text_fields(batch)):
+                entry["filled"] = filled
+                log.debug(f"Question: '{entry['question']}'\nAnswer: {entry['answer']} ({'filled' if filled else 'typing it'})")
+            if batch:
+                self.pace.sleep(1, 3, "typing")  # One pause for the whole batch
+
+        for entry in form:
+            if entry.get("filled"):
+                continue
+            self.pace.sleep(3, 6, "question")
+            field = entry["element"]
+            question = entry["question"]
+            if "answer" in entry:
+                answer = entry["answer"]  # Already looked up for the fast fill
+            else:
                 answer = self.ans_question(question.lower())  # Get answer based on the current question
-                log.debug(f"Question: '{question}'\nAnswer: {answer}")
-
+                answer = "" if answer is None else str(answer)
+            log.debug(f"Question: '{question}'\nAnswer: {answer}")
 
+            try:
+                # Scroll the field into view before interacting
+                self.browser.execute_script("arguments[0].scrollIntoView(true);", field)
             except StaleElementReferenceException:
                 log.warning(f"Element became stale: {field}, re-fetching form elements.")
                 continue
 
-            # Scroll the field into view before interacting
-            self.browser.execute_script("arguments[0].scrollIntoView(true);", field)
-
-            # Check if input type is radio button
-            if self.is_present(self.locator["radio_select"], field):
-                try:
-                    log.debug("Locator: radio_select")
-                    radio_buttons = self.get_children(self.locator["radio_select"], field)
-
-                    if radio_buttons is None or len(radio_buttons) == 0:
-                        log.error(f"No radio buttons found for question: {question}")
-                        continue
-
-                    selected = False
-
-                    for radio_button in radio_buttons:
-                        if radio_button.get_attribute('value').lower() == answer.lower():
-                            self.clickjs(radio_button)
-                            log.info(f"Radio button selected: {radio_button.get_attribute('value')}")
-                            selected = True
-
-                    if selected == False:
-                        log.info("Exact match not found, looking for closest answer...")
-                        closest_match = None
-                        for radio_button in radio_buttons:
-                            radio_value = radio_button.get_attribute('value')
-                            if answer.lower() in radio_value.lower():
-                                try:
-                                    # closest_match = field.find_element(By.XPATH, f".//input[@value=\"{radio_value}\"]")
-                                    closest_match = self.get_child((By.XPATH, f".//input[@value=\"{radio_value}\"]"), field)
-                                except NoSuchElementException:
-                                    log.error(f"No element found for radio value: {radio_value}")
-
-                        if closest_match:
-                            self.clickjs(closest_match)
-                            log.info(f"Closest radio button selected: {closest_match.get_attribute('value')}")
-                            
-                        else:
-                            log.warning("No suitable radio button found to select. Picking random option")
-                            value = random.choice(radio_buttons).get_attribute('value')
-                            # ran_option = field.find_element(By.XPATH, f".//input[@value=\"{value}\"]")
-                            ran_option = self.get_child((By.XPATH, f".//input[@value=\"{value}\"]"), field)
-                            self.clickjs(ran_option)
-                            
-                except StaleElementReferenceException:
-                    log.warning(f"Retrying due to stale element in radio button. ")
+            kind = entry["type"]
 
-                except Exception as e:
-                    log.error(traceback.format_exc())  # Full traceback for better debugging
-                
-            # Multi-select case
-            elif self.is_present(self.locator["multi_select"], field):
-                max_retries = 5
-                retry_count = 0
-                while retry_count < max_retries:
+            # Every widget handler is timed as its own span, e.g. `widget:radio_select`
+            with self.metrics.span(f"widget:{kind}"):
+                # Check if input type is radio button
+                if kind == "radio_select":
                     try:
-                        log.debug("Locator: multi_select")
-                        # Refresh or re-fetch the select element each time
-                        select_element = WebDriverWait(field, 10).until(
-                            EC.presence_of_element_located(self.locator["multi_select"])
-                        )
+                        log.debug("Locator: radio_select")
+                        values = [option["value"] for option in entry["options"]]
 
-                        foundChoice = False
+                        if len(values) == 0:
+                            log.error(f"No radio buttons found for question: {question}")
+                            continue
 
-                        # Get all options again to avoid stale references
-                        options = self.get_children((By.TAG_NAME, "option"), select_element)
-                        for option in options:
-                            if answer.lower() in option.text.strip().lower():
-                                self.clickjs(option)
-                                foundChoice = True
-                                log.info(f"Option selected: {option.text}")
-                                break
+                        # Score the values and labels from the snapshot; the DOM is only touched to click
+                        index, score = best_option(answer, entry["options"], self.OPTION_MIN_SCORE)
 
-                        if not foundChoice:
-                            self.clickjs(options[1])  # Select the 1st option as a fallback
-                            log.info(f"1st Option selected: {options[1].text}")
+                        if index is None:
+                            log.warning(f"No radio button matches '{answer}' (best score {score:.2f}). Picking random option")
+                            index = random.randrange(len(values))
 
-                        break  # Successfully selected an option, exit loop early
+                        self.choose_option(field, kind, index)
+                        log.info(f"Radio button selected: {values[index]}")
 
                     except StaleElementReferenceException:
-                        retry_count += 1
-                        log.warning(f"Retrying due to stale element in multi-select. Attempt {retry_count}/{max_retries}")
-                        
-                        if retry_count >= max_retries:
-                            log.error("Exceeded max retries due to stale element issue")
-                            break  # Exit loop after max retries
+                        log.warning(f"Retrying due to stale element in radio button. ")
 
                     except Exception as e:
-                        log.error(f"Multi-select error: {e}")
-                        break  # Exit loop on any other exception
-                
-            # date_select case
-            elif self.is_present(self.locator["date_select"], field):
-                max_retries = 5
-                retry_count = 0
-                while retry_count < max_retries:
-                    try:
-                        log.debug("Locator: date_select")
-                        # Refresh or re-fetch the select element each time
-                        select_elements = WebDriverWait(field, 10).until(
-                            EC.presence_of_all_elements_located(self.locator["date_select"])
-                        )
-
-                        foundChoice = False
+                        log.error(traceback.format_exc())  # Full traceback for better debugging
 
-                        for select_element in select_elements:
-                            # Get all options again to avoid stale references
-                            options = self.get_children((By.TAG_NAME, "option"), select_element)
-                            for option in options:
-                                if answer.lower() in option.text.strip().lower():
-                                    self.clickjs(option)
-                                    foundChoice = True
-                                    log.info(f"Option selected: {option.text}")
-                                    break
-
-                            if not foundChoice:
-                                foundChoice = False
-                                self.clickjs(options[1])  # Select the 1st option as a fallback
-                                log.info(f"1st Option selected: {options[1].text}")
-
-                        break  # Successfully selected an option, exit loop early
-
-                    except StaleElementReferenceException:
-                        retry_count += 1
-                        log.warning(f"Retrying due to stale element in multi-select. Attempt {retry_count}/{max_retries}")
-                        
-                        if retry_count >= max_retries:
-                            log.error("Exceeded max retries due to stale element issue")
-                            break  # Exit loop after max retries
+                # Multi-select and date_select cases
+                elif kind in ("multi_select", "date_select"):
+                    max_retries = 5
+                    retry_count = 0
+                    while retry_count < max_retries:
+                        try:
+                            log.debug(f"Locator: {kind}")
+                            # A multi_select only has one dropdown; a date range has one per date part
+                            groups = entry["option_groups"][:1] if kind == "multi_select" else entry["option_groups"]
+
+                            for group, options in enumerate(groups):
+                                index, score = best_option(answer, options, self.OPTION_MIN_SCORE)
+                                if index is None:
+                                    # Select the 1st real option (after the "Select an option" placeholder) as a fallback
+                                    index = next((i for i, rank in enumerate(score_options(answer, options)) if rank >= 0), 0)
+                                    log.info(f"No option matches '{answer}' (best score {score:.2f}), selecting the first one")
+
+                                selected = self.choose_option(entry["element"], kind, index, group)
+                                log.info(f"Option selected: {selected or options[index]['label']}")
+
+                            break  # Successfully selected an option, exit loop early
+
+                        except StaleElementReferenceException:
+                            retry_count += 1
+                            log.warning(f"Retrying due to stale element in {kind}. Attempt {retry_count}/{max_retries}")
+                            # The form was re-rendered: read the field and its options again
+                            entry = next((fresh for fresh in self.snapshot_form()
+                                          if fresh["question"] == question and fresh["type"] == kind), None)
+                            if entry is None:
+                                log.error(f"{kind} field '{question}' is gone from the form")
+                                break
 
-                    except Exception as e:
-                        log.error(f"date_select error: {e}")
-                        break  # Exit loop on any other exception
-
-            # Handle text input fields
-            elif self.is_present(self.locator["text_select"], field):
-                try:    
-                    log.debug("Locator: text_select")
-                    text_field = WebDriverWait(field, 10).until(
-                            EC.presence_of_element_located(self.locator["text_select"])
-                        )
+                        except Exception as e:
+                            log.error(f"{kind} error: {e}")
+                            break
+
+                # Handle text input fields
+                elif kind == "text_select":
+                    try:    
+                        log.debug("Locator: text_select")
+                        text_field = WebDriverWait(field, 10).until(
+                                EC.presence_of_element_located(self.locator["text_select"])
+                            )
                     
-                    text_field.clear()
-                    time.sleep(random.uniform(0.5, 2.0))
-                    text_field.send_keys(answer)
-
-                except Exception as e:
-                    log.error(f"('text_select' error: {e}") 
+                        text_field.clear()
+                        self.pace.sleep(0.5, 2.0, "typing")
+                        text_field.send_keys(answer)
 
-            # Handle auto complete fields
-            elif self.is_present(self.locator["location_select"], field):
-                try:
-                    log.debug("Locator: location_select")
-                    text_field = WebDriverWait(field, 10).until(
-                            EC.presence_of_element_located(self.locator["location_select"])
-                        )
-                    text_field.clear()
-                    text_field.send_keys(answer)
-                    time.sleep(5)
-                    text_field.send_keys(Keys.ARROW_DOWN)
-                    text_field.send_keys(Keys.ENTER)
+                    except Exception as e:
+                        log.error(f"('text_select' error: {e}") 
 
-                except Exception as e:
-                    log.error(f"'location_select' error: {e}") 
+                # Handle auto complete fields
+                elif kind == "location_select":
+                    try:
+                        log.debug("Locator: location_select")
+                        text_field = WebDriverWait(field, 10).until(
+                                EC.presence_of_element_located(self.locator["location_select"])
+                            )
+                        text_field.clear()
+                        text_field.send_keys(answer)
+                        self.pace.sleep(5, label="autocomplete", essential=True)
+                        text_field.send_keys(Keys.ARROW_DOWN)
+                        text_field.send_keys(Keys.ENTER)
 
-            # Handle textarea fields
-            elif self.is_present(self.locator["text_area"], field):
-                try:
-                    log.debug("Locator: text_area")
-                    text_area = WebDriverWait(field, 10).until(
-                            EC.presence_of_element_located(self.locator["text_area"])
-                        )
-                    time.sleep(random.uniform(1, 3))
-                    text_area.clear()
-                    time.sleep(random.uniform(0.5, 2.0))
-                    text_area.send_keys(answer)
+                    except Exception as e:
+                        log.error(f"'location_select' error: {e}") 
 
-                except Exception as e:
-                    log.error(f"'text_area' error: {e}")
+                # Handle textarea fields
+                elif kind == "text_area":
+                    try:
+                        log.debug("Locator: text_area")
+                        text_area = WebDriverWait(field, 10).until(
+                                EC.presence_of_element_located(self.locator["text_area"])
+                            )
+                        self.pace.sleep(1, 3, "typing")
+                        text_area.clear()
+                        self.pace.sleep(0.5, 2.0, "typing")
+                        text_area.send_keys(answer)
 
-            # Handle fieldset fields
-            elif self.is_present(self.locator["input_select"], field):  # Adjust options as needed
-                try:
-                    log.debug("Locator: input_select")
-                    select_elements = self.get_children(self.locator["input_select"], field)
+                    except Exception as e:
+                        log.error(f"'text_area' error: {e}")
 
-                    if select_elements is None or len(select_elements) == 0:
-                        log.error(f"No select elements found for question: {question}")
-                        continue
+                # Handle fieldset fields
+                elif kind == "input_select":
+                    try:
+                        log.debug("Locator: input_select")
+                        # Values of the 'data-test-text-selectable-option__input' attribute, from the snapshot
+                        values = [option["value"] for option in entry["options"]]
 
-                    selected = False
+                        if len(values) == 0:
+                            log.error(f"No select elements found for question: {question}")
+                            continue
 
-                    for select_element in select_elements:
-                        # Check for attributes starting with 'data-test-text-selectable-option'
-                        try:
-                            attr_value = select_element.get_attribute('data-test-text-selectable-option__input')
-                            # select_element = field.find_element(By.XPATH, f".//input[@data-test-text-selectable-option__input=\"{attr_value}\"]")
-                            select_element = self.get_child((By.XPATH, f".//input[@data-test-text-selectable-option__input=\"{attr_value}\"]"), field)
+                        # Score the attribute values and labels against the answer
+                        index, score = best_option(answer, entry["options"], self.OPTION_MIN_SCORE)
 
-                            
-                            # Check if the attribute value matches the answer
-                            if answer.lower() == attr_value.lower():
-                                self.clickjs(select_element)
-                                log.info(f"Select element chosen: {attr_value}")
-                                selected = True
-                                break  # Exit loop once the option is selected
+                        if index is None:
+                            log.warning(f"No select option matches '{answer}' (best score {score:.2f}). Picking the random option")
+                            index = random.randrange(len(values))
 
-                        except Exception as e:
-                            log.error(f"Couldn't find exact match: {e}")
-                            log.error(traceback.format_exc())
-
-                    if selected == False:
-                        log.info("Looking for closest answer...")
-                        closest_match = None
-                        for select_element in select_elements:
-                            try: 
-                                # Get the value of the specific attribute
-                                attr_value = select_element.get_attribute('data-test-text-selectable-option__input')
-                                
-                                # Check if the attribute value is present and if the answer is in it
-                                if answer.lower() in attr_value.lower():  # Check if answer is in the attribute value
-                                    # closest_match = field.find_element(By.XPATH, f".//input[@data-test-text-selectable-option__input=\"{attr_value}\"]")
-                                    closest_match = self.get_child((By.XPATH, f".//input[@data-test-text-selectable-option__input=\"{attr_value}\"]"), field)
-
-                                    break  # Exit early loop on first closest match
-
-                            except Exception as e:
-                                log.error(e)
-                                log.error(traceback.format_exc())  # Full traceback for better debugging
-                                
-                        if closest_match:
-                            self.clickjs(closest_match)
-                            log.info(f"Closest select element chosen: {closest_match.get_attribute('value')}")
+                        self.choose_option(field, kind, index)
+                        log.info(f"Select element chosen: {values[index]}")
 
-                        else:
-                            log.warning("No suitable select option found. Picking the random option")
-                            # Pick random choice
-                            random_option = random.choice(select_elements)
-                            log.info(f"Random option selected: {random_option.get_attribute('value')}")
-                            self.clickjs(random_option)
-                                
-                except StaleElementReferenceException:
-                    log.warning(f"Retrying due to stale element in fieldset.")
+                    except StaleElementReferenceException:
+                        log.warning(f"Retrying due to stale element in fieldset.")
 
-                except Exception as e:
-                    log.error(traceback.format_exc())  # Full traceback for better debugging
+                    except Exception as e:
+                        log.error(traceback.format_exc())  # Full traceback for better debugging
 
-            # Handle date input fields
-            elif self.is_present(self.locator["date_input"], field):
-                try:
-                    log.debug("Locator: date_input")
+                # Handle date input fields
+                elif kind == "date_input":
+                    try:
+                        log.debug("Locator: date_input")
 
-                    # Locate the date field using the correct locator strategy
-                    date_field = WebDriverWait(field, 15).until(
-                        EC.presence_of_element_located(self.locator["date_input"])
-                    )
+                        # Locate the date field using the correct locator strategy
+                        date_field = WebDriverWait(field, 15).until(
+                            EC.presence_of_element_located(self.locator["date_input"])
+                        )
 
-                    # Send the answer (date) to the input
-                    date_field.clear()
-                    time.sleep(random.uniform(0.5, 2.0))
-                    self.clickjs(date_field)
-                    time.sleep(random.uniform(0.5, 2.0))
+                        # Send the answer (date) to the input
+                        date_field.clear()
+                        self.pace.sleep(0.5, 2.0, "typing")
+                        self.clickjs(date_field)
+                        self.pace.sleep(0.5, 2.0, "date picker")
 
-                    today_button = self.get_child((By.XPATH, ".//button[contains(@aria-label, 'This is today')]"), field)
+                        today_button = self.get_child((By.XPATH, ".//button[contains(@aria-label, 'This is today')]"), field)
                     
-                    self.clickjs(today_button)
+                        self.clickjs(today_button)
                     
-                except Exception as e:
-                    log.error(f"Error while filling the date input: {e}")
-                    log.error(traceback.format_exc())  # Full traceback for better debugging
+                    except Exception as e:
+                        log.error(f"Error while filling the date input: {e}")
+                        log.error(traceback.format_exc())  # Full traceback for better debugging
 
-            else:
-                log.info(f"Unable to determine field type for question: {question}, moving to next field.")
+                else:
+                    log.info(f"Unable to determine field type for question: {question}, moving to next field.")
 
     def is_present(self, locator, field=None):
         """
@@ -1639,7 +4054,7 @@ class EasyApplyBot:
                 # Wait until the parent <select> is clickable and click it
                 WebDriverWait(self.browser, 15).until(EC.element_to_be_clickable(parent_select))
                 parent_select.click()
-                time.sleep(1)
+                self.pace.sleep(1, label="dropdown")
                 # Now click the <option> element
                 element.click()
 
@@ -1683,6 +4098,27 @@ class EasyApplyBot:
             raise
 
 
+    def search_url(self, position, location, jobs_per_page, experience_level=[], time_filter=""):
+        """URL of the results page of a search that starts at result `jobs_per_page` (see `next_jobs_page` for the arguments)."""
+        # Construct the experience level part of the URL
+        experience_level_str = ",".join(map(str, experience_level)) if experience_level else ""
+        experience_level_param = f"&f_E={experience_level_str}" if experience_level_str else ""
+
+        # Construct the time filter part of the URL
+        if time_filter == 1:
+            time_posted_param = "&f_TPR=r86400"  # Last 24 hours
+        elif time_filter == 2:
+            time_posted_param = "&f_TPR=r604800"  # Last week
+        elif time_filter == 3:
+            time_posted_param = "&f_TPR=r2592000"  # Last month
+        else:
+            time_posted_param = ""  # No filter (Any time)
+
+        # URL for jobs page with Easy Apply, position, location, and time filter
+        return (self.base_url + "/jobs/search/?f_LF=f_AL&keywords=" +
+                position + location + "&start=" + str(jobs_per_page) + experience_level_param + time_posted_param)
+
+    @timed_span("next_jobs_page")
     def next_jobs_page(self, position, location, jobs_per_page, experience_level=[], time_filter=""):
         """
         Loads the next page of job listings on LinkedIn, applying filters such as position, location, 
@@ -1700,48 +4136,26 @@ class EasyApplyBot:
         Returns:
             tuple: 
                 - browser (WebDriver): The browser instance that loaded the next jobs page.
-                - jobs_per_page (int): The updated jobs_per_page index for tracking pagination.
+                - jobs_per_page (int): The starting index of the page after this one (`jobs_per_page + JOBS_PER_PAGE`).
         
         Workflow:
             - Constructs the URL based on the position, location, experience level, and time filter.
             - Filters jobs based on the posting time (last 24 hours, past week, past month, or any time).
             - Loads the job page into the browser and returns the updated browser instance.
         """
-        # Construct the experience level part of the URL
-        experience_level_str = ",".join(map(str, experience_level)) if experience_level else ""
-        experience_level_param = f"&f_E={experience_level_str}" if experience_level_str else ""
-
-        # Construct the time filter part of the URL
-        if time_filter == 1:
-            time_posted_param = "&f_TPR=r86400"  # Last 24 hours
-        elif time_filter == 2:
-            time_posted_param = "&f_TPR=r604800"  # Last week
-        elif time_filter == 3:
-            time_posted_param = "&f_TPR=r2592000"  # Last month
-        else:
-            time_posted_param = ""  # No filter (Any time)
-
-        self.browser.get(
-            # URL for jobs page with Easy Apply, position, location, and time filter
-            "https://www.linkedin.com/jobs/search/?f_LF=f_AL&keywords=" +
-            position + location + "&start=" + str(jobs_per_page) + experience_level_param + time_posted_param 
-        )
+        self.record_network("search")
+        self.browser.get(self.search_url(position, location, jobs_per_page, experience_level, time_filter))
 
         log.info(f"Loading next job page with time filter: {time_filter}")
         self.load_page()
-        return (self.browser, jobs_per_page)
-
-    def write_to_file(self, button, jobID, browserTitle, result) -> None:
-            def re_extract(text, pattern):
-                target = re.search(pattern, text)
-                if target:
-                    target = target.group(1)
-                return target
+        return (self.browser, jobs_per_page + self.JOBS_PER_PAGE)
 
+    def write_to_file(self, button, jobID, page, result) -> None:
             timestamp: str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             attempted: bool = False if not button else True
-            job = re_extract(browserTitle.split(' | ')[0], r"\(?\d?\)?\s?(\w.*)")
-            company = re_extract(browserTitle.split(' | ')[1], r"(\w.*)")
+            # Title and company come from the job's `JobPage`, read once for the whole application
+            job = page.title or None
+            company = page.company or None
 
             toWrite: list = [timestamp, jobID, job, company, attempted, result]
             print(f"Writing the following data: {toWrite}")  # Debugging line
@@ -1755,100 +4169,21 @@ class EasyApplyBot:
 
     def ans_question(self, question):
         question = question.lower().strip()
-        choices = ["6", "5", "4", "3"]
-        answer = None
-
-        for rule in self.rules["rules"]:
-            if self.evaluate_conditions(question, rule["conditions"]):
-                if rule["response"] == "random_choice":
-                    answer = random.choice(choices)
-                    break
-
-                elif rule["response"] == "dynamic_rate":
-                    answer = self.rate
-                    break
-
-                elif rule["response"] == "dynamic_salary":
-                    answer = self.salary
-                    break
-
-                elif rule["response"] == "dynamic_date":
-                    today = date.today()
-                    answer = today.strftime("%m/%d/%Y")
-                    break
-                
-                elif rule["response"] == "dynamic_city":
-                    answer = self.city
-                    break
 
-                elif rule["response"] == "dynamic_zipcode":
-                    answer = self.zipcode
-                    break
+        # Questions that were answered before are answered straight from memory
+        answer = self.answer_store.get(question)
+        if answer is not None:
+            return answer
 
-                elif rule["response"] == "dynamic_first_name":
-                    answer = self.first_name
-                    break
+        # The compiled rule engine returns the response of the first matching rule (or the default)
+        response = self.rule_engine.response(question)
+        handler = self.responses.get(response) if isinstance(response, str) else None
+        answer = handler() if handler else response
 
-                elif rule["response"] == "dynamic_last_name":
-                    answer = self.last_name
-                    break
-                
-                elif rule["response"] == "dynamic_full_name":
-                    answer = self.first_name + " " + self.last_name
-                    break
-
-                elif rule["response"] == "dynamic_full_name":
-                    answer = self.first_name + self.last_name
-                    break
-
-                elif rule["response"] == "dynamic_github":
-                    answer = self.github
-                    break
-
-                elif rule["response"] == "dynamic_linkedin":
-                    answer = self.linkedin
-                    break
-
-                elif rule["response"] == "dynamic_portfolio":
-                    answer = self.portfolio
-                    break
-
-                elif rule["response"] == "dynamic_disability":
-                    answer = self.disability
-                    break
-
-                elif rule["response"] == "dynamic_state":
-                    answer = self.state
-                    break
-
-                elif rule["response"] == "dynamic_gender":
-                    answer = self.gender
-                    break
-
-                elif rule["response"] == "dynamic_lgbtq":
-                    answer = self.lgbtq
-                    break
-
-                elif rule["response"] == "dynamic_veteran":
-                    answer = self.veteran
-                    break
-
-                elif rule["response"] == "dynamic_phone_number":
-                    answer = self.phone_number
-                    break
-
-                else:
-                    answer = rule["response"]
-                    break
-                   
-            else: 
-                answer = self.rules["default"]
-        
-        # Append question and answer to the CSV
-        if question not in self.answers:
-            self.answers[question] = answer
-            new_data = pd.DataFrame({"Question": [question], "Answer": [answer]})
-            new_data.to_csv(self.qa_file, mode='a', header=False, index=False, encoding='utf-8')
+        # Remember the question and answer; they are appended to the CSV in batches.
+        # Answers that change from day to day (e.g. today's date) are never stored.
+        if response not in self.VOLATILE_RESPONSES:
+            self.answer_store.add(question, answer)
 
         return answer
 
@@ -1883,17 +4218,120 @@ class EasyApplyBot:
         """
         desc = f"Posting({date}): {title} FROM {company}"
         try:
-            # Wrap description and link in lists to create one row
-            new_data = pd.DataFrame({
-                "company": [desc],
-                "link": [f"https://www.linkedin.com/jobs/view/{ID}/"]
-            })
-
-            # Append to the CSV
-            new_data.to_csv("applications.csv", mode='a', header=False, index=False)
+            # Append one row: description and link
+            with open("applications.csv", mode='a', newline='', encoding='utf-8') as file:
+                csv.writer(file).writerow([desc, f"{self.base_url}/jobs/view/{ID}/"])
         except Exception as e:
             log.error(e)
 
+
+def pool_worker(worker_id, bot_settings, class_settings, combos, claimed, claim_lock, profile_root, resume=False) -> None:
+    """
+    Runs one browser session of the worker pool: pulls (position, location, start, budget) searches from the shared
+    queue until it is empty. Every worker has its own Chrome profile directory and shares the job
+    claims with the other workers. When resuming, the workers first share out the pending jobs of the
+    interrupted run (the claims keep them from applying twice).
+    """
+    for name, value in class_settings.items():
+        setattr(EasyApplyBot, name, value)
+
+    profile_dir = os.path.abspath(os.path.join(profile_root, f"worker-{worker_id}"))
+    os.makedirs(profile_dir, exist_ok=True)
+
+    # Every worker exports its own metrics files, labelled with the worker ID
+    bot_settings = dict(bot_settings)
+    for key in ("metrics_file", "metrics_textfile"):
+        if bot_settings.get(key):
+            path = Path(bot_settings[key])
+            bot_settings[key] = str(path.with_name(f"{path.stem}-worker-{worker_id}{path.suffix}"))
+
+    bot = EasyApplyBot(**bot_settings, user_data_dir=profile_dir, claims=(claimed, claim_lock))
+    bot.metrics.labels["worker"] = str(worker_id)
+    try:
+        bot.fill_window()
+        leftover = 0.0  # Time a search didn't need goes to the next one
+        if resume and bot.job_queue:
+            bot.apply_loop(bot.job_queue.pending_jobs())
+        while True:
+            try:
+                position, location, start, budget = combos.get_nowait()
+            except queue.Empty:
+                break
+            log.info(f"[worker {worker_id}] Applying to {position}: {location}")
+            leftover = bot.applications_loop(position, "&location=" + location, budget + leftover, start=start)
+        bot.scroll_report()
+        bot.network_report()
+        bot.pace.report()
+        bot.metrics.report()
+        if bot.profiler:
+            bot.profiler.report()
+    finally:
+        # Write any answers that are still buffered, even if the worker crashed
+        bot.answer_store.close()
+        bot.export_metrics()
+        if bot.job_queue:
+            bot.job_queue.close()
+        bot.browser.quit()
+
+
+def run_worker_pool(bot_settings, positions, locations, workers, class_settings=None, profile_root="profiles", resume=False) -> None:
+    """
+    Applies to every (position, location) combo with several browser sessions in parallel.
+
+    **How It Works**:
+    - All combos go into a shared queue, planned by `schedule_searches()` (best yield first, with their share of the
+      search time). With a `job_queue` in `bot_settings` the plan is recorded there, and `resume` continues the
+      unfinished searches and pending jobs of the last run instead.
+    - `workers` processes each start their own `EasyApplyBot` (own Chrome, own profile directory under
+      `profile_root`) and pull combos from the queue until it is empty.
+    - Job IDs are claimed in a dict shared through a `multiprocessing.Manager`, so two workers never apply
+      to the same job. The on-disk job index is shared as well.
+
+    **Parameters**:
+    - `bot_settings` (dict): Keyword arguments for `EasyApplyBot`.
+    - `positions` (list) and `locations` (list): The searches to run.
+    - `workers` (int): Number of browser sessions. Never more than there are combos.
+    - `class_settings` (dict, optional): `EasyApplyBot` class attributes to set in every worker, e.g. `SCROLL_TIMEOUT`.
+    - `profile_root` (str, optional): Directory that holds the per-worker Chrome profiles.
+    - `resume` (bool, optional): Continues the last run (see `JobQueue`).
+    """
+    search_time = (class_settings or {}).get('MAX_SEARCH_TIME', EasyApplyBot.MAX_SEARCH_TIME)
+    plan = JobQueue(bot_settings['job_queue']) if bot_settings.get('job_queue') else None
+    try:
+        combos = schedule_searches(positions, locations, search_time, plan, resume)
+    finally:
+        if plan:
+            plan.close()
+    workers = max(1, min(workers, len(combos)))
+    log.info(f"Starting {workers} workers for {len(combos)} searches")
+
+    # Spawn (instead of fork) so every worker starts with a clean interpreter, Chrome and threads
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as manager:
+        combo_queue = manager.Queue()
+        for combo in combos:
+            combo_queue.put(combo)
+        claimed = manager.dict()
+        claim_lock = manager.Lock()
+
+        processes = [
+            context.Process(
+                target=pool_worker,
+                args=(worker_id, bot_settings, class_settings or {}, combo_queue, claimed, claim_lock, profile_root, resume),
+                name=f"worker-{worker_id}",
+            )
+            for worker_id in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            if process.exitcode:
+                log.error(f"{process.name} exited with code {process.exitcode}")
+
+        log.info(f"Worker pool finished: {len(claimed)} jobs handled by {workers} workers")
+
+
 if __name__ == '__main__':
     """
     Main entry point for running the application.
@@ -1916,6 +4354,12 @@ if __name__ == '__main__':
         - Exception: If `uploads` is incorrectly formatted as a list instead of a dictionary.
     """
 
+    # Command line: `--resume` continues the searches and jobs an interrupted run left unfinished
+    parser = argparse.ArgumentParser(description="Applies to LinkedIn Easy Apply jobs using config.yaml")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue where the last run stopped (uses the job_queue database)")
+    arguments = parser.parse_args()
+
     # Load configuration from 'config.yaml'
     with open("config.yaml", 'r') as stream:
         try:
@@ -1950,22 +4394,59 @@ if __name__ == '__main__':
     locations: list = [l for l in parameters['locations'] if l is not None]
     positions: list = [p for p in parameters['positions'] if p is not None]
 
+    # Optional tuning of the search results loader
+    class_settings = {
+        'SCROLL_QUIET_PERIOD': parameters.get('scroll_quiet_period', EasyApplyBot.SCROLL_QUIET_PERIOD),
+        'SCROLL_TIMEOUT': parameters.get('scroll_timeout', EasyApplyBot.SCROLL_TIMEOUT),
+        'STALE_PAGES_LIMIT': parameters.get('stale_pages_limit', EasyApplyBot.STALE_PAGES_LIMIT),
+    }
+    for name, value in class_settings.items():
+        setattr(EasyApplyBot, name, value)
+
     # Log all parameters
     log.info({k: parameters[k] for k in parameters.keys()})
 
-    # Initialize the EasyApplyBot with the extracted parameters
-    bot = EasyApplyBot(
-        parameters['salary'],
-        parameters['rate'],
-        parameters['person'],
-        parameters['profile_path'],
-        parameters['time_filter'],
+    bot_settings = dict(
+        salary=parameters['salary'],
+        rate=parameters['rate'],
+        person=parameters['person'],
+        profile_path=parameters['profile_path'],
+        time_filter=parameters['time_filter'],
         uploads=uploads,
         filename=output_filename,
         blacklist=blacklist,
         blackListTitles=blackListTitles,
-        experience_level=parameters.get('experience_level', [])
+        experience_level=parameters.get('experience_level', []),
+        job_index=parameters.get('job_index', 'visited_jobs.bin'),
+        bloom_filter=parameters.get('bloom_filter', False),
+        pacing=parameters.get('pacing', 'human'),
+        headless=parameters.get('headless', False),
+        block_resources=parameters.get('block_resources'),
+        session_file=parameters.get('session_file', 'session.json'),
+        base_url=parameters.get('base_url', 'https://www.linkedin.com'),
+        metrics_file=parameters.get('metrics_file', 'metrics.json'),
+        metrics_textfile=parameters.get('metrics_textfile'),
+        profile_webdriver=parameters.get('profile_webdriver', False),
+        pipeline=parameters.get('pipeline', False),
+        pane_navigation=parameters.get('pane_navigation', False),
+        fast_fill=parameters.get('fast_fill', False),
+        job_queue=parameters.get('job_queue', 'jobs.db')
     )
-    
-    # Start the job application process
-    bot.start_apply(positions, locations)
\ No newline at end of file
+
+    # Run several browsers in parallel if `workers` is set, up to the `max_workers` ceiling
+    workers = min(parameters.get('workers', 1) or 1, parameters.get('max_workers', 4) or 1)
+    if workers > 1:
+        run_worker_pool(bot_settings, positions, locations, workers, class_settings=class_settings, resume=arguments.resume)
+    else:
+        # Initialize the EasyApplyBot with the extracted parameters
+        bot = EasyApplyBot(**bot_settings)
+
+        # Start the job application process
+        try:
+            bot.start_apply(positions, locations, resume=arguments.resume)
+        finally:
+            # Write any answers that are still buffered, even if the run crashed
+            bot.answer_store.close()
+            bot.export_metrics()
+            if bot.job_queue:
+                bot.job_queue.close()